@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:38
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0007_alter_user_role_deliveryassignment_deliveryprofile'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserTasteVector',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='taste_vector', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('model', models.CharField(max_length=100)),
+                ('dimensions', models.PositiveIntegerField()),
+                ('weighted_sum', models.BinaryField()),
+                ('weight', models.FloatField(default=0)),
+                ('purchase_count', models.PositiveIntegerField(default=0)),
+                ('decayed_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('rebuilt_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:40
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0008_usertastevector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserRecommendationCache',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='recommendation_cache', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('items', models.JSONField(default=list)),
+                ('payload', models.JSONField(default=list)),
+                ('catalog_version', models.BigIntegerField(blank=True, null=True)),
+                ('computed_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
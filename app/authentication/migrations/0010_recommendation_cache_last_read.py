@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0009_userrecommendationcache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userrecommendationcache',
+            name='last_read_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -1,4 +1,6 @@
 from app.authentication.models.user_model import User, UserManager
 from app.authentication.models.customer_loyalty_model import CustomerLoyalty
 from app.authentication.models.delivery_profile_model import DeliveryProfile
-from app.authentication.models.delivery_assignment_model import DeliveryAssignment
\ No newline at end of file
+from app.authentication.models.delivery_assignment_model import DeliveryAssignment
+from app.authentication.models.user_taste_vector_model import UserTasteVector
+from app.authentication.models.user_recommendation_cache_model import UserRecommendationCache
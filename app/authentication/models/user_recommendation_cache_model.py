@@ -0,0 +1,70 @@
+from datetime import timedelta
+from django.db import models
+from django.conf import settings
+from django.utils import timezone
+from core.models import TimestampedModel
+
+class UserRecommendationCacheManager(models.Manager):
+    read_touch_interval = 300
+
+    def store(self, user_id, items, payload, catalog_version):
+        now = timezone.now()
+        entry, _ = self.update_or_create(
+            user_id=user_id,
+            defaults={
+                'items': items,
+                'payload': payload,
+                'catalog_version': catalog_version,
+                'computed_at': now,
+                'expires_at': now + timedelta(seconds=settings.RECOMMENDATION_CACHE_TTL),
+            }
+        )
+        return entry
+
+    def invalidate(self, user_id):
+        return self.filter(user_id=user_id).update(expires_at=timezone.now())
+
+    def touch(self, entry):
+        """
+        Records a read of the entry, at most once per read_touch_interval so warm reads do
+        not all turn into writes.
+        """
+        now = timezone.now()
+        if entry.last_read_at is None or entry.last_read_at <= now - timedelta(seconds=self.read_touch_interval):
+            self.filter(pk=entry.pk).update(last_read_at=now)
+            entry.last_read_at = now
+
+    def due_for_refresh(self, ahead=0, read_within=None):
+        """
+        Entries about to expire whose user read them within read_within seconds. Entries of
+        users who stopped coming back are left to expire and are recomputed on their next
+        read instead.
+        """
+        now = timezone.now()
+        read_within = settings.RECOMMENDATION_ACTIVE_WINDOW if read_within is None else read_within
+        return self.filter(
+            expires_at__lte=now + timedelta(seconds=ahead),
+            last_read_at__gte=now - timedelta(seconds=read_within)
+        )
+
+class UserRecommendationCache(TimestampedModel):
+    """
+    A user's materialized recommendations: the ranked [product_id, score] pairs and the
+    serialized products, valid until expires_at and for the catalog version they were
+    serialized against.
+    """
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='recommendation_cache', primary_key=True)
+    items = models.JSONField(default=list)
+    payload = models.JSONField(default=list)
+    catalog_version = models.BigIntegerField(null=True, blank=True)
+    computed_at = models.DateTimeField(default=timezone.now)
+    expires_at = models.DateTimeField(db_index=True)
+    last_read_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    objects = UserRecommendationCacheManager()
+
+    def is_fresh(self, catalog_version):
+        return self.expires_at > timezone.now() and self.catalog_version == catalog_version
+
+    def __str__(self):
+        return f"Recommendations of user {self.user_id} until {self.expires_at}"
@@ -0,0 +1,33 @@
+from array import array
+from django.db import models
+from django.conf import settings
+from django.utils import timezone
+from core.models import TimestampedModel
+
+class UserTasteVector(TimestampedModel):
+    """
+    Recency-weighted mean of the embeddings of the products a user bought, kept as an
+    exponentially decayed sum and weight so a new purchase only has to decay and add.
+    Both are as of decayed_at; the taste vector is weighted_sum / weight. Orders paid
+    before rebuilt_at are already part of the sum.
+    """
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='taste_vector', primary_key=True)
+    model = models.CharField(max_length=100)
+    dimensions = models.PositiveIntegerField()
+    weighted_sum = models.BinaryField()
+    weight = models.FloatField(default=0)
+    purchase_count = models.PositiveIntegerField(default=0)
+    decayed_at = models.DateTimeField(default=timezone.now)
+    rebuilt_at = models.DateTimeField(default=timezone.now)
+
+    def get_weighted_sum(self):
+        vector = array('f')
+        vector.frombytes(bytes(self.weighted_sum))
+        return vector.tolist()
+
+    def set_weighted_sum(self, vector):
+        self.weighted_sum = array('f', vector).tobytes()
+        self.dimensions = len(vector)
+
+    def __str__(self):
+        return f"Taste vector of user {self.user_id} ({self.purchase_count} purchases)"
@@ -0,0 +1,25 @@
+from django.db.models import Prefetch
+from app.authentication.models import CustomerLoyalty, User
+from app.authentication.serializers import CustomerLoyaltySerializer, UserSerializer
+from core.dynamic_fields import serializer_columns
+
+def user_read_queryset():
+    """
+    Users as UserSerializer renders them, with their loyalty row joined in and the
+    password hash and other unused columns left out.
+    """
+    return User.objects.select_related('loyalty').only(
+        *serializer_columns(UserSerializer(), User),
+        *serializer_columns(CustomerLoyaltySerializer(), CustomerLoyalty, 'loyalty__')
+    )
+
+def assignment_read_queryset(queryset):
+    """
+    Loads what DeliveryAssignmentSerializer reads in one query per relation.
+    """
+    from app.orders.read_paths import delivery_read_queryset
+
+    return queryset.prefetch_related(
+        Prefetch('delivery', queryset=delivery_read_queryset()),
+        Prefetch('delivery_person', queryset=user_read_queryset()),
+    )
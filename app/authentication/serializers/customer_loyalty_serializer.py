@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from app.authentication.models import CustomerLoyalty
+from core.dynamic_fields import DynamicFieldsMixin
 
-class CustomerLoyaltySerializer(serializers.ModelSerializer):
+class CustomerLoyaltySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     discount_percentage = serializers.SerializerMethodField()
     
     class Meta:
@@ -2,8 +2,9 @@ from rest_framework import serializers
 from app.authentication.models import DeliveryAssignment, User
 from app.orders.serializers import DeliverySerializer
 from app.authentication.serializers.user_serializer import UserSerializer
+from core.dynamic_fields import DynamicFieldsMixin
 
-class DeliveryAssignmentSerializer(serializers.ModelSerializer):
+class DeliveryAssignmentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     delivery_data = DeliverySerializer(source='delivery', read_only=True)
     delivery_person_data = UserSerializer(source='delivery_person', read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
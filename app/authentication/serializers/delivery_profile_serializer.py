@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from app.authentication.models import DeliveryProfile
 from app.authentication.serializers.user_serializer import UserSerializer
+from core.dynamic_fields import DynamicFieldsMixin
 
-class DeliveryProfileSerializer(serializers.ModelSerializer):
+class DeliveryProfileSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     user_data = UserSerializer(source='user', read_only=True)
     user_id = serializers.IntegerField(write_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
@@ -2,10 +2,11 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from app.authentication.serializers.customer_loyalty_serializer import CustomerLoyaltySerializer
+from core.dynamic_fields import DynamicFieldsMixin
 
 User = get_user_model()
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     loyalty = CustomerLoyaltySerializer(read_only=True)
     
     class Meta:
@@ -4,21 +4,23 @@ from rest_framework.decorators import action
 from django.db import transaction
 from core.models import LoggerService
 from core.pagination import CustomPagination
+from core.dynamic_fields import DynamicFieldsViewSetMixin
 from app.authentication.models import DeliveryAssignment, DeliveryProfile
 from app.authentication.serializers import DeliveryAssignmentSerializer
+from app.authentication.read_paths import assignment_read_queryset
 from app.authentication.permissions import DeliveryAssignmentPermission
 from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
 from datetime import datetime
 
 @extend_schema(tags=['DeliveryAssignment'])
-class DeliveryAssignmentViewSet(viewsets.ModelViewSet):
+class DeliveryAssignmentViewSet(DynamicFieldsViewSetMixin, viewsets.ModelViewSet):
     queryset = DeliveryAssignment.objects.all()
     serializer_class = DeliveryAssignmentSerializer
     permission_classes = [DeliveryAssignmentPermission]
     pagination_class = CustomPagination
     
     def get_queryset(self):
-        queryset = DeliveryAssignment.objects.all()
+        queryset = assignment_read_queryset(DeliveryAssignment.objects.all())
         
         if not self.request.user.is_staff:
             if self.request.user.role == 'delivery':
@@ -45,9 +47,9 @@ class DeliveryAssignmentViewSet(viewsets.ModelViewSet):
             return Response({"detail": "Solo los repartidores pueden acceder a este recurso"}, 
                            status=status.HTTP_403_FORBIDDEN)
         
-        queryset = DeliveryAssignment.objects.filter(
+        queryset = assignment_read_queryset(DeliveryAssignment.objects.filter(
             delivery_person=request.user
-        ).exclude(status='completed')
+        ).exclude(status='completed').order_by('-assignment_date'))
         
         page = self.paginate_queryset(queryset)
         if page is not None:
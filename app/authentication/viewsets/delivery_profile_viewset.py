@@ -3,6 +3,7 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from core.models import LoggerService
 from core.pagination import CustomPagination
+from core.dynamic_fields import DynamicFieldsViewSetMixin
 from app.authentication.models import DeliveryProfile, User
 from app.authentication.serializers import DeliveryProfileSerializer, UserSerializer
 from django.db import transaction
@@ -26,7 +27,7 @@ class IsAdminOrSelfDelivery(permissions.BasePermission):
         return False
 
 @extend_schema(tags=['DeliveryProfile'])
-class DeliveryProfileViewSet(viewsets.ModelViewSet):
+class DeliveryProfileViewSet(DynamicFieldsViewSetMixin, viewsets.ModelViewSet):
     queryset = DeliveryProfile.objects.all()
     serializer_class = DeliveryProfileSerializer
     permission_classes = [IsAdminOrSelfDelivery]
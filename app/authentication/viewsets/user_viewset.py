@@ -5,6 +5,7 @@ from django.db import transaction
 from django.contrib.auth import get_user_model
 from core.models import LoggerService
 from core.pagination import CustomPagination
+from core.dynamic_fields import DynamicFieldsViewSetMixin
 from app.authentication.serializers import UserSerializer, ChangePasswordSerializer
 from drf_spectacular.utils import extend_schema
 
@@ -16,7 +17,7 @@ class IsAdminOrOwner(permissions.BasePermission):
         return request.user.is_staff or obj.id == request.user.id
 
 @extend_schema(tags=['User'])
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(DynamicFieldsViewSetMixin, viewsets.ModelViewSet):
     queryset = User.objects.filter(active=True)
     serializer_class = UserSerializer
     pagination_class = CustomPagination
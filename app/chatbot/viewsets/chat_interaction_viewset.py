@@ -18,7 +18,7 @@ class ChatInteractionViewSet(viewsets.ViewSet):
     permission_classes = [permissions.IsAuthenticated]
     
     def _get_product_context(self):
-        products = Product.objects.filter(active=True)[:30]
+        products = Product.objects.filter(active=True).select_related('brand', 'category', 'rating_summary')[:30]
         brands = Brand.objects.filter(active=True)
         categories = ProductCategory.objects.filter(active=True)
         
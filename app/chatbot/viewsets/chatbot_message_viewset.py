@@ -13,6 +13,7 @@ class ChatbotMessageViewSet(viewsets.ModelViewSet):
     serializer_class = ChatbotMessageSerializer
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = CustomPagination
+    pagination_count = 'estimated'
 
     def get_queryset(self):
         """
@@ -0,0 +1,30 @@
+import signal
+import time
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from app.orders.models import StockReservation
+
+class Command(BaseCommand):
+    help = 'Expires stock reservations of unpaid orders once their hold runs out, until stopped'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Reservations expired per UPDATE')
+        parser.add_argument('--sleep', type=float, default=60.0, help='Seconds between sweeps')
+        parser.add_argument('--once', action='store_true', help='Run one sweep and exit')
+
+    def handle(self, *args, **options):
+        self.running = True
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        while self.running:
+            close_old_connections()
+            expired = StockReservation.objects.expire_stale(options['batch_size'])
+            if expired or options['once']:
+                self.stdout.write(f'Expired {expired} stock reservations')
+            if options['once']:
+                break
+            time.sleep(options['sleep'])
+
+    def stop(self, *args):
+        self.running = False
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:45
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0007_feedback_feedback_created_idx_and_more'),
+        ('products', '0011_reindexrun'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StockReservation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('quantity', models.PositiveIntegerField()),
+                ('status', models.CharField(choices=[('active', 'Active'), ('converted', 'Converted'), ('released', 'Released'), ('expired', 'Expired')], default='active', max_length=20)),
+                ('expires_at', models.DateTimeField()),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stock_reservations', to='orders.order')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stock_reservations', to='products.product')),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('status', 'active')), fields=['product', 'expires_at'], include=('quantity',), name='stock_reservation_active_idx'), models.Index(condition=models.Q(('status', 'active')), fields=['expires_at'], name='stock_reservation_expiry_idx')],
+                'constraints': [models.UniqueConstraint(fields=('order', 'product'), name='stock_reservation_order_product_uniq')],
+            },
+        ),
+    ]
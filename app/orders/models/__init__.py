@@ -3,4 +3,5 @@ from app.orders.models.order_item_model import OrderItem
 from app.orders.models.payment_model import Payment
 from app.orders.models.delivery_model import Delivery
 from app.orders.models.delivery_address_model import DeliveryAddress
-from app.orders.models.feedback_model import Feedback
\ No newline at end of file
+from app.orders.models.feedback_model import Feedback
+from app.orders.models.stock_reservation_model import StockReservation
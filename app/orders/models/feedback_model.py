@@ -20,5 +20,16 @@ class Feedback(TimestampedModel):
     product_comment = models.TextField(null=True, blank=True)
     user = models.ForeignKey('authentication.User', on_delete=models.SET_NULL, null=True, related_name='feedbacks')
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_product_id = instance.__dict__.get('product_id')
+        instance._loaded_product_rating = instance.__dict__.get('product_rating')
+        return instance
+    
     class Meta:
-        unique_together = ('order', 'product')
\ No newline at end of file
+        unique_together = ('order', 'product')
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='feedback_created_idx'),
+            models.Index(fields=['user', '-created_at', '-id'], name='feedback_user_created_idx'),
+        ]
\ No newline at end of file
@@ -8,4 +8,10 @@ class Order(TimestampedModel):
     currency = models.CharField(max_length=10)
     active = models.BooleanField(default=True)
     discount_applied = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
-    discount_percentage = models.IntegerField(default=0)
\ No newline at end of file
+    discount_percentage = models.IntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['active', '-created_at', '-id'], name='order_active_created_idx'),
+            models.Index(fields=['user', 'active', '-created_at', '-id'], name='order_user_created_idx'),
+        ]
\ No newline at end of file
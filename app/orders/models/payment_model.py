@@ -24,4 +24,14 @@ class Payment(TimestampedModel):
     payment_status = models.CharField(max_length=20, choices=PAYMENT_STATUS, default='pending')
     transaction_id = models.CharField(max_length=255, null=True, blank=True)
     payment_intent_id = models.CharField(max_length=255, null=True, blank=True)
-    payment_details = models.JSONField(null=True, blank=True)
\ No newline at end of file
+    payment_details = models.JSONField(null=True, blank=True)
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_payment_status = instance.__dict__.get('payment_status')
+        return instance
+    
+    @property
+    def became_completed(self):
+        return self.payment_status == 'completed' and getattr(self, '_loaded_payment_status', None) != 'completed'
\ No newline at end of file
@@ -0,0 +1,263 @@
+from datetime import timedelta
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Case, F, IntegerField, Q, Sum, Value, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from core.models import TimestampedModel
+from app.orders.models.order_model import Order
+from app.products.models import Inventory, Product
+from app.products.cache import invalidate_catalog_cache
+
+def quantity_case(quantities):
+    return Case(
+        *[When(product_id=product_id, then=Value(quantity)) for product_id, quantity in quantities.items()],
+        output_field=IntegerField()
+    )
+
+class StockReservationManager(models.Manager):
+    def lock_stock(self, product_ids):
+        """
+        {product_id: stock} of the products' inventory rows, locked with one SELECT ... FOR
+        UPDATE in primary key order so concurrent writers lock in the same order and cannot
+        deadlock. Every path that checks availability and then changes holds runs under it.
+        """
+        return dict(
+            Inventory.objects.select_for_update().filter(
+                product_id__in=list(product_ids)
+            ).order_by('pk').values_list('product_id', 'stock')
+        )
+
+    def held_quantities(self, product_ids, exclude_order_id=None):
+        """
+        {product_id: units held by unexpired reservations}, summed over the partial index
+        on active holds. exclude_order_id leaves one order's own holds out.
+        """
+        holds = self.filter(
+            product_id__in=list(product_ids),
+            status=StockReservation.STATUS_ACTIVE,
+            expires_at__gt=timezone.now()
+        )
+        if exclude_order_id is not None:
+            holds = holds.exclude(order_id=exclude_order_id)
+        return dict(holds.values('product_id').annotate(held=Sum('quantity')).values_list('product_id', 'held'))
+
+    def available_stock(self, stock, exclude_order_id=None):
+        """
+        Takes {product_id: stock} and returns {product_id: stock - active holds}.
+        """
+        held = self.held_quantities(stock, exclude_order_id)
+        return {product_id: units - held.get(product_id, 0) for product_id, units in stock.items()}
+
+    def pending_quantities(self, order_id, product_ids):
+        """
+        {product_id: units} the order holds on the products, active or expired: the units
+        its payment will convert. Orders created before reservations hold nothing for the
+        items they already took out of stock.
+        """
+        return dict(
+            self.filter(
+                order_id=order_id,
+                product_id__in=list(product_ids),
+                status__in=[StockReservation.STATUS_ACTIVE, StockReservation.STATUS_EXPIRED]
+            ).values_list('product_id', 'quantity')
+        )
+
+    def apply_levels(self, stock_deltas=None, reserved_deltas=None, now=None):
+        """
+        Applies {product_id: +/- units} to Inventory.stock and Inventory.reserved in one
+        update, both floored at zero. Call under lock_stock.
+
+        Cached catalog responses are only invalidated when a product moves in or out of
+        stock (the in_stock filter and facet); the available_stock they show otherwise
+        lags by at most the catalog cache timeout.
+        """
+        stock_deltas = {product_id: delta for product_id, delta in (stock_deltas or {}).items() if delta}
+        reserved_deltas = {product_id: delta for product_id, delta in (reserved_deltas or {}).items() if delta}
+        product_ids = set(stock_deltas) | set(reserved_deltas)
+        if not product_ids:
+            return
+
+        levels = Inventory.objects.filter(product_id__in=product_ids).values_list('product_id', 'stock', 'reserved')
+        flipped = False
+        for product_id, stock, reserved in levels:
+            new_stock = max(stock + stock_deltas.get(product_id, 0), 0)
+            new_reserved = max(reserved + reserved_deltas.get(product_id, 0), 0)
+            flipped = flipped or (stock > reserved) != (new_stock > new_reserved)
+
+        updates = {'updated_at': now or timezone.now()}
+        if stock_deltas:
+            updates['stock'] = Greatest(F('stock') + quantity_case(stock_deltas), Value(0))
+        if reserved_deltas:
+            updates['reserved'] = Greatest(F('reserved') + quantity_case(reserved_deltas), Value(0))
+        Inventory.objects.filter(product_id__in=product_ids).update(**updates)
+        if flipped:
+            invalidate_catalog_cache()
+
+    def adjust_reserved(self, deltas, now=None):
+        """
+        Applies {product_id: +/- units} to Inventory.reserved. Call under lock_stock.
+        """
+        self.apply_levels(reserved_deltas=deltas, now=now)
+
+    def active_quantities(self, holds):
+        quantities = {}
+        for hold in holds:
+            if hold.status == StockReservation.STATUS_ACTIVE:
+                quantities[hold.product_id] = quantities.get(hold.product_id, 0) + hold.quantity
+        return quantities
+
+    def place(self, order, quantities, ttl=None):
+        """
+        Inserts the new order's holds. Call under lock_stock.
+        """
+        expires_at = timezone.now() + timedelta(seconds=ttl or settings.STOCK_RESERVATION_TTL)
+        holds = self.bulk_create([
+            self.model(order=order, product_id=product_id, quantity=quantity, expires_at=expires_at)
+            for product_id, quantity in quantities.items()
+        ])
+        self.adjust_reserved(quantities)
+        return holds
+
+    def resize(self, order_id, quantities, ttl=None):
+        """
+        Sets the order's holds to {product_id: units} after its items changed, refreshing
+        their expiry; products at zero units are released. Call under lock_stock.
+        """
+        now = timezone.now()
+        expires_at = now + timedelta(seconds=ttl or settings.STOCK_RESERVATION_TTL)
+        current = self.active_quantities(
+            self.select_for_update().filter(order_id=order_id, product_id__in=list(quantities))
+        )
+        for product_id, quantity in quantities.items():
+            if quantity > 0:
+                self.update_or_create(
+                    order_id=order_id,
+                    product_id=product_id,
+                    defaults={'quantity': quantity, 'status': StockReservation.STATUS_ACTIVE, 'expires_at': expires_at}
+                )
+            else:
+                self.filter(order_id=order_id, product_id=product_id, status=StockReservation.STATUS_ACTIVE).update(
+                    status=StockReservation.STATUS_RELEASED,
+                    updated_at=now
+                )
+        self.adjust_reserved(
+            {product_id: quantity - current.get(product_id, 0) for product_id, quantity in quantities.items()},
+            now
+        )
+
+    def lock_holds(self, holds, product_ids=()):
+        """
+        Locks the inventory rows of `holds` (and of product_ids) and then the hold rows
+        themselves, the order every writer uses, and returns the holds still matching.
+        """
+        self.lock_stock(set(holds.values_list('product_id', flat=True)) | set(product_ids))
+        return list(holds.select_for_update().order_by('product_id'))
+
+    @transaction.atomic
+    def convert(self, order_id):
+        """
+        Turns the order's holds into a permanent stock decrement once it is paid. Holds
+        that expired before the payment arrived are converted too, with stock floored at
+        zero. Only the units the holds cover are taken, so items of orders created before
+        reservations, whose stock was taken at creation, are not taken again.
+        Returns the number of holds converted.
+        """
+        holds = self.lock_holds(self.filter(
+            order_id=order_id,
+            status__in=[StockReservation.STATUS_ACTIVE, StockReservation.STATUS_EXPIRED]
+        ))
+        if not holds:
+            return 0
+
+        now = timezone.now()
+        taken = {}
+        for hold in holds:
+            taken[hold.product_id] = taken.get(hold.product_id, 0) + hold.quantity
+        self.filter(pk__in=[hold.pk for hold in holds]).update(status=StockReservation.STATUS_CONVERTED, updated_at=now)
+        self.apply_levels(
+            stock_deltas={product_id: -units for product_id, units in taken.items()},
+            reserved_deltas={product_id: -units for product_id, units in self.active_quantities(holds).items()},
+            now=now
+        )
+        return len(holds)
+
+    @transaction.atomic
+    def release(self, order_id):
+        holds = self.lock_holds(self.filter(order_id=order_id, status=StockReservation.STATUS_ACTIVE))
+        if not holds:
+            return 0
+
+        now = timezone.now()
+        released = self.filter(pk__in=[hold.pk for hold in holds]).update(
+            status=StockReservation.STATUS_RELEASED,
+            updated_at=now
+        )
+        self.adjust_reserved({product_id: -units for product_id, units in self.active_quantities(holds).items()}, now)
+        return released
+
+    def expire_stale(self, batch_size=1000):
+        """
+        Marks holds past their expiry as expired and takes them out of Inventory.reserved,
+        batch_size rows per transaction so a large backlog does not hold one long lock.
+        Returns the number of holds expired.
+        """
+        expired = 0
+        while True:
+            now = timezone.now()
+            ids = list(
+                self.filter(status=StockReservation.STATUS_ACTIVE, expires_at__lte=now).values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                return expired
+
+            with transaction.atomic():
+                holds = self.lock_holds(self.filter(pk__in=ids, status=StockReservation.STATUS_ACTIVE, expires_at__lte=now))
+                expired += self.filter(pk__in=[hold.pk for hold in holds]).update(
+                    status=StockReservation.STATUS_EXPIRED,
+                    updated_at=now
+                )
+                self.adjust_reserved({product_id: -units for product_id, units in self.active_quantities(holds).items()}, now)
+
+class StockReservation(TimestampedModel):
+    """
+    Units of a product held for an unpaid order until expires_at. Available stock is
+    Inventory.stock minus the active holds, mirrored in Inventory.reserved; the hold
+    becomes a stock decrement when the order's payment completes.
+    """
+    STATUS_ACTIVE = 'active'
+    STATUS_CONVERTED = 'converted'
+    STATUS_RELEASED = 'released'
+    STATUS_EXPIRED = 'expired'
+
+    STATUS_CHOICES = [
+        (STATUS_ACTIVE, 'Active'),
+        (STATUS_CONVERTED, 'Converted'),
+        (STATUS_RELEASED, 'Released'),
+        (STATUS_EXPIRED, 'Expired'),
+    ]
+
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name='stock_reservations')
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='stock_reservations')
+    quantity = models.PositiveIntegerField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_ACTIVE)
+    expires_at = models.DateTimeField()
+
+    objects = StockReservationManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['order', 'product'], name='stock_reservation_order_product_uniq'),
+        ]
+        indexes = [
+            models.Index(
+                fields=['product', 'expires_at'],
+                include=['quantity'],
+                condition=Q(status='active'),
+                name='stock_reservation_active_idx'
+            ),
+            models.Index(fields=['expires_at'], condition=Q(status='active'), name='stock_reservation_expiry_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.quantity} x {self.product_id} for order {self.order_id} - {self.status}"
@@ -0,0 +1,64 @@
+from django.db.models import Prefetch
+from app.orders.models import Delivery, OrderItem, Payment
+from app.orders.serializers import DeliverySerializer, OrderItemSerializer, PaymentSerializer
+from app.parameter.models import City, Country, State
+from app.parameter.serializers import CitySerializer, CountrySerializer, StateSerializer
+from app.products.read_paths import PRODUCT_READ_RELATIONS, product_read_columns
+from core.dynamic_fields import serializer_columns
+
+ASSIGNMENT_COLUMNS = ('id', 'delivery', 'delivery_person', 'status', 'assignment_date')
+DELIVERY_PERSON_COLUMNS = ('id', 'email', 'first_name', 'last_name', 'phone', 'role')
+DELIVERY_PROFILE_COLUMNS = ('id', 'user', 'vehicle_type', 'license_plate', 'status', 'identification_number')
+
+def delivery_columns():
+    return [
+        *serializer_columns(DeliverySerializer(), Delivery),
+        *serializer_columns(CitySerializer(), City, 'city__'),
+        *serializer_columns(StateSerializer(), State, 'state__'),
+        *serializer_columns(CountrySerializer(), Country, 'country__'),
+    ]
+
+def delivery_read_queryset(queryset=None):
+    """
+    Deliveries as DeliverySerializer renders them: the address parts joined in, trimmed
+    to the serialized columns.
+    """
+    queryset = Delivery.objects.all() if queryset is None else queryset
+    return queryset.select_related('city', 'state', 'country').only(*delivery_columns())
+
+def order_delivery_read_queryset():
+    """
+    Deliveries nested in OrderSerializer, which also shows the assignment, the delivery
+    person and their profile.
+    """
+    return Delivery.objects.select_related(
+        'city', 'state', 'country', 'assignment__delivery_person__delivery_profile'
+    ).only(
+        *delivery_columns(),
+        *[f'assignment__{column}' for column in ASSIGNMENT_COLUMNS],
+        *[f'assignment__delivery_person__{column}' for column in DELIVERY_PERSON_COLUMNS],
+        *[f'assignment__delivery_person__delivery_profile__{column}' for column in DELIVERY_PROFILE_COLUMNS],
+    )
+
+def order_item_read_queryset():
+    return OrderItem.objects.select_related(
+        *[f'product__{relation}' for relation in PRODUCT_READ_RELATIONS]
+    ).only(
+        *serializer_columns(OrderItemSerializer(), OrderItem, extra=('order',)),
+        *product_read_columns('product__')
+    )
+
+def order_read_queryset(queryset):
+    """
+    Loads everything OrderSerializer reads with one query per relation (user, items
+    with their products, payment, delivery), however many orders are on the page.
+    Each relation is a Prefetch, so ?fields= / ?expand= can drop it cleanly.
+    """
+    from app.authentication.read_paths import user_read_queryset
+
+    return queryset.prefetch_related(
+        Prefetch('user', queryset=user_read_queryset()),
+        Prefetch('items', queryset=order_item_read_queryset()),
+        Prefetch('payment', queryset=Payment.objects.only(*serializer_columns(PaymentSerializer(), Payment))),
+        Prefetch('delivery', queryset=order_delivery_read_queryset()),
+    )
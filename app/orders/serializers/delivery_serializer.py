@@ -2,14 +2,17 @@ from rest_framework import serializers
 from app.orders.models import Delivery, Order
 from app.parameter.serializers import CountrySerializer, StateSerializer, CitySerializer
 from django.utils import timezone
+from core.dynamic_fields import DynamicFieldsMixin
 
-class DeliverySerializer(serializers.ModelSerializer):
+class DeliverySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     status_display = serializers.CharField(source='get_delivery_status_display', read_only=True)
     order_id = serializers.PrimaryKeyRelatedField(source='order', queryset=Order.objects.all())
     country_data = CountrySerializer(source='country', read_only=True)
     state_data = StateSerializer(source='state', read_only=True)
     city_data = CitySerializer(source='city', read_only=True)
     full_address = serializers.ReadOnlyField()
+
+    related_hints = {'full_address': ['city', 'state', 'country']}
     
     class Meta:
         model = Delivery
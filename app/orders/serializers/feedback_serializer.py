@@ -2,8 +2,9 @@ from rest_framework import serializers
 from app.orders.models.feedback_model import Feedback
 from app.orders.models.order_model import Order
 from app.products.models.product_model import Product
+from core.dynamic_fields import DynamicFieldsMixin
 
-class FeedbackSerializer(serializers.ModelSerializer):
+class FeedbackSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Feedback
         fields = [
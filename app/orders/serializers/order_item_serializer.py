@@ -1,10 +1,9 @@
 from rest_framework import serializers
-from rest_framework.exceptions import ValidationError
 from app.orders.models import OrderItem
-from app.products.models import Inventory, Product
 from app.products.serializers import ProductSerializer
+from core.dynamic_fields import DynamicFieldsMixin
 
-class OrderItemSerializer(serializers.ModelSerializer):
+class OrderItemSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     product = ProductSerializer(read_only=True)
     
     class Meta:
@@ -27,21 +26,3 @@ class OrderItemCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = OrderItem
         fields = ['product_id', 'quantity']
-    
-    def validate(self, data):
-        product_id = data.get('product_id')
-        quantity = data.get('quantity')
-        
-        try:
-            product = Product.objects.get(id=product_id, active=True)
-            inventory = Inventory.objects.get(product=product)
-            
-            if inventory.stock < quantity:
-                raise ValidationError(f"Insufficient inventory for {product.name}. Available: {inventory.stock}")
-                
-            data['product'] = product
-            return data
-        except Product.DoesNotExist:
-            raise ValidationError(f"Product with ID {product_id} does not exist or is not active")
-        except Inventory.DoesNotExist:
-            raise ValidationError(f"No inventory record found for the product with ID {product_id}")
\ No newline at end of file
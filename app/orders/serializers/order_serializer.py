@@ -1,21 +1,25 @@
 from rest_framework import serializers
 from django.db import transaction
-from app.orders.models import Order, OrderItem
-from app.products.models import Product, Inventory
+from app.orders.models import Order, OrderItem, StockReservation
+from app.products.models import Product
 from app.orders.serializers.order_item_serializer import OrderItemSerializer, OrderItemCreateSerializer
 from app.orders.serializers.payment_serializer import PaymentSerializer
 from app.orders.serializers.delivery_serializer import DeliverySerializer
 from rest_framework.exceptions import ValidationError
 from services.discount_service import DiscountService
+from services.pricing_service import PricingService
 from app.authentication.serializers import UserSerializer
+from core.dynamic_fields import DynamicFieldsMixin
 
-class DeliveryAssignmentNestedSerializer(serializers.Serializer):
+class DeliveryAssignmentNestedSerializer(DynamicFieldsMixin, serializers.Serializer):
     id = serializers.IntegerField(read_only=True)
     status = serializers.CharField(read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     assignment_date = serializers.DateTimeField(read_only=True)
     delivery_person = serializers.SerializerMethodField()
 
+    related_hints = {'delivery_person': ['delivery_person__delivery_profile']}
+
     def get_delivery_person(self, obj):
         if not hasattr(obj, 'delivery_person') or obj.delivery_person is None:
             return None
@@ -54,7 +58,7 @@ class EnhancedDeliverySerializer(DeliverySerializer):
     class Meta(DeliverySerializer.Meta):
         fields = DeliverySerializer.Meta.fields + ['assignment']
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     items = OrderItemSerializer(many=True, read_only=True)
     payment = PaymentSerializer(read_only=True)
     delivery = EnhancedDeliverySerializer(read_only=True)
@@ -89,54 +93,52 @@ class OrderCreateSerializer(serializers.ModelSerializer):
     
     @transaction.atomic
     def create(self, validated_data):
+        """
+        Places the order with a fixed number of queries whatever the cart size. The
+        inventory rows are locked with one SELECT ... FOR UPDATE in primary key order (so
+        concurrent checkouts lock in the same order and cannot deadlock) only long enough
+        to check stock minus active holds and insert this order's holds; stock itself is
+        decremented when the payment completes.
+        """
         items_data = validated_data.pop('items', [])
-        user = validated_data.get('user', self.context['request'].user)
-    
-        if 'user' in validated_data:
-            validated_data.pop('user')
-        
-        validated_data['total_amount'] = 0
-        
-        order = Order.objects.create(user=user, **validated_data)
-        subtotal = 0
-        
-        processed_products = set()
-        
+        user = validated_data.pop('user', self.context['request'].user)
+
+        quantities = {}
         for item_data in items_data:
-            product_id = item_data.pop('product_id')
-            
-            if product_id in processed_products:
-                continue
-                
-            processed_products.add(product_id)
-            
-            product = Product.objects.get(id=product_id)
-            quantity = item_data['quantity']
-            
-            inventory = Inventory.objects.select_for_update().get(product=product)
-            if inventory.stock < quantity:
-                raise ValidationError(f"Insufficient inventory for {product.name}. Available: {inventory.stock}")
-                
-            unit_price = product.price_usd if order.currency == 'USD' else product.price_bs
-            
-            OrderItem.objects.create(
-                order=order,
-                product=product,
-                quantity=quantity,
-                unit_price=unit_price
-            )
-            
-            inventory.stock -= quantity
-            inventory.save()
-            
-            subtotal += unit_price * quantity
-        
-        discount_percentage = DiscountService.get_loyalty_discount(user)
-        discount_amount = (subtotal * discount_percentage) / 100
-        
-        order.discount_percentage = discount_percentage
-        order.discount_applied = discount_amount
-        order.total_amount = subtotal - discount_amount
+            quantities.setdefault(item_data['product_id'], item_data['quantity'])
+
+        products = Product.objects.filter(id__in=quantities, active=True).only(
+            'id', 'name', 'price_usd', 'price_bs'
+        ).in_bulk()
+        for product_id in quantities:
+            if product_id not in products:
+                raise ValidationError(f"Product with ID {product_id} does not exist or is not active")
+
+        stock = StockReservation.objects.lock_stock(quantities)
+        available = StockReservation.objects.available_stock(stock)
+        for product_id, quantity in quantities.items():
+            if product_id not in available:
+                raise ValidationError(f"No inventory record found for the product with ID {product_id}")
+            if available[product_id] < quantity:
+                raise ValidationError(f"Insufficient inventory for {products[product_id].name}. Available: {max(available[product_id], 0)}")
+
+        currency = validated_data['currency']
+        items = []
+        for product_id, quantity in quantities.items():
+            product = products[product_id]
+            unit_price = product.price_usd if currency == 'USD' else product.price_bs
+            items.append(OrderItem(product=product, quantity=quantity, unit_price=unit_price))
+
+        order = Order(
+            user=user,
+            discount_percentage=DiscountService.get_loyalty_discount(user),
+            **validated_data
+        )
+        PricingService().apply(order, items)
         order.save()
-        
-        return order
\ No newline at end of file
+        for item in items:
+            item.order = order
+        OrderItem.objects.bulk_create(items)
+        StockReservation.objects.place(order, quantities)
+
+        return order
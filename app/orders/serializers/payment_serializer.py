@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from app.orders.models import Payment, Order
+from core.dynamic_fields import DynamicFieldsMixin
 
-class PaymentSerializer(serializers.ModelSerializer):
+class PaymentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Payment
         fields = [
@@ -1,7 +1,9 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from app.orders.models import Payment
-from app.authentication.models import CustomerLoyalty
+from app.orders.models import Payment, Feedback, StockReservation
+from app.authentication.models import CustomerLoyalty, UserRecommendationCache
+from app.products.models import ProductRatingSummary
+from app.products.jobs import enqueue_cooccurrence_refresh, enqueue_taste_vector_update
 from django.utils import timezone
 
 @receiver(post_save, sender=Payment)
@@ -27,4 +29,33 @@ def update_customer_loyalty(sender, instance, **kwargs):
             action='UPDATE',
             table_name='CustomerLoyalty',
             description=f'Updated loyalty status after order completion. New tier: {loyalty.tier}'
-        )
\ No newline at end of file
+        )
+
+@receiver(post_save, sender=Payment)
+def apply_payment_completion(sender, instance, **kwargs):
+    if instance.became_completed:
+        StockReservation.objects.convert(instance.order_id)
+        enqueue_cooccurrence_refresh()
+        UserRecommendationCache.objects.invalidate(instance.order.user_id)
+        enqueue_taste_vector_update(instance.order_id)
+    instance._loaded_payment_status = instance.payment_status
+
+@receiver(post_save, sender=Feedback)
+def update_rating_summary_on_save(sender, instance, **kwargs):
+    old_product_id = getattr(instance, '_loaded_product_id', None)
+    old_rating = getattr(instance, '_loaded_product_rating', None)
+    
+    if old_product_id == instance.product_id:
+        ProductRatingSummary.objects.apply_rating_change(instance.product_id, old_rating, instance.product_rating)
+    else:
+        ProductRatingSummary.objects.apply_rating_change(old_product_id, old_rating, None)
+        ProductRatingSummary.objects.apply_rating_change(instance.product_id, None, instance.product_rating)
+    
+    instance._loaded_product_id = instance.product_id
+    instance._loaded_product_rating = instance.product_rating
+
+@receiver(post_delete, sender=Feedback)
+def update_rating_summary_on_delete(sender, instance, **kwargs):
+    product_id = getattr(instance, '_loaded_product_id', instance.product_id)
+    rating = getattr(instance, '_loaded_product_rating', instance.product_rating)
+    ProductRatingSummary.objects.apply_rating_change(product_id, rating, None)
\ No newline at end of file
@@ -1,3 +1,117 @@
+from datetime import timedelta
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from app.authentication.models import User
+from app.orders.models import Order, OrderItem, Payment, StockReservation
+from app.products.models import Brand, Inventory, Product
 
-# Create your tests here.
+class StockReservationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='buyer@example.com', password='secret')
+        brand = Brand.objects.create(name='Brand')
+        self.product = Product.objects.create(brand=brand, name='Product', price_usd=10)
+        Inventory.objects.create(product=self.product, stock=10)
+
+    def levels(self):
+        inventory = Inventory.objects.get(product=self.product)
+        return inventory.stock, inventory.reserved
+
+    def order(self, quantity):
+        order = Order.objects.create(user=self.user, total_amount=0, currency='USD')
+        OrderItem.objects.create(order=order, product=self.product, quantity=quantity, unit_price=10)
+        return order
+
+    def pay(self, order):
+        payment = Payment.objects.create(order=order, amount=1, payment_method='cash')
+        payment.payment_status = 'completed'
+        payment.save()
+
+    def test_place_reserves_without_taking_stock(self):
+        order = self.order(3)
+        StockReservation.objects.place(order, {self.product.pk: 3})
+
+        self.assertEqual(self.levels(), (10, 3))
+        self.assertEqual(StockReservation.objects.available_stock({self.product.pk: 10}), {self.product.pk: 7})
+
+    def test_convert_takes_held_units_once(self):
+        order = self.order(3)
+        StockReservation.objects.place(order, {self.product.pk: 3})
+
+        self.assertEqual(StockReservation.objects.convert(order.pk), 1)
+        self.assertEqual(self.levels(), (7, 0))
+        self.assertEqual(StockReservation.objects.convert(order.pk), 0)
+        self.assertEqual(self.levels(), (7, 0))
+
+    def test_convert_expired_hold(self):
+        order = self.order(3)
+        StockReservation.objects.place(order, {self.product.pk: 3})
+        StockReservation.objects.filter(order=order).update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        self.assertEqual(StockReservation.objects.expire_stale(), 1)
+        self.assertEqual(self.levels(), (10, 0))
+        StockReservation.objects.convert(order.pk)
+        self.assertEqual(self.levels(), (7, 0))
+
+    def test_resize_grows_shrinks_and_releases(self):
+        order = self.order(3)
+        StockReservation.objects.place(order, {self.product.pk: 3})
+
+        StockReservation.objects.resize(order.pk, {self.product.pk: 5})
+        self.assertEqual(self.levels(), (10, 5))
+        StockReservation.objects.resize(order.pk, {self.product.pk: 2})
+        self.assertEqual(self.levels(), (10, 2))
+        StockReservation.objects.resize(order.pk, {self.product.pk: 0})
+        self.assertEqual(self.levels(), (10, 0))
+        self.assertEqual(StockReservation.objects.get(order=order).status, StockReservation.STATUS_RELEASED)
+        self.assertEqual(StockReservation.objects.convert(order.pk), 0)
+
+    def test_release_frees_reserved_units(self):
+        order = self.order(4)
+        StockReservation.objects.place(order, {self.product.pk: 4})
+
+        self.assertEqual(StockReservation.objects.release(order.pk), 1)
+        self.assertEqual(self.levels(), (10, 0))
+
+    def test_payment_of_legacy_order_takes_only_units_added_since(self):
+        # Created before reservations: its 3 units were taken from stock at creation.
+        order = self.order(3)
+        Inventory.objects.filter(product=self.product).update(stock=7)
+
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.post('/api/orders/order-items/', {
+            'order_id': order.pk, 'product_id': self.product.pk, 'quantity': 2
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(StockReservation.objects.get(order=order).quantity, 2)
+        self.assertEqual(self.levels(), (7, 2))
+
+        self.pay(order)
+        self.assertEqual(self.levels(), (5, 0))
+
+    def test_order_item_changes_resize_the_hold(self):
+        order = self.order(3)
+        StockReservation.objects.place(order, {self.product.pk: 3})
+        item = order.items.get()
+
+        client = APIClient()
+        client.force_authenticate(self.user)
+        self.assertEqual(client.patch(f'/api/orders/order-items/{item.pk}/', {'quantity': 5}, format='json').status_code, 200)
+        self.assertEqual(self.levels(), (10, 5))
+        self.assertEqual(client.patch(f'/api/orders/order-items/{item.pk}/', {'quantity': 50}, format='json').status_code, 400)
+        self.assertEqual(self.levels(), (10, 5))
+        self.assertEqual(client.delete(f'/api/orders/order-items/{item.pk}/').status_code, 204)
+        self.assertEqual(self.levels(), (10, 0))
+
+    def test_order_item_quantity_must_be_a_positive_integer(self):
+        order = self.order(1)
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        for quantity in ('abc', -2, 0, 2.5, None):
+            response = client.post('/api/orders/order-items/', {
+                'order_id': order.pk, 'product_id': self.product.pk, 'quantity': quantity
+            }, format='json')
+            self.assertEqual(response.status_code, 400, quantity)
+        self.assertEqual(self.levels(), (10, 0))
@@ -3,22 +3,24 @@ from rest_framework.response import Response
 from django.db import transaction
 from core.models import LoggerService
 from core.pagination import CustomPagination
+from core.dynamic_fields import DynamicFieldsViewSetMixin
 from app.orders.models import Delivery
 from app.orders.serializers import DeliverySerializer
+from app.orders.read_paths import delivery_read_queryset
 from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
 from django.utils import timezone
 from django.conf import settings
 
 @extend_schema(tags=['Delivery'])
-class DeliveryViewSet(viewsets.ModelViewSet):
+class DeliveryViewSet(DynamicFieldsViewSetMixin, viewsets.ModelViewSet):
     queryset = Delivery.objects.all()
     serializer_class = DeliverySerializer
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = CustomPagination
 
     def get_queryset(self):
-        queryset = Delivery.objects.all()
+        queryset = delivery_read_queryset()
         
         if not self.request.user.is_staff:
             queryset = queryset.filter(order__user=self.request.user)
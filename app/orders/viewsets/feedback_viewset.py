@@ -19,6 +19,7 @@ class FeedbackViewSet(viewsets.ModelViewSet):
     serializer_class = FeedbackSerializer
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = CustomPagination
+    sort_by_fields = ['created_at']
     
     def get_queryset(self):
         queryset = Feedback.objects.all()
@@ -1,16 +1,19 @@
 from rest_framework import viewsets, status, permissions
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
 from django.db import transaction
 from core.models import LoggerService
 from core.pagination import CustomPagination
-from app.orders.models import Order, OrderItem
+from core.dynamic_fields import DynamicFieldsViewSetMixin
+from app.orders.models import Order, OrderItem, StockReservation
 from app.orders.serializers import OrderItemSerializer, OrderItemCreateSerializer
-from app.products.models import Product, Inventory
+from app.products.models import Product
+from services.pricing_service import PricingService
 from drf_spectacular.utils import extend_schema
 
 @extend_schema(tags=['OrderItem'])
-class OrderItemViewSet(viewsets.ModelViewSet):
-    queryset = OrderItem.objects.all().order_by('-created_at')
+class OrderItemViewSet(DynamicFieldsViewSetMixin, viewsets.ModelViewSet):
+    queryset = OrderItem.objects.select_related('product__rating_summary').order_by('-created_at')
     serializer_class = OrderItemSerializer
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = CustomPagination
@@ -19,6 +22,27 @@ class OrderItemViewSet(viewsets.ModelViewSet):
         if self.action == 'create':
             return OrderItemCreateSerializer
         return OrderItemSerializer
+
+    def reserve(self, order_id, product, delta):
+        """
+        Grows or shrinks the order's hold on the product by `delta` units, under the
+        inventory row lock. The hold covers only units added since reservations began, so
+        an order created before them never has its existing items held or converted again.
+        Raises ValidationError when a growing hold would exceed the stock not held by other
+        orders.
+        """
+        stock = StockReservation.objects.lock_stock([product.pk])
+        if product.pk not in stock:
+            raise ValidationError(f"No inventory record found for the product with ID {product.pk}")
+
+        held = StockReservation.objects.pending_quantities(order_id, [product.pk]).get(product.pk, 0)
+        quantity = max(held + delta, 0)
+        if delta > 0:
+            available = StockReservation.objects.available_stock(stock, exclude_order_id=order_id)[product.pk]
+            if available < quantity:
+                raise ValidationError(f"Insufficient inventory for {product.name}. Available: {max(available, 0)}")
+
+        StockReservation.objects.resize(order_id, {product.pk: quantity})
     
     def create(self, request, *args, **kwargs):
         with transaction.atomic():
@@ -44,19 +68,23 @@ class OrderItemViewSet(viewsets.ModelViewSet):
                     )
                 
                 product_id = request.data.get('product_id')
-                quantity = request.data.get('quantity', 1)
+                try:
+                    quantity = OrderItemCreateSerializer().fields['quantity'].run_validation(request.data.get('quantity', 1))
+                except ValidationError as e:
+                    return Response(
+                        {"error": f"quantity: {e.detail[0]}"},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
                 
                 try:
                     product = Product.objects.get(id=product_id, active=True)
                     
                     unit_price = product.price_usd if order.currency == 'USD' else product.price_bs
                     
-                    inventory = Inventory.objects.get(product=product)
-                    if inventory.stock < quantity:
-                        return Response(
-                            {"error": f"Insufficient inventory for {product.name}. Available: {inventory.stock}"},
-                            status=status.HTTP_400_BAD_REQUEST
-                        )
+                    try:
+                        self.reserve(order.pk, product, quantity)
+                    except ValidationError as e:
+                        return Response({"error": e.detail[0]}, status=status.HTTP_400_BAD_REQUEST)
                     
                     order_item = OrderItem.objects.create(
                         order=order,
@@ -65,7 +93,7 @@ class OrderItemViewSet(viewsets.ModelViewSet):
                         unit_price=unit_price
                     )
                     
-                    order.total_amount += unit_price * quantity
+                    PricingService().apply(order)
                     order.save()
                     
                     LoggerService.objects.create(
@@ -115,14 +143,20 @@ class OrderItemViewSet(viewsets.ModelViewSet):
                     )
                 
                 original_quantity = instance.quantity
+                original_product = instance.product
+                StockReservation.objects.lock_stock([instance.product_id])
                 
                 response = super().partial_update(request, *args, **kwargs)
                 
                 updated_instance = self.get_object()
+                if updated_instance.order_id != order.pk or updated_instance.product_id != original_product.pk:
+                    self.reserve(order.pk, original_product, -original_quantity)
+                    self.reserve(updated_instance.order_id, updated_instance.product, updated_instance.quantity)
+                elif updated_instance.quantity != original_quantity:
+                    self.reserve(order.pk, updated_instance.product, updated_instance.quantity - original_quantity)
+                
                 if 'quantity' in request.data and updated_instance.quantity != original_quantity:
-                    quantity_difference = updated_instance.quantity - original_quantity
-                    amount_change = updated_instance.unit_price * quantity_difference
-                    order.total_amount += amount_change
+                    PricingService().apply(order)
                     order.save()
                 
                 LoggerService.objects.create(
@@ -153,24 +187,20 @@ class OrderItemViewSet(viewsets.ModelViewSet):
                         status=status.HTTP_400_BAD_REQUEST
                     )
                 
-                amount_to_subtract = instance.unit_price * instance.quantity
-                
+                StockReservation.objects.lock_stock([instance.product_id])
                 instance.delete()
+                self.reserve(order.pk, instance.product, -instance.quantity)
                 
-                remaining_items = OrderItem.objects.filter(order=order).count()
+                quote = PricingService().apply(order)
+                order.save()
                 
-                if remaining_items == 0:
-                    order.total_amount = 0
-                    order.save()
+                if not quote.subtotal:
                     LoggerService.objects.create(
                         user=request.user,
                         action='UPDATE',
                         table_name='Order',
                         description=f'Reset empty cart (order {order.id})'
                     )
-                else:
-                    order.total_amount -= amount_to_subtract
-                    order.save()
                 
                 LoggerService.objects.create(
                     user=request.user,
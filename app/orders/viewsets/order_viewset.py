@@ -2,21 +2,26 @@ from rest_framework import viewsets, status, permissions
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from django.db import transaction
+from django.db.models import Prefetch, prefetch_related_objects
 from core.models import LoggerService
+from core.idempotency import idempotent, IDEMPOTENCY_KEY_PARAMETER
 from core.pagination import CustomPagination
-from app.orders.models import Order, OrderItem
+from core.dynamic_fields import DynamicFieldsViewSetMixin
+from app.orders.models import Order, StockReservation
 from app.orders.serializers import OrderSerializer, OrderCreateSerializer
-from services.discount_service import DiscountService
+from app.orders.read_paths import order_read_queryset, order_item_read_queryset
+from services.pricing_service import PricingService
 from services.delivery_assignment_service import create_delivery_after_payment
-from base import settings
 from drf_spectacular.utils import extend_schema
 
 @extend_schema(tags=['Order'])
-class OrderViewSet(viewsets.ModelViewSet):
+class OrderViewSet(DynamicFieldsViewSetMixin, viewsets.ModelViewSet):
     queryset = Order.objects.filter(active=True).order_by('-created_at')
     serializer_class = OrderSerializer
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = CustomPagination
+    sort_by_fields = ['created_at']
+    pagination_count = 'estimated'
 
     def get_serializer_class(self):
         if self.action == 'create':
@@ -24,7 +29,10 @@ class OrderViewSet(viewsets.ModelViewSet):
         return OrderSerializer
     
     def get_queryset(self):
-        queryset = Order.objects.filter(active=True)
+        if self.action == 'get_costs':
+            queryset = Order.objects.filter(active=True)
+        else:
+            queryset = order_read_queryset(Order.objects.filter(active=True))
         
         if not self.request.user.is_staff:
             queryset = queryset.filter(user=self.request.user)
@@ -35,6 +43,8 @@ class OrderViewSet(viewsets.ModelViewSet):
             
         return queryset.order_by('-created_at')
     
+    @extend_schema(parameters=[IDEMPOTENCY_KEY_PARAMETER])
+    @idempotent('orders.create')
     def create(self, request, *args, **kwargs):
         serializer = OrderCreateSerializer(data=request.data, context={'request': request})
         serializer.is_valid(raise_exception=True)
@@ -42,6 +52,7 @@ class OrderViewSet(viewsets.ModelViewSet):
         with transaction.atomic():
             try:
                 order = serializer.save(user=request.user)
+                prefetch_related_objects([order], Prefetch('items', queryset=order_item_read_queryset()))
                 
                 LoggerService.objects.create(
                     user=request.user if request.user.is_authenticated else None,
@@ -94,6 +105,7 @@ class OrderViewSet(viewsets.ModelViewSet):
                     
                 instance.active = False
                 instance.save()
+                StockReservation.objects.release(instance.pk)
                 LoggerService.objects.create(
                     user=request.user if request.user.is_authenticated else None,
                     action='DELETE',
@@ -112,56 +124,29 @@ class OrderViewSet(viewsets.ModelViewSet):
     
     @action(detail=True, methods=['get'], url_path='costs')
     def get_costs(self, request, pk=None):
+        """
+        Read-only price quote of the order.
+        """
         try:
             order = self.get_object()
             
-            if order.user != request.user and not request.user.is_staff:
+            if order.user_id != request.user.id and not request.user.is_staff:
                 return Response(
                     {"error": "You don't have permission to view this order's costs"}, 
                     status=status.HTTP_403_FORBIDDEN
                 )
             
-            items = OrderItem.objects.filter(order=order)
-            
-            if not items.exists():
+            if not order.items.exists():
                 return Response(
                     {"error": "This order has no items"}, 
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            subtotal = sum(item.unit_price * item.quantity for item in items)
-            
-            tax_rate = getattr(settings, 'TAX_RATE', 0.16)
-            tax_amount = subtotal * tax_rate
-            
-            shipping_cost = getattr(settings, 'SHIPPING_COST', 10.0)
-            
-            discount_percentage = DiscountService.get_loyalty_discount(order.user)
-            discount_amount = (subtotal * discount_percentage) / 100
-            
-            total = subtotal + tax_amount + shipping_cost - discount_amount
-            
-            if order.total_amount != total or order.discount_percentage != discount_percentage or order.discount_applied != discount_amount:
-                order.total_amount = total
-                order.discount_percentage = discount_percentage
-                order.discount_applied = discount_amount
-                order.save()
-            
-            cost_breakdown = {
-                "subtotal": float(subtotal),
-                "tax_rate": float(tax_rate),
-                "tax_amount": float(tax_amount),
-                "shipping_cost": float(shipping_cost),
-                "discount_percentage": discount_percentage,
-                "discount_amount": float(discount_amount),
-                "total": float(total),
-                "currency": order.currency,
-            }
+            quote = PricingService().price_order(order)
             
-            return Response(cost_breakdown, status=status.HTTP_200_OK)
+            return Response(quote.as_response(), status=status.HTTP_200_OK)
         
         except Exception as e:
-            from core.models import LoggerService
             LoggerService.objects.create(
                 user=request.user if request.user.is_authenticated else None,
                 action='ERROR',
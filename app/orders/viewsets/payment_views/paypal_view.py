@@ -4,6 +4,8 @@ from rest_framework.response import Response
 from django.conf import settings
 from app.orders.models import Order, Payment
 from core.models import LoggerService
+from core.idempotency import idempotent, IDEMPOTENCY_KEY_PARAMETER
+from services.pricing_service import PricingService
 import requests
 from django.db import transaction
 from drf_spectacular.utils import extend_schema
@@ -12,11 +14,14 @@ from drf_spectacular.utils import extend_schema
 class PayPalCheckoutView(APIView):
     permission_classes = [permissions.IsAuthenticated]
     
+    @extend_schema(parameters=[IDEMPOTENCY_KEY_PARAMETER])
+    @idempotent('payments.paypal-checkout')
     def post(self, request):
         with transaction.atomic():
             try:
                 order_id = request.data.get('order_id')
                 order = Order.objects.get(id=order_id, user=request.user)
+                quote = PricingService().price_order(order)
                 
                 access_token = self.get_paypal_access_token()
                 if not access_token:
@@ -33,7 +38,7 @@ class PayPalCheckoutView(APIView):
                     "purchase_units": [{
                         "amount": {
                             "currency_code": order.currency.upper(),
-                            "value": str(order.total_amount)
+                            "value": str(quote.total)
                         },
                         "reference_id": str(order.id)
                     }],
@@ -54,11 +59,12 @@ class PayPalCheckoutView(APIView):
                     else:
                         payment = Payment.objects.create(
                             order=order,
-                            amount=order.total_amount,
+                            amount=quote.total,
                             payment_method='paypal',
                             payment_status='pending'
                         )
                     
+                    payment.amount = quote.total
                     payment.transaction_id = data['id']
                     payment.payment_status = 'processing'
                     payment_details = {
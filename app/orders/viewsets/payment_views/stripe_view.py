@@ -2,8 +2,10 @@ from rest_framework.views import APIView
 from rest_framework import permissions, status
 from rest_framework.response import Response
 from django.conf import settings
-from app.orders.models import Order, Payment, OrderItem
+from app.orders.models import Order, Payment
 from core.models import LoggerService
+from core.idempotency import idempotent, IDEMPOTENCY_KEY_PARAMETER
+from services.pricing_service import PricingService
 import stripe
 from django.db import transaction
 from drf_spectacular.utils import extend_schema
@@ -12,14 +14,15 @@ from drf_spectacular.utils import extend_schema
 class StripeCheckoutView(APIView):
     permission_classes = [permissions.IsAuthenticated]
     
+    @extend_schema(parameters=[IDEMPOTENCY_KEY_PARAMETER])
+    @idempotent('payments.stripe-checkout')
     def post(self, request):
         with transaction.atomic():
             try:
                 order_id = request.data.get('order_id')
                 order = Order.objects.get(id=order_id, user=request.user)
                 
-                order_items = OrderItem.objects.filter(order=order)
-                subtotal = sum(item.unit_price * item.quantity for item in order_items)
+                quote = PricingService().price_order(order)
                 
                 stripe.api_key = settings.STRIPE_API_KEY
                 
@@ -32,7 +35,7 @@ class StripeCheckoutView(APIView):
                                 'name': f'Order #{order.id}',
                                 'description': f'Purchase from Smart Cart',
                             },
-                            'unit_amount': int(subtotal * 100),
+                            'unit_amount': int(quote.total * 100),
                         },
                         'quantity': 1,
                     }],
@@ -49,11 +52,12 @@ class StripeCheckoutView(APIView):
                 else:
                     payment = Payment.objects.create(
                         order=order,
-                        amount=subtotal,
+                        amount=quote.total,
                         payment_method='stripe',
                         payment_status='pending'
                     )
                 
+                payment.amount = quote.total
                 payment.transaction_id = checkout_session.id
                 payment.payment_status = 'processing'
                 payment.save()
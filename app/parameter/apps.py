@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ParameterConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'app.parameter'
+
+    def ready(self):
+        import app.parameter.signals
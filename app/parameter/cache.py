@@ -0,0 +1,6 @@
+from core.cache import bump_version_on_commit
+
+PARAMETERS_CACHE_NAMESPACE = 'parameters'
+
+def invalidate_parameters_cache():
+    bump_version_on_commit(PARAMETERS_CACHE_NAMESPACE)
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_save, post_delete
+from app.parameter.models import Country, State, City
+from app.parameter.cache import invalidate_parameters_cache
+
+def invalidate_parameters_on_change(sender, **kwargs):
+    invalidate_parameters_cache()
+
+for model in (Country, State, City):
+    post_save.connect(invalidate_parameters_on_change, sender=model, dispatch_uid=f'parameters_save_{model.__name__}')
+    post_delete.connect(invalidate_parameters_on_change, sender=model, dispatch_uid=f'parameters_delete_{model.__name__}')
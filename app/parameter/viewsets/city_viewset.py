@@ -1,13 +1,16 @@
 from rest_framework import viewsets, filters
 from app.parameter.models.city_model import City
 from app.parameter.serializers.city_serializer import CitySerializer
+from core.conditional import ConditionalGetMixin
+from app.parameter.cache import PARAMETERS_CACHE_NAMESPACE
 from drf_spectacular.utils import extend_schema
 
 @extend_schema(tags=['City'])
-class CityViewSet(viewsets.ReadOnlyModelViewSet):
+class CityViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = CitySerializer
     filter_backends = [filters.SearchFilter]
     search_fields = ['name']
+    conditional_namespace = PARAMETERS_CACHE_NAMESPACE
     
     def get_queryset(self):
         queryset = City.objects.all().order_by('name')
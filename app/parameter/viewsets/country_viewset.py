@@ -4,14 +4,18 @@ from rest_framework.response import Response
 from app.parameter.models.country_model import Country
 from app.parameter.serializers.country_serializer import CountrySerializer, CountryWithStatesSerializer
 from app.parameter.serializers.state_serializer import StateSerializer
+from core.conditional import ConditionalGetMixin
+from app.parameter.cache import PARAMETERS_CACHE_NAMESPACE
 from drf_spectacular.utils import extend_schema
 
 @extend_schema(tags=['Country'])
-class CountryViewSet(viewsets.ReadOnlyModelViewSet):
+class CountryViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Country.objects.all().order_by('name')
     serializer_class = CountrySerializer
     filter_backends = [filters.SearchFilter]
     search_fields = ['name', 'code']
+    conditional_namespace = PARAMETERS_CACHE_NAMESPACE
+    conditional_actions = ('list', 'retrieve', 'states')
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -4,13 +4,17 @@ from rest_framework.response import Response
 from app.parameter.models.state_model import State
 from app.parameter.serializers.state_serializer import StateSerializer, StateWithCitiesSerializer
 from app.parameter.serializers.city_serializer import CitySerializer
+from core.conditional import ConditionalGetMixin
+from app.parameter.cache import PARAMETERS_CACHE_NAMESPACE
 from drf_spectacular.utils import extend_schema
 
 @extend_schema(tags=['State'])
-class StateViewSet(viewsets.ReadOnlyModelViewSet):
+class StateViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = StateSerializer
     filter_backends = [filters.SearchFilter]
     search_fields = ['name', 'code']
+    conditional_namespace = PARAMETERS_CACHE_NAMESPACE
+    conditional_actions = ('list', 'retrieve', 'cities')
     
     def get_queryset(self):
         queryset = State.objects.all().order_by('name')
@@ -0,0 +1,11 @@
+from core.cache import bump_version_on_commit
+
+CATALOG_CACHE_NAMESPACE = 'catalog'
+
+def invalidate_catalog_cache():
+    bump_version_on_commit(CATALOG_CACHE_NAMESPACE)
+
+COOCCURRENCE_CACHE_NAMESPACE = 'cooccurrence'
+
+def invalidate_cooccurrence_cache():
+    bump_version_on_commit(COOCCURRENCE_CACHE_NAMESPACE)
@@ -0,0 +1,206 @@
+import operator
+from decimal import Decimal, InvalidOperation
+from functools import reduce
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import Count, F, Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from app.products.models.product_model import SEARCH_CONFIGS
+
+class ProductSearchFilter(BaseFilterBackend):
+    """
+    Full-text search over the product search_vector column (name, brand, category,
+    description and technical specifications), matched with both Spanish and English
+    stemming and ordered by rank.
+    """
+    search_param = 'search'
+
+    def get_search_query(self, term):
+        query = None
+        for config in SEARCH_CONFIGS:
+            part = SearchQuery(term, config=config, search_type='websearch')
+            query = part if query is None else query | part
+        return query
+
+    def filter_queryset(self, request, queryset, view):
+        term = request.query_params.get(self.search_param, '').strip()
+        if not term:
+            return queryset
+
+        query = self.get_search_query(term)
+        return queryset.filter(search_vector=query).annotate(
+            search_rank=SearchRank(F('search_vector'), query)
+        ).order_by('-search_rank', '-created_at')
+
+    def get_schema_operation_parameters(self, view):
+        return [{
+            'name': self.search_param,
+            'required': False,
+            'in': 'query',
+            'description': 'Full-text search over name, description, technical specifications, brand and category',
+            'schema': {'type': 'string'},
+        }]
+
+PRICE_BUCKETS = ((None, 100), (100, 300), (300, 700), (700, 1500), (1500, None))
+
+HAS_3D = Q(model_3d_url__isnull=False) & ~Q(model_3d_url='')
+
+IN_STOCK = Q(inventory__stock__gt=F('inventory__reserved'))
+
+def combine(clauses):
+    return reduce(operator.and_, clauses, Q())
+
+class ProductFacetFilter(BaseFilterBackend):
+    """
+    Filters the catalog by brand, category, price range, AR and 3D availability and
+    available stock (stock not held by unpaid orders) and, when ?facets=true is sent,
+    computes the counts for every facet. Each facet is counted with every filter applied
+    except its own, so the storefront can show how many products a click on any other
+    value would return.
+    """
+    facets_param = 'facets'
+    true_values = ('1', 'true', 'yes')
+    false_values = ('0', 'false', 'no')
+
+    def parse_ids(self, request, param):
+        raw = request.query_params.get(param, '').strip()
+        if not raw:
+            return None
+        try:
+            return [int(value) for value in raw.split(',') if value.strip()]
+        except ValueError:
+            raise ValidationError({param: 'Expected a comma separated list of ids'})
+
+    def parse_decimal(self, request, param):
+        raw = request.query_params.get(param, '').strip()
+        if not raw:
+            return None
+        try:
+            return Decimal(raw)
+        except InvalidOperation:
+            raise ValidationError({param: 'Expected a number'})
+
+    def parse_bool(self, request, param):
+        raw = request.query_params.get(param, '').strip().lower()
+        if raw in self.true_values:
+            return True
+        if raw in self.false_values:
+            return False
+        return None
+
+    def wants_facets(self, request):
+        return self.parse_bool(request, self.facets_param) is True
+
+    def get_clauses(self, request):
+        clauses = {}
+
+        brands = self.parse_ids(request, 'brand')
+        if brands:
+            clauses['brand'] = Q(brand_id__in=brands)
+
+        categories = self.parse_ids(request, 'category')
+        if categories:
+            clauses['category'] = Q(category_id__in=categories)
+
+        price = Q()
+        price_min = self.parse_decimal(request, 'price_min')
+        if price_min is not None:
+            price &= Q(price_usd__gte=price_min)
+        price_max = self.parse_decimal(request, 'price_max')
+        if price_max is not None:
+            price &= Q(price_usd__lte=price_max)
+        if price:
+            clauses['price'] = price
+
+        supports_ar = self.parse_bool(request, 'supports_ar')
+        if supports_ar is not None:
+            clauses['supports_ar'] = Q(supports_ar=supports_ar)
+
+        has_3d = self.parse_bool(request, 'has_3d')
+        if has_3d is not None:
+            clauses['has_3d'] = HAS_3D if has_3d else ~HAS_3D
+
+        in_stock = self.parse_bool(request, 'in_stock')
+        if in_stock is not None:
+            clauses['in_stock'] = IN_STOCK if in_stock else ~IN_STOCK
+
+        return clauses
+
+    def filter_queryset(self, request, queryset, view):
+        clauses = self.get_clauses(request)
+        if not clauses:
+            return queryset
+        return queryset.filter(combine(clauses.values()))
+
+    def get_facets(self, request, queryset):
+        clauses = self.get_clauses(request)
+        queryset = queryset.order_by()
+
+        def without(*names):
+            return combine(clause for name, clause in clauses.items() if name not in names)
+
+        def count_where(*conditions):
+            condition = combine(conditions)
+            return Count('id', filter=condition) if condition else Count('id')
+
+        brands = queryset.filter(without('brand')).values(
+            'brand_id', 'brand__name'
+        ).annotate(count=Count('id')).order_by('-count', 'brand__name')
+
+        categories = queryset.filter(without('category'), category__isnull=False).values(
+            'category_id', 'category__name'
+        ).annotate(count=Count('id')).order_by('-count', 'category__name')
+
+        aggregates = {
+            'supports_ar': count_where(Q(supports_ar=True), without('supports_ar')),
+            'has_3d': count_where(HAS_3D, without('has_3d')),
+            'in_stock': count_where(IN_STOCK, without('in_stock')),
+        }
+        for index, (low, high) in enumerate(PRICE_BUCKETS):
+            bucket = Q()
+            if low is not None:
+                bucket &= Q(price_usd__gte=low)
+            if high is not None:
+                bucket &= Q(price_usd__lt=high)
+            aggregates[f'price_{index}'] = count_where(bucket, without('price'))
+
+        counts = queryset.filter(
+            without('price', 'supports_ar', 'has_3d', 'in_stock')
+        ).aggregate(**aggregates)
+
+        return {
+            'brands': [
+                {'id': row['brand_id'], 'name': row['brand__name'], 'count': row['count']}
+                for row in brands
+            ],
+            'categories': [
+                {'id': row['category_id'], 'name': row['category__name'], 'count': row['count']}
+                for row in categories
+            ],
+            'price_ranges': [
+                {'min': low, 'max': high, 'count': counts[f'price_{index}']}
+                for index, (low, high) in enumerate(PRICE_BUCKETS)
+            ],
+            'supports_ar': counts['supports_ar'],
+            'has_3d': counts['has_3d'],
+            'in_stock': counts['in_stock'],
+        }
+
+    def get_schema_operation_parameters(self, view):
+        parameters = [
+            ('brand', 'string', 'Comma separated brand ids'),
+            ('category', 'string', 'Comma separated category ids'),
+            ('price_min', 'number', 'Minimum price in USD'),
+            ('price_max', 'number', 'Maximum price in USD'),
+            ('supports_ar', 'boolean', 'Only products with (or without) AR support'),
+            ('has_3d', 'boolean', 'Only products with (or without) a 3D model'),
+            ('in_stock', 'boolean', 'Only products with (or without) available stock'),
+            (self.facets_param, 'boolean', 'Include brand, category, price range, AR, 3D and stock counts in the response'),
+        ]
+        return [{
+            'name': name,
+            'required': False,
+            'in': 'query',
+            'description': description,
+            'schema': {'type': schema_type},
+        } for name, schema_type, description in parameters]
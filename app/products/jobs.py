@@ -0,0 +1,71 @@
+from django.conf import settings
+from django.utils import timezone
+from core.models import BackgroundJob
+from app.products.cache import invalidate_catalog_cache
+from app.products.models import Product, ProductVectorSync, ReindexRun
+from services.pinecone_service import PineconeService
+
+SYNC_PRODUCT_VECTOR = 'app.products.jobs.sync_product_vector'
+REFRESH_COOCCURRENCE = 'app.products.jobs.refresh_cooccurrence'
+UPDATE_TASTE_VECTOR = 'app.products.jobs.update_taste_vector'
+REINDEX_PRODUCTS = 'app.products.jobs.reindex_products'
+
+def enqueue_product_vector_sync(product):
+    BackgroundJob.objects.enqueue_on_commit(
+        SYNC_PRODUCT_VECTOR,
+        key=str(product.pk),
+        payload={'product_id': product.pk}
+    )
+
+def sync_product_vector(product_id):
+    product = Product.objects.select_related('brand', 'category').filter(pk=product_id).first()
+    if product is None:
+        return
+
+    pinecone_service = PineconeService()
+    if product.active:
+        if pinecone_service.upsert_product(product):
+            ProductVectorSync.objects.mark_synced({product.pk: pinecone_service.get_product_fingerprint(product)})
+    else:
+        pinecone_service.delete_product(product.uuid)
+        ProductVectorSync.objects.forget([product.pk])
+    invalidate_catalog_cache()
+
+def enqueue_cooccurrence_refresh():
+    BackgroundJob.objects.enqueue_on_commit(REFRESH_COOCCURRENCE, delay=settings.COOCCURRENCE_REFRESH_DELAY)
+
+def refresh_cooccurrence():
+    from services.cooccurrence_service import CooccurrenceService
+    CooccurrenceService().refresh_incremental()
+
+def enqueue_taste_vector_update(order_id):
+    BackgroundJob.objects.enqueue_on_commit(UPDATE_TASTE_VECTOR, key=str(order_id), payload={'order_id': order_id})
+
+def update_taste_vector(order_id):
+    from services.recommendation_service import RecommendationService
+    from services.taste_vector_service import TasteVectorService
+
+    taste = TasteVectorService().apply_order(order_id)
+    if taste is not None:
+        RecommendationService().refresh_user_recommendations(taste.user_id)
+
+def enqueue_reindex(run):
+    BackgroundJob.objects.enqueue_on_commit(REINDEX_PRODUCTS, key=str(run.pk), payload={'run_id': run.pk})
+
+def reindex_products(run_id):
+    from services.reindex_service import ReindexService
+
+    run = ReindexRun.objects.filter(pk=run_id).first()
+    if run is None or run.status == ReindexRun.STATUS_DONE:
+        return
+
+    def heartbeat(run):
+        # A full reindex outlives the worker's stale timeout; keep the job's lock fresh
+        # so it is not handed to another worker while this one is still making progress.
+        BackgroundJob.objects.filter(
+            kind=REINDEX_PRODUCTS,
+            key=str(run.pk),
+            status=BackgroundJob.STATUS_RUNNING
+        ).update(locked_at=timezone.now())
+
+    ReindexService().run(run, on_checkpoint=heartbeat)
@@ -0,0 +1,53 @@
+import time
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from app.orders.models import Order
+from services.recommendation_service import RecommendationService
+
+class Command(BaseCommand):
+    help = 'Compares recommendation latency computed per request with reads from the per-user cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=20, help='Number of users with paid orders to sample')
+        parser.add_argument('--iterations', type=int, default=5, help='Requests timed per user and path')
+        parser.add_argument('--count', type=int, default=5, help='Recommendations requested')
+
+    def handle(self, *args, **options):
+        user_ids = list(Order.objects.filter(
+            active=True,
+            payment__payment_status='completed'
+        ).values_list('user_id', flat=True).distinct().order_by('user_id')[:options['users']])
+        if not user_ids:
+            self.stdout.write(self.style.WARNING('No users with paid orders'))
+            return
+
+        service = RecommendationService()
+        count = min(options['count'], settings.RECOMMENDATION_CACHE_SIZE)
+
+        def uncached(user_id):
+            ranked = service.hydrate_products(service.get_product_recommendations(user_id, max_results=count))
+            return service.serialize_ranked(ranked)
+
+        for user_id in user_ids:
+            service.refresh_user_recommendations(user_id)
+
+        self.report('uncached', self.measure(uncached, user_ids, options['iterations']))
+        self.report('cached', self.measure(
+            lambda user_id: service.get_cached_recommendations(user_id, count=count),
+            user_ids,
+            options['iterations']
+        ))
+
+    def measure(self, func, user_ids, iterations):
+        timings = []
+        for _ in range(iterations):
+            for user_id in user_ids:
+                started = time.perf_counter()
+                func(user_id)
+                timings.append((time.perf_counter() - started) * 1000)
+        return timings
+
+    def report(self, label, timings):
+        p50, p99 = np.percentile(timings, [50, 99])
+        self.stdout.write(f'{label:>9}: p50 {p50:.2f} ms, p99 {p99:.2f} ms over {len(timings)} requests')
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from services.cooccurrence_service import CooccurrenceService
+
+class Command(BaseCommand):
+    help = 'Builds the "frequently bought together" neighbours of every product from paid orders'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--incremental', action='store_true', help='Only recompute products bought since the last build')
+        parser.add_argument('--top-n', type=int, help='Neighbours kept per product')
+        parser.add_argument('--min-count', type=int, help='Minimum number of shared orders for a pair')
+        parser.add_argument('--metric', choices=CooccurrenceService.METRICS, help='Normalization of pair counts')
+
+    def handle(self, *args, **options):
+        service = CooccurrenceService(
+            top_n=options['top_n'],
+            min_count=options['min_count'],
+            metric=options['metric']
+        )
+
+        if options['incremental']:
+            self.stdout.write('Refreshing co-occurrence neighbours of recently bought products...')
+            written = service.refresh_incremental()
+        else:
+            self.stdout.write('Rebuilding co-occurrence neighbours...')
+            written = service.refresh()
+
+        self.stdout.write(self.style.SUCCESS(f'Stored {written} neighbour rows'))
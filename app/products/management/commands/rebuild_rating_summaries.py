@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from app.products.models import ProductRatingSummary
+
+class Command(BaseCommand):
+    help = 'Rebuilds the per-product rating summaries (count, sum and star histogram) from Feedback'
+
+    def handle(self, *args, **kwargs):
+        self.stdout.write('Rebuilding product rating summaries...')
+        total = ProductRatingSummary.objects.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt rating summaries for {total} products'))
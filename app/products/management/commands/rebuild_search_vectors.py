@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from app.products.models import Product
+
+class Command(BaseCommand):
+    help = 'Recomputes the full-text search vector of every product'
+
+    def handle(self, *args, **kwargs):
+        self.stdout.write('Rebuilding product search vectors...')
+        total = Product.objects.all().update_search_vector()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt search vectors for {total} products'))
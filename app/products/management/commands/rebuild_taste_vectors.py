@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from app.orders.models import Order
+from services.taste_vector_service import TasteVectorService
+
+class Command(BaseCommand):
+    help = 'Recomputes the taste vector of every user with paid orders from stored product vectors'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, action='append', help='Only rebuild these user ids')
+
+    def handle(self, *args, **options):
+        user_ids = options['user'] or Order.objects.filter(
+            active=True,
+            payment__payment_status='completed'
+        ).values_list('user_id', flat=True).distinct().order_by('user_id')
+
+        service = TasteVectorService()
+        built = 0
+        skipped = 0
+        for user_id in user_ids:
+            if service.rebuild(user_id) is None:
+                skipped += 1
+            else:
+                built += 1
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {built} taste vectors, {skipped} users without stored vectors'))
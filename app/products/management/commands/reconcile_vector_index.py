@@ -0,0 +1,78 @@
+from django.core.management.base import BaseCommand
+from app.products.models import Product, ProductVectorSync
+from services.pinecone_service import PineconeService
+
+class Command(BaseCommand):
+    help = 'Brings the product vector index in line with the database, re-embedding only products that changed'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Print the diff without writing to the index')
+        parser.add_argument('--batch-size', type=int, default=500, help='Products embedded and upserted per batch')
+        parser.add_argument('--page-size', type=int, default=100, help='Ids fetched per page when listing the index')
+
+    def handle(self, *args, **options):
+        pinecone_service = PineconeService()
+        dry_run = options['dry_run']
+
+        self.stdout.write('Listing vector ids...')
+        stored_ids = set()
+        for page in pinecone_service.iter_ids(page_size=options['page_size']):
+            stored_ids.update(page)
+
+        fingerprints = dict(ProductVectorSync.objects.values_list('product_id', 'fingerprint'))
+
+        active_ids = set()
+        stale = []
+        missing = 0
+        unchanged = 0
+        products = Product.objects.filter(active=True).select_related('brand', 'category').order_by('id')
+        for product in products.iterator(chunk_size=2000):
+            vector_id = str(product.uuid)
+            active_ids.add(vector_id)
+            if vector_id not in stored_ids:
+                missing += 1
+                stale.append(product)
+            elif fingerprints.get(product.pk) != pinecone_service.get_product_fingerprint(product):
+                stale.append(product)
+            else:
+                unchanged += 1
+
+        orphans = stored_ids - active_ids
+        inactive_synced = list(
+            ProductVectorSync.objects.exclude(product__active=True).values_list('product_id', flat=True)
+        )
+
+        self.stdout.write(
+            f'Active products: {len(active_ids)}, vectors: {len(stored_ids)}\n'
+            f'  unchanged: {unchanged}\n'
+            f'  to upsert: {len(stale)} ({missing} missing, {len(stale) - missing} changed)\n'
+            f'  to delete: {len(orphans)} (orphaned or deactivated)'
+        )
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING('Dry run, nothing was written'))
+            return
+
+        upserted = 0
+        failed = 0
+        batch_size = options['batch_size']
+        for start in range(0, len(stale), batch_size):
+            batch = stale[start:start + batch_size]
+            try:
+                synced = pinecone_service.bulk_upsert(batch)
+            except Exception as e:
+                self.stderr.write(f'Batch starting at product {batch[0].pk} failed: {e}')
+                failed += len(batch)
+                continue
+            ProductVectorSync.objects.mark_synced({
+                product.pk: pinecone_service.get_product_fingerprint(product) for product in synced
+            })
+            upserted += len(synced)
+            failed += len(batch) - len(synced)
+
+        deleted = pinecone_service.delete_products(orphans) if orphans else 0
+        ProductVectorSync.objects.forget(inactive_synced)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Upserted {upserted}, deleted {deleted}, failed {failed}'
+        ))
@@ -0,0 +1,58 @@
+import signal
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from app.authentication.models import UserRecommendationCache
+from core.models import LoggerService
+from services.recommendation_service import RecommendationService
+
+class Command(BaseCommand):
+    help = 'Recomputes the cached recommendations of recently active users shortly before they expire, until stopped'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50, help='Entries refreshed per poll')
+        parser.add_argument('--sleep', type=float, default=30.0, help='Seconds to wait when nothing is due')
+        parser.add_argument('--ahead', type=int, default=None, help='Refresh entries expiring within this many seconds')
+        parser.add_argument('--once', action='store_true', help='Refresh the entries that are due and exit')
+
+    def handle(self, *args, **options):
+        self.running = True
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        ahead = options['ahead'] if options['ahead'] is not None else settings.RECOMMENDATION_REFRESH_AHEAD
+        service = RecommendationService()
+
+        self.stdout.write('Recommendation refresher started')
+        while self.running:
+            close_old_connections()
+            user_ids = list(
+                UserRecommendationCache.objects.due_for_refresh(ahead).order_by(
+                    'expires_at'
+                ).values_list('user_id', flat=True)[:options['batch_size']]
+            )
+            for user_id in user_ids:
+                self.refresh(service, user_id)
+
+            if options['once'] and not user_ids:
+                break
+            if not user_ids:
+                time.sleep(options['sleep'])
+
+        self.stdout.write('Recommendation refresher stopped')
+
+    def stop(self, *args):
+        self.running = False
+
+    def refresh(self, service, user_id):
+        try:
+            service.refresh_user_recommendations(user_id)
+        except Exception as e:
+            UserRecommendationCache.objects.filter(user_id=user_id).delete()
+            LoggerService.objects.create(
+                action='ERROR',
+                table_name='UserRecommendationCache',
+                description=f'Error refreshing recommendations of user {user_id}: {str(e)}',
+                level='ERROR'
+            )
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from app.products.models import ReindexRun
+from services.reindex_service import ReindexService
+
+class Command(BaseCommand):
+    help = 'Re-embeds and upserts every active product, resuming an interrupted run from its checkpoint'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--resume', type=int, help='Id of an interrupted or failed run to continue')
+        parser.add_argument('--batch-size', type=int, help='Products embedded and upserted per batch')
+        parser.add_argument('--workers', type=int, help='Batches processed concurrently')
+
+    def handle(self, *args, **options):
+        if options['resume']:
+            run = ReindexRun.objects.filter(pk=options['resume']).first()
+            if run is None:
+                raise CommandError(f"Reindex run {options['resume']} does not exist")
+            if run.status == ReindexRun.STATUS_DONE:
+                raise CommandError(f"Reindex run {run.pk} already finished")
+        else:
+            active = ReindexRun.objects.active()
+            if active is not None:
+                raise CommandError(f"Reindex run {active.pk} is {active.status}; pass --resume {active.pk} to continue it")
+            run = ReindexRun.objects.create()
+
+        service = ReindexService(batch_size=options['batch_size'], workers=options['workers'])
+        self.stdout.write(f'Reindex run {run.pk} starting after product {run.last_product_id}')
+        service.run(run, on_checkpoint=self.report)
+        self.stdout.write(self.style.SUCCESS(
+            f'Reindexed {run.upserted} products, {run.failed} failed, {run.throughput:.1f} products/s'
+        ))
+
+    def report(self, run):
+        self.stdout.write(f'{run.processed}/{run.total} products ({run.progress:.0%}), {run.throughput:.1f}/s')
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:08
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def populate_rating_summaries(apps, schema_editor):
+    Feedback = apps.get_model('orders', 'Feedback')
+    ProductRatingSummary = apps.get_model('products', 'ProductRatingSummary')
+
+    rows = Feedback.objects.filter(
+        product__isnull=False,
+        product_rating__isnull=False
+    ).values('product_id').annotate(
+        rating_count=Count('id'),
+        rating_sum=Sum('product_rating'),
+        **{f'star_{rating}_count': Count('id', filter=Q(product_rating=rating)) for rating in range(1, 6)}
+    ).order_by()
+
+    ProductRatingSummary.objects.bulk_create([ProductRatingSummary(**row) for row in rows], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0005_product_ar_url_product_model_3d_format_and_more'),
+        ('orders', '0006_feedback'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductRatingSummary',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_summary', serialize=False, to='products.product')),
+                ('rating_count', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.PositiveIntegerField(default=0)),
+                ('star_1_count', models.PositiveIntegerField(default=0)),
+                ('star_2_count', models.PositiveIntegerField(default=0)),
+                ('star_3_count', models.PositiveIntegerField(default=0)),
+                ('star_4_count', models.PositiveIntegerField(default=0)),
+                ('star_5_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.RunPython(populate_rating_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:10
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def populate_search_vectors(apps, schema_editor):
+    Product = apps.get_model('products', 'Product')
+
+    vector = None
+    for config in ('spanish', 'english'):
+        part = (
+            SearchVector('name', weight='A', config=config)
+            + SearchVector('brand__name', 'category__name', weight='B', config=config)
+            + SearchVector('description', weight='C', config=config)
+            + SearchVector('technical_specifications', weight='D', config=config)
+        )
+        vector = part if vector is None else vector + part
+
+    vectors = Product.objects.filter(pk=OuterRef('pk')).annotate(vector=vector).values('vector')[:1]
+    Product.objects.update(search_vector=Subquery(vectors))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0006_productratingsummary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='product_search_vector_gin'),
+        ),
+        migrations.RunPython(populate_search_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:24
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0008_product_facet_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductVectorSync',
+            fields=[
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='vector_sync', serialize=False, to='products.product')),
+                ('fingerprint', models.CharField(max_length=64)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
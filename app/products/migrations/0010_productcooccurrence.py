@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:35
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0009_productvectorsync'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductCooccurrence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('score', models.FloatField()),
+                ('pair_count', models.PositiveIntegerField()),
+                ('computed_at', models.DateTimeField()),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cooccurrences', to='products.product')),
+                ('related_product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='products.product')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['product', 'rank'], name='product_cooccurrence_rank_idx')],
+                'constraints': [models.UniqueConstraint(fields=('product', 'related_product'), name='product_cooccurrence_pair_uniq')],
+            },
+        ),
+    ]
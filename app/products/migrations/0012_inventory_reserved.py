@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:07
+
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def populate_reserved(apps, schema_editor):
+    StockReservation = apps.get_model('orders', 'StockReservation')
+    Inventory = apps.get_model('products', 'Inventory')
+
+    rows = StockReservation.objects.filter(status='active').values('product_id').annotate(
+        held=Sum('quantity')
+    ).order_by()
+    for row in rows:
+        Inventory.objects.filter(product_id=row['product_id']).update(reserved=row['held'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0011_reindexrun'),
+        ('orders', '0008_stockreservation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='inventory',
+            name='reserved',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(populate_reserved, migrations.RunPython.noop),
+    ]
@@ -2,4 +2,10 @@ from app.products.models.brand_model import Brand
 from app.products.models.category_model import ProductCategory
 from app.products.models.warranty_model import Warranty
 from app.products.models.product_model import Product
-from app.products.models.inventory_model import Inventory
\ No newline at end of file
+from app.products.models.inventory_model import Inventory
+from app.products.models.product_rating_summary_model import ProductRatingSummary
+from app.products.models.product_vector_sync_model import ProductVectorSync
+from app.products.models.product_cooccurrence_model import ProductCooccurrence
+from app.products.models.product_purchase_count_model import ProductPurchaseCount
+from app.products.models.cooccurrence_build_model import CooccurrenceBuild
+from app.products.models.reindex_run_model import ReindexRun
\ No newline at end of file
@@ -0,0 +1,26 @@
+from django.db import models
+from core.models import TimestampedModel
+
+class CooccurrenceBuildManager(models.Manager):
+    def current(self):
+        return self.filter(pk=1).first()
+
+    def record(self, computed_through, full=False):
+        defaults = {'computed_through': computed_through}
+        if full:
+            defaults['full_built_at'] = computed_through
+        build, _ = self.update_or_create(pk=1, defaults=defaults)
+        return build
+
+class CooccurrenceBuild(TimestampedModel):
+    """
+    Single row holding the co-occurrence watermark: payments completed before
+    computed_through are reflected in the neighbours, whether or not a run wrote rows.
+    """
+    computed_through = models.DateTimeField()
+    full_built_at = models.DateTimeField(null=True, blank=True)
+
+    objects = CooccurrenceBuildManager()
+
+    def __str__(self):
+        return f"Co-occurrence computed through {self.computed_through}"
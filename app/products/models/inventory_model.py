@@ -3,5 +3,14 @@ from core.models import TimestampedModel
 from app.products.models.product_model import Product
 
 class Inventory(TimestampedModel):
+    """
+    reserved is the sum of the product's active stock holds, kept in step by the
+    StockReservation manager, so catalog reads get available stock without a join.
+    """
     product = models.OneToOneField(Product, on_delete=models.CASCADE, related_name='inventory', primary_key=True)
-    stock = models.PositiveIntegerField(default=0)
\ No newline at end of file
+    stock = models.PositiveIntegerField(default=0)
+    reserved = models.PositiveIntegerField(default=0)
+
+    @property
+    def available_stock(self):
+        return max(self.stock - self.reserved, 0)
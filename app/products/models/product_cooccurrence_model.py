@@ -0,0 +1,37 @@
+from django.db import models, transaction
+from core.models import TimestampedModel
+from app.products.models.product_model import Product
+
+class ProductCooccurrenceManager(models.Manager):
+    @transaction.atomic
+    def replace(self, rows, product_ids=None):
+        """
+        Swaps in freshly computed neighbour rows, either for every product (product_ids
+        None) or only for the given products.
+        """
+        if product_ids is None:
+            self.all().delete()
+        else:
+            self.filter(product_id__in=list(product_ids)).delete()
+        return len(self.bulk_create(rows, batch_size=1000))
+
+class ProductCooccurrence(TimestampedModel):
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='cooccurrences')
+    related_product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='+')
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+    pair_count = models.PositiveIntegerField()
+    computed_at = models.DateTimeField()
+
+    objects = ProductCooccurrenceManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'related_product'], name='product_cooccurrence_pair_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['product', 'rank'], name='product_cooccurrence_rank_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} -> {self.related_product_id} ({self.score:.3f})"
@@ -1,5 +1,8 @@
 from django.db import models
-from django.db.models import Avg
+from django.db.models import OuterRef, Subquery
+from django.core.exceptions import ObjectDoesNotExist
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 import uuid
 from core.models import TimestampedModel
 from base.storage import PublicMediaStorage
@@ -8,6 +11,27 @@ from app.products.models.brand_model import Brand
 from app.products.models.category_model import ProductCategory
 from app.products.models.warranty_model import Warranty
 
+SEARCH_CONFIGS = ('spanish', 'english')
+
+def build_search_vector():
+    vector = None
+    for config in SEARCH_CONFIGS:
+        part = (
+            SearchVector('name', weight='A', config=config)
+            + SearchVector('brand__name', 'category__name', weight='B', config=config)
+            + SearchVector('description', weight='C', config=config)
+            + SearchVector('technical_specifications', weight='D', config=config)
+        )
+        vector = part if vector is None else vector + part
+    return vector
+
+class ProductQuerySet(models.QuerySet):
+    def update_search_vector(self):
+        vectors = Product.objects.filter(pk=OuterRef('pk')).annotate(
+            vector=build_search_vector()
+        ).values('vector')[:1]
+        return self.update(search_vector=Subquery(vectors))
+
 class Product(TimestampedModel):
     uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
     brand = models.ForeignKey(Brand, on_delete=models.CASCADE, related_name='products')
@@ -26,6 +50,18 @@ class Product(TimestampedModel):
     technical_specifications = models.TextField(null=True, blank=True)
     price_usd = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     price_bs = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = ProductQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='product_search_vector_gin'),
+            models.Index(fields=['active', 'brand', 'price_usd'], name='product_active_brand_price_idx'),
+            models.Index(fields=['active', 'category', 'price_usd'], name='product_active_cat_price_idx'),
+            models.Index(fields=['active', 'supports_ar'], name='product_active_ar_idx'),
+            models.Index(fields=['active', '-created_at'], name='product_active_created_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         if self.price_usd is not None:
@@ -50,11 +86,14 @@ class Product(TimestampedModel):
 
     @property
     def average_rating(self):
-        from app.orders.models.feedback_model import Feedback
-        avg = Feedback.objects.filter(product=self, product_rating__isnull=False).aggregate(avg=Avg('product_rating'))['avg']
-        return round(avg, 1) if avg else None
+        try:
+            return self.rating_summary.average_rating
+        except ObjectDoesNotExist:
+            return None
     
     @property
     def total_reviews(self):
-        from app.orders.models.feedback_model import Feedback
-        return Feedback.objects.filter(product=self, product_rating__isnull=False).count()
\ No newline at end of file
+        try:
+            return self.rating_summary.rating_count
+        except ObjectDoesNotExist:
+            return 0
\ No newline at end of file
@@ -0,0 +1,35 @@
+from django.db import models, transaction
+from core.models import TimestampedModel
+from app.products.models.product_model import Product
+
+class ProductPurchaseCountManager(models.Manager):
+    def counts(self, product_ids):
+        return dict(self.filter(product_id__in=list(product_ids)).values_list('product_id', 'order_count'))
+
+    @transaction.atomic
+    def replace(self, counts, product_ids=None):
+        """
+        Stores {product_id: order_count}, either for every product (product_ids None) or
+        only for the given products.
+        """
+        if product_ids is None:
+            self.all().delete()
+        else:
+            self.filter(product_id__in=list(product_ids)).delete()
+        self.bulk_create(
+            [self.model(product_id=product_id, order_count=count) for product_id, count in counts.items()],
+            batch_size=1000
+        )
+
+class ProductPurchaseCount(TimestampedModel):
+    """
+    Number of paid orders containing the product, i.e. the diagonal of the co-occurrence
+    matrix, kept so incremental refreshes can normalize without rescanning every order.
+    """
+    product = models.OneToOneField(Product, on_delete=models.CASCADE, related_name='purchase_count', primary_key=True)
+    order_count = models.PositiveIntegerField(default=0)
+
+    objects = ProductPurchaseCountManager()
+
+    def __str__(self):
+        return f"Product {self.product_id} in {self.order_count} paid orders"
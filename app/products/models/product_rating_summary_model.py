@@ -0,0 +1,73 @@
+from django.db import models, transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+from core.models import TimestampedModel
+from app.products.cache import invalidate_catalog_cache
+from app.products.models.product_model import Product
+
+RATING_VALUES = (1, 2, 3, 4, 5)
+
+class ProductRatingSummaryManager(models.Manager):
+    def apply_rating_change(self, product_id, old_rating=None, new_rating=None):
+        if product_id is None or old_rating == new_rating:
+            return
+
+        if old_rating is None:
+            self.bulk_create([self.model(product_id=product_id)], ignore_conflicts=True)
+
+        changes = {'updated_at': timezone.now()}
+        if old_rating is not None:
+            changes['rating_count'] = F('rating_count') - 1
+            changes['rating_sum'] = F('rating_sum') - old_rating
+            changes[f'star_{old_rating}_count'] = F(f'star_{old_rating}_count') - 1
+        if new_rating is not None:
+            changes['rating_count'] = changes.get('rating_count', F('rating_count')) + 1
+            changes['rating_sum'] = changes.get('rating_sum', F('rating_sum')) + new_rating
+            changes[f'star_{new_rating}_count'] = F(f'star_{new_rating}_count') + 1
+
+        self.filter(product_id=product_id).update(**changes)
+        invalidate_catalog_cache()
+
+    @transaction.atomic
+    def rebuild(self):
+        from app.orders.models.feedback_model import Feedback
+
+        aggregates = {
+            f'star_{rating}_count': Count('id', filter=Q(product_rating=rating))
+            for rating in RATING_VALUES
+        }
+        rows = Feedback.objects.filter(
+            product__isnull=False,
+            product_rating__isnull=False
+        ).values('product_id').annotate(
+            rating_count=Count('id'),
+            rating_sum=Sum('product_rating'),
+            **aggregates
+        ).order_by()
+
+        self.all().delete()
+        summaries = self.bulk_create([self.model(**row) for row in rows], batch_size=1000)
+        invalidate_catalog_cache()
+        return len(summaries)
+
+class ProductRatingSummary(TimestampedModel):
+    product = models.OneToOneField(Product, on_delete=models.CASCADE, related_name='rating_summary', primary_key=True)
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    star_1_count = models.PositiveIntegerField(default=0)
+    star_2_count = models.PositiveIntegerField(default=0)
+    star_3_count = models.PositiveIntegerField(default=0)
+    star_4_count = models.PositiveIntegerField(default=0)
+    star_5_count = models.PositiveIntegerField(default=0)
+
+    objects = ProductRatingSummaryManager()
+
+    @property
+    def average_rating(self):
+        if not self.rating_count:
+            return None
+        return round(self.rating_sum / self.rating_count, 1)
+
+    @property
+    def histogram(self):
+        return {rating: getattr(self, f'star_{rating}_count') for rating in RATING_VALUES}
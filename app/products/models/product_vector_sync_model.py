@@ -0,0 +1,29 @@
+from django.db import models
+from core.models import TimestampedModel
+from app.products.models.product_model import Product
+
+class ProductVectorSyncManager(models.Manager):
+    def mark_synced(self, fingerprints):
+        """
+        Records {product_id: fingerprint} for products whose vector was just written.
+        """
+        self.bulk_create(
+            [self.model(product_id=product_id, fingerprint=fingerprint) for product_id, fingerprint in fingerprints.items()],
+            update_conflicts=True,
+            unique_fields=['product'],
+            update_fields=['fingerprint', 'updated_at'],
+            batch_size=1000
+        )
+
+    def forget(self, product_ids):
+        deleted, _ = self.filter(product_id__in=list(product_ids)).delete()
+        return deleted
+
+class ProductVectorSync(TimestampedModel):
+    product = models.OneToOneField(Product, on_delete=models.CASCADE, related_name='vector_sync', primary_key=True)
+    fingerprint = models.CharField(max_length=64)
+
+    objects = ProductVectorSyncManager()
+
+    def __str__(self):
+        return f"Vector sync of product {self.product_id}"
@@ -0,0 +1,75 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from core.models import TimestampedModel
+
+class ReindexRunManager(models.Manager):
+    def active(self):
+        return self.filter(status__in=[ReindexRun.STATUS_PENDING, ReindexRun.STATUS_RUNNING]).order_by('-created_at').first()
+
+class ReindexRun(TimestampedModel):
+    """
+    One full-catalog reindex. Products are processed in primary key order and
+    last_product_id is the checkpoint: every active product up to it has been embedded
+    and upserted (or counted as failed), so a resumed run continues after it.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    requested_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    last_product_id = models.BigIntegerField(default=0)
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    upserted = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    elapsed_seconds = models.FloatField(default=0)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(null=True, blank=True)
+
+    objects = ReindexRunManager()
+
+    def __str__(self):
+        return f"Reindex {self.pk} - {self.status} ({self.processed}/{self.total})"
+
+    @property
+    def throughput(self):
+        """
+        Products per second over the time this run has actually been working, summed
+        across resumes.
+        """
+        return self.processed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def progress(self):
+        return min(self.processed / self.total, 1.0) if self.total else 0.0
+
+    @property
+    def eta_seconds(self):
+        if self.status != self.STATUS_RUNNING or not self.throughput:
+            return None
+        return max(self.total - self.processed, 0) / self.throughput
+
+    def is_active(self):
+        return self.status in (self.STATUS_PENDING, self.STATUS_RUNNING)
+
+    def mark_started(self):
+        self.status = self.STATUS_RUNNING
+        self.started_at = self.started_at or timezone.now()
+        self.save(update_fields=['status', 'started_at', 'updated_at'])
+
+    def mark_finished(self, error=None):
+        self.status = self.STATUS_FAILED if error else self.STATUS_DONE
+        self.last_error = str(error) if error else self.last_error
+        self.finished_at = timezone.now()
+        self.save(update_fields=['status', 'last_error', 'finished_at', 'updated_at'])
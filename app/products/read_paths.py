@@ -0,0 +1,29 @@
+from app.products.models import Brand, Inventory, Product, ProductCategory, Warranty
+from app.products.serializers import (
+    BrandSerializer,
+    InventorySerializer,
+    ProductCategorySerializer,
+    ProductSerializer,
+    WarrantySerializer
+)
+from core.dynamic_fields import serializer_columns
+
+PRODUCT_READ_RELATIONS = ('brand', 'category', 'warranty__brand', 'inventory', 'rating_summary')
+
+def product_read_columns(prefix=''):
+    """
+    only() paths for products rendered by ProductSerializer with PRODUCT_READ_RELATIONS
+    joined in, so search_vector and other unserialized columns are not fetched.
+    """
+    return [
+        *serializer_columns(ProductSerializer(), Product, prefix),
+        *serializer_columns(BrandSerializer(), Brand, f'{prefix}brand__'),
+        *serializer_columns(ProductCategorySerializer(), ProductCategory, f'{prefix}category__'),
+        *serializer_columns(WarrantySerializer(), Warranty, f'{prefix}warranty__'),
+        f'{prefix}warranty__brand__id',
+        f'{prefix}warranty__brand__name',
+        *serializer_columns(InventorySerializer(), Inventory, f'{prefix}inventory__'),
+        f'{prefix}rating_summary__product',
+        f'{prefix}rating_summary__rating_count',
+        f'{prefix}rating_summary__rating_sum',
+    ]
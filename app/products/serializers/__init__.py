@@ -2,4 +2,5 @@ from app.products.serializers.brand_serializer import BrandSerializer
 from app.products.serializers.category_serializer import ProductCategorySerializer
 from app.products.serializers.warranty_serializer import WarrantySerializer
 from app.products.serializers.inventory_serializer import InventorySerializer
-from app.products.serializers.product_serializer import ProductSerializer
\ No newline at end of file
+from app.products.serializers.product_serializer import ProductSerializer
+from app.products.serializers.reindex_run_serializer import ReindexRunSerializer
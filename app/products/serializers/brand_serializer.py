@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from app.products.models import Brand
+from core.dynamic_fields import DynamicFieldsMixin
 
-class BrandSerializer(serializers.ModelSerializer):
+class BrandSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Brand
         fields = [
@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from app.products.models import ProductCategory
+from core.dynamic_fields import DynamicFieldsMixin
 
-class ProductCategorySerializer(serializers.ModelSerializer):
+class ProductCategorySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ProductCategory
         fields = [
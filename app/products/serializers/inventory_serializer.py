@@ -1,13 +1,19 @@
 from rest_framework import serializers
 from app.products.models import Inventory
+from core.dynamic_fields import DynamicFieldsMixin
+
+class InventorySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    available_stock = serializers.IntegerField(read_only=True)
+
+    column_hints = {'available_stock': ['stock', 'reserved']}
 
-class InventorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Inventory
         fields = [
             'product',
             'stock',
+            'available_stock',
             'created_at',
             'updated_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['id', 'created_at', 'updated_at']
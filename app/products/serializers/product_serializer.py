@@ -5,8 +5,9 @@ from app.products.serializers.brand_serializer import BrandSerializer
 from app.products.serializers.category_serializer import ProductCategorySerializer
 from app.products.serializers.warranty_serializer import WarrantySerializer
 from app.products.serializers.inventory_serializer import InventorySerializer
+from core.dynamic_fields import DynamicFieldsMixin
 
-class ProductSerializer(serializers.ModelSerializer):
+class ProductSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     brand = BrandSerializer(read_only=True)
     category = ProductCategorySerializer(read_only=True)
     warranty = WarrantySerializer(read_only=True)
@@ -22,6 +23,8 @@ class ProductSerializer(serializers.ModelSerializer):
     has_3d_model = serializers.SerializerMethodField(read_only=True)
     has_ar = serializers.SerializerMethodField(read_only=True)
 
+    related_hints = {'average_rating': ['rating_summary'], 'total_reviews': ['rating_summary']}
+
     class Meta:
         model = Product
         fields = [
@@ -0,0 +1,29 @@
+from rest_framework import serializers
+from app.products.models import ReindexRun
+
+class ReindexRunSerializer(serializers.ModelSerializer):
+    throughput = serializers.FloatField(read_only=True)
+    progress = serializers.FloatField(read_only=True)
+    eta_seconds = serializers.FloatField(read_only=True, allow_null=True)
+
+    class Meta:
+        model = ReindexRun
+        fields = [
+            'id',
+            'status',
+            'total',
+            'processed',
+            'upserted',
+            'failed',
+            'last_product_id',
+            'progress',
+            'throughput',
+            'elapsed_seconds',
+            'eta_seconds',
+            'started_at',
+            'finished_at',
+            'last_error',
+            'created_at',
+            'updated_at'
+        ]
+        read_only_fields = fields
@@ -1,8 +1,11 @@
 from rest_framework import serializers
 from app.products.models import Warranty
+from core.dynamic_fields import DynamicFieldsMixin
 
-class WarrantySerializer(serializers.ModelSerializer):
+class WarrantySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     brand_name = serializers.SerializerMethodField()
+
+    related_hints = {'brand_name': ['brand']}
     
     class Meta:
         model = Warranty
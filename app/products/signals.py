@@ -0,0 +1,23 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from app.products.models import Product, Brand, ProductCategory, Warranty, Inventory
+from app.products.cache import invalidate_catalog_cache
+
+def invalidate_catalog_on_change(sender, **kwargs):
+    invalidate_catalog_cache()
+
+for model in (Product, Brand, ProductCategory, Warranty, Inventory):
+    post_save.connect(invalidate_catalog_on_change, sender=model, dispatch_uid=f'catalog_save_{model.__name__}')
+    post_delete.connect(invalidate_catalog_on_change, sender=model, dispatch_uid=f'catalog_delete_{model.__name__}')
+
+@receiver(post_save, sender=Product)
+def update_product_search_vector(sender, instance, **kwargs):
+    Product.objects.filter(pk=instance.pk).update_search_vector()
+
+@receiver(post_save, sender=Brand)
+def update_brand_search_vectors(sender, instance, **kwargs):
+    Product.objects.filter(brand=instance).update_search_vector()
+
+@receiver(post_save, sender=ProductCategory)
+def update_category_search_vectors(sender, instance, **kwargs):
+    Product.objects.filter(category=instance).update_search_vector()
@@ -1,3 +1,110 @@
+from datetime import timedelta
+import numpy as np
+from scipy import sparse
 from django.test import TestCase
+from django.utils import timezone
+from app.authentication.models import User
+from app.orders.models import Order, OrderItem, Payment
+from app.products.models import Brand, Product, ProductCooccurrence
+from services.cooccurrence_service import CooccurrenceService
 
-# Create your tests here.
+# Orders {A, B}, {A, B, C}, {A}, {C}: A is in 3 orders, B and C in 2; AB in 2, AC and BC in 1.
+BASKETS = [[0, 1], [0, 1, 2], [0], [2]]
+
+def basket_counts(baskets, products=3):
+    rows = [row for row, basket in enumerate(baskets) for _ in basket]
+    columns = [column for basket in baskets for column in basket]
+    matrix = sparse.csr_matrix((np.ones(len(rows), dtype=np.int64), (rows, columns)), shape=(len(baskets), products))
+    return (matrix.T @ matrix).tocsr()
+
+class CooccurrenceScoreTests(TestCase):
+    def scores(self, metric, min_count=1):
+        pairs, scores = CooccurrenceService(min_count=min_count, metric=metric).score_matrix(basket_counts(BASKETS), len(BASKETS))
+        return pairs.toarray(), scores.toarray()
+
+    def test_lift(self):
+        pairs, scores = self.scores('lift')
+
+        np.testing.assert_array_equal(pairs, [[0, 2, 1], [2, 0, 1], [1, 1, 0]])
+        np.testing.assert_allclose(scores, [[0, 4 / 3, 2 / 3], [4 / 3, 0, 1], [2 / 3, 1, 0]])
+
+    def test_cosine(self):
+        _, scores = self.scores('cosine')
+
+        np.testing.assert_allclose(scores, [
+            [0, 2 / np.sqrt(6), 1 / np.sqrt(6)],
+            [2 / np.sqrt(6), 0, 0.5],
+            [1 / np.sqrt(6), 0.5, 0],
+        ])
+
+    def test_min_count_drops_rare_pairs(self):
+        pairs, scores = self.scores('lift', min_count=2)
+
+        np.testing.assert_array_equal(pairs, [[0, 2, 0], [2, 0, 0], [0, 0, 0]])
+        np.testing.assert_allclose(scores, [[0, 4 / 3, 0], [4 / 3, 0, 0], [0, 0, 0]])
+
+    def test_item_counts_override_the_diagonal(self):
+        service = CooccurrenceService(metric='lift')
+        _, scores = service.score_matrix(basket_counts(BASKETS), 8, item_counts=[6, 4, 4])
+
+        np.testing.assert_allclose(scores.toarray()[0], [0, 2 / 3, 1 / 3])
+
+    def test_unknown_metric(self):
+        with self.assertRaises(ValueError):
+            CooccurrenceService(metric='jaccard')
+
+class CooccurrenceRefreshTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='buyer@example.com', password='secret')
+        brand = Brand.objects.create(name='Brand')
+        self.products = [Product.objects.create(brand=brand, name=name, price_usd=10) for name in 'ABCD']
+
+    def paid_order(self, basket):
+        order = Order.objects.create(user=self.user, total_amount=10, currency='USD')
+        for index in basket:
+            OrderItem.objects.create(order=order, product=self.products[index], quantity=1, unit_price=10)
+        Payment.objects.create(order=order, amount=10, payment_method='cash', payment_status='completed')
+        return order
+
+    def neighbours(self, product_ids):
+        return {
+            product_id: list(
+                ProductCooccurrence.objects.filter(product_id=product_id).order_by('rank').values_list('related_product_id', 'score', 'pair_count')
+            )
+            for product_id in product_ids
+        }
+
+    def assert_incremental_matches_full(self, metric):
+        for basket in [*BASKETS, [2, 3]]:
+            self.paid_order(basket)
+        service = CooccurrenceService(min_count=1, metric=metric)
+        service.refresh()
+        Payment.objects.update(updated_at=timezone.now() - timedelta(days=1))
+
+        self.paid_order([0, 3])
+        self.assertGreater(service.refresh_incremental(), 0)
+        targets = [self.products[0].pk, self.products[3].pk]
+        incremental = self.neighbours(targets)
+
+        service.refresh()
+        full = self.neighbours(targets)
+        self.assertEqual(incremental.keys(), full.keys())
+        for product_id in targets:
+            self.assertEqual([row[0] for row in incremental[product_id]], [row[0] for row in full[product_id]])
+            self.assertEqual([row[2] for row in incremental[product_id]], [row[2] for row in full[product_id]])
+            np.testing.assert_allclose([row[1] for row in incremental[product_id]], [row[1] for row in full[product_id]])
+
+    def test_incremental_lift_matches_full_refresh(self):
+        self.assert_incremental_matches_full('lift')
+
+    def test_incremental_cosine_matches_full_refresh(self):
+        self.assert_incremental_matches_full('cosine')
+
+    def test_unpaid_orders_are_ignored(self):
+        self.paid_order([0, 1])
+        Order.objects.create(user=self.user, total_amount=10, currency='USD').items.create(
+            product=self.products[0], quantity=1, unit_price=10
+        )
+
+        _, _, order_count = CooccurrenceService().build_matrix()
+        self.assertEqual(order_count, 1)
@@ -4,6 +4,8 @@ from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
 
 from core.models import LoggerService
 from core.pagination import CustomPagination
+from core.conditional import ConditionalGetMixin
+from app.products.cache import CATALOG_CACHE_NAMESPACE
 from django.db import transaction
 from app.products.models import Brand
 from app.products.serializers import BrandSerializer
@@ -11,11 +13,12 @@ from rest_framework.decorators import action
 from drf_spectacular.utils import extend_schema
 
 @extend_schema(tags=['Brand'])
-class BrandViewSet(viewsets.ModelViewSet):
+class BrandViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Brand.objects.filter(active=True)
     serializer_class = BrandSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     pagination_class = CustomPagination
+    conditional_namespace = CATALOG_CACHE_NAMESPACE
     parser_classes = [JSONParser, MultiPartParser, FormParser]
 
     def create(self, request, *args, **kwargs):
@@ -5,16 +5,19 @@ from django.db import transaction
 
 from core.models import LoggerService
 from core.pagination import CustomPagination
+from core.conditional import ConditionalGetMixin
+from app.products.cache import CATALOG_CACHE_NAMESPACE
 from app.products.models import ProductCategory
 from app.products.serializers import ProductCategorySerializer
 from drf_spectacular.utils import extend_schema
 
 @extend_schema(tags=['ProductCategory'])
-class ProductCategoryViewSet(viewsets.ModelViewSet):
+class ProductCategoryViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = ProductCategory.objects.filter(active=True)
     serializer_class = ProductCategorySerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     pagination_class = CustomPagination
+    conditional_namespace = CATALOG_CACHE_NAMESPACE
     parser_classes = [JSONParser, MultiPartParser, FormParser]
 
     def create(self, request, *args, **kwargs):
@@ -3,17 +3,20 @@ from rest_framework.response import Response
 from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
 from core.models import LoggerService
 from core.pagination import CustomPagination
+from core.conditional import ConditionalGetMixin
+from app.products.cache import CATALOG_CACHE_NAMESPACE
 from django.db import transaction
 from app.products.models import Inventory
 from app.products.serializers import InventorySerializer
 from drf_spectacular.utils import extend_schema
 
 @extend_schema(tags=['Inventory'])
-class InventoryViewSet(viewsets.ModelViewSet):
+class InventoryViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Inventory.objects.all()
     serializer_class = InventorySerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     pagination_class = CustomPagination
+    conditional_namespace = CATALOG_CACHE_NAMESPACE
     parser_classes = [JSONParser, MultiPartParser, FormParser]
 
     def create(self, request, *args, **kwargs):
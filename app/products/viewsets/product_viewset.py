@@ -1,22 +1,35 @@
 from rest_framework import viewsets, status, permissions
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from django.conf import settings
 from django.db import transaction
 
 from core.models import LoggerService
 from core.pagination import CustomPagination
-from app.products.models import Product
-from app.products.serializers import ProductSerializer
+from core.dynamic_fields import DynamicFieldsViewSetMixin
+from core.cache import cache_response, get_cache_stats
+from core.conditional import ConditionalGetMixin
+from app.products.models import Product, ProductCooccurrence, ReindexRun
+from app.products.serializers import ProductSerializer, ReindexRunSerializer
+from app.products.cache import CATALOG_CACHE_NAMESPACE, COOCCURRENCE_CACHE_NAMESPACE
+from app.products.filters import ProductSearchFilter, ProductFacetFilter
+from app.products.jobs import enqueue_product_vector_sync, enqueue_reindex
 
-from services.pinecone_service import PineconeService
-from services.recommendation_service import RecommendationService
+from services.recommendation_service import (
+    RecommendationService,
+    SIMILAR_EMBEDDINGS_NAMESPACE,
+    SIMILAR_RESULTS_NAMESPACE
+)
 
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 
 @extend_schema(tags=['Products'])
-class ProductViewSet(viewsets.ModelViewSet):
-    queryset = Product.objects.filter(active=True).order_by('-created_at')
+class ProductViewSet(ConditionalGetMixin, DynamicFieldsViewSetMixin, viewsets.ModelViewSet):
+    queryset = Product.objects.filter(active=True).select_related(
+        'brand', 'category', 'warranty__brand', 'inventory', 'rating_summary'
+    ).order_by('-created_at')
     serializer_class = ProductSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     parser_classes = [
@@ -25,9 +38,44 @@ class ProductViewSet(viewsets.ModelViewSet):
         JSONParser
     ]
     pagination_class = CustomPagination
+    sort_by_fields = ['created_at', 'price_usd']
+    conditional_namespace = CATALOG_CACHE_NAMESPACE
+    conditional_actions = ('list', 'retrieve', 'with_3d_models', 'with_ar', 'similar_to', 'bought_together')
+    conditional_depends_on = {'bought_together': (COOCCURRENCE_CACHE_NAMESPACE,)}
 
-    filterset_fields = ['brand', 'category', 'supports_ar']
-    search_fields = ['name', 'description']
+    filter_backends = [ProductSearchFilter, ProductFacetFilter]
+
+    max_similar_count = 50
+
+    def get_count(self, request, maximum, default=5):
+        """
+        The ?count= of list-style actions: a positive integer, capped at maximum.
+        """
+        raw = request.query_params.get('count')
+        if raw in (None, ''):
+            return min(default, maximum)
+        try:
+            count = int(raw)
+        except ValueError:
+            raise ValidationError({'count': 'Expected a positive integer'})
+        if count < 1:
+            raise ValidationError({'count': 'Expected a positive integer'})
+        return min(count, maximum)
+
+    @cache_response(CATALOG_CACHE_NAMESPACE)
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+
+        facet_filter = ProductFacetFilter()
+        if response.status_code == 200 and facet_filter.wants_facets(request):
+            queryset = ProductSearchFilter().filter_queryset(request, self.get_queryset(), self)
+            response.data['facets'] = facet_filter.get_facets(request, queryset)
+
+        return response
+
+    @cache_response(CATALOG_CACHE_NAMESPACE)
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
 
     @extend_schema(
         request=ProductSerializer,
@@ -125,16 +173,7 @@ class ProductViewSet(viewsets.ModelViewSet):
                 if update_fields:
                     instance.save(update_fields=update_fields)
                 
-                try:
-                    pinecone_service = PineconeService()
-                    pinecone_service.upsert_product(instance)
-                except Exception as e:
-                    LoggerService.objects.create(
-                        user=request.user if request.user.is_authenticated else None,
-                        action='ERROR',
-                        table_name='Product',
-                        description=f'Error syncing product {instance.id} with Pinecone: {str(e)}'
-                    )
+                enqueue_product_vector_sync(instance)
 
                 LoggerService.objects.create(
                     user=request.user if request.user.is_authenticated else None,
@@ -254,16 +293,7 @@ class ProductViewSet(viewsets.ModelViewSet):
                 if update_fields:
                     instance.save(update_fields=update_fields)
                 
-                try:
-                    pinecone_service = PineconeService()
-                    pinecone_service.upsert_product(instance)
-                except Exception as e:
-                    LoggerService.objects.create(
-                        user=request.user if request.user.is_authenticated else None,
-                        action='ERROR',
-                        table_name='Product',
-                        description=f'Error syncing updated product {instance.id} to Pinecone: {str(e)}'
-                    )
+                enqueue_product_vector_sync(instance)
                 
                 LoggerService.objects.create(
                     user=request.user if request.user.is_authenticated else None,
@@ -289,6 +319,7 @@ class ProductViewSet(viewsets.ModelViewSet):
         tags=['Products']
     )
     @action(detail=False, methods=['get'], url_path='with-3d-models')
+    @cache_response(CATALOG_CACHE_NAMESPACE)
     def with_3d_models(self, request):
         products = self.queryset.filter(model_3d_url__isnull=False).exclude(model_3d_url='')
         page = self.paginate_queryset(products)
@@ -306,6 +337,7 @@ class ProductViewSet(viewsets.ModelViewSet):
         tags=['Products']
     )
     @action(detail=False, methods=['get'], url_path='with-ar')
+    @cache_response(CATALOG_CACHE_NAMESPACE)
     def with_ar(self, request):
         products = self.queryset.filter(supports_ar=True, ar_url__isnull=False).exclude(ar_url='')
         page = self.paginate_queryset(products)
@@ -322,19 +354,9 @@ class ProductViewSet(viewsets.ModelViewSet):
             try:
                 instance = self.get_object()
                 
-                try:
-                    pinecone_service = PineconeService()
-                    pinecone_service.delete_product(instance.uuid)
-                except Exception as e:
-                    LoggerService.objects.create(
-                        user=request.user if request.user.is_authenticated else None,
-                        action='ERROR',
-                        table_name='Product',
-                        description=f'Error removing product {instance.id} from Pinecone: {str(e)}'
-                    )
-                
                 instance.active = False
                 instance.save()
+                enqueue_product_vector_sync(instance)
                 LoggerService.objects.create(
                     user=request.user if request.user.is_authenticated else None,
                     action='DELETE',
@@ -385,7 +407,7 @@ class ProductViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def similar(self, request):
         query = request.query_params.get('query', '')
-        count = int(request.query_params.get('count', '5'))
+        count = self.get_count(request, self.max_similar_count)
         
         if not query:
             return Response({"error": "Query parameter is required"}, status=400)
@@ -396,37 +418,14 @@ class ProductViewSet(viewsets.ModelViewSet):
             
             if not vector_results:
                 return Response([])
-                
-            product_uuids = []
-            similarity_scores = {}
-            
-            for item in vector_results:
-                if 'id' in item:
-                    uuid_value = item['id']
-                else:
-                    uuid_value = item.get('vector_id')
-                    
-                if uuid_value:
-                    product_uuids.append(uuid_value)
-                    similarity_scores[uuid_value] = item.get('score', 0)
             
-            products = Product.objects.filter(
-                uuid__in=product_uuids, 
-                active=True
-            ).select_related('brand', 'category', 'warranty')
-            
-            products = sorted(
-                products, 
-                key=lambda p: product_uuids.index(str(p.uuid))
-            )
+            ranked = recommendation_service.hydrate_products(vector_results)
             
-            serializer = ProductSerializer(products, many=True)
+            serializer = ProductSerializer([product for product, _ in ranked], many=True)
             result_data = serializer.data
             
-            for item in result_data:
-                uuid_str = item.get('uuid')
-                if uuid_str in similarity_scores:
-                    item['similarity_score'] = similarity_scores[uuid_str]
+            for item, (_, score) in zip(result_data, ranked):
+                item['similarity_score'] = score
             
             return Response(result_data)
         except Exception as e:
@@ -439,49 +438,197 @@ class ProductViewSet(viewsets.ModelViewSet):
             return Response({"error": "Error processing request"}, status=500)
     
             
-    @action(detail=False, methods=['post'])
-    def sync_all_to_pinecone(self, request):
-        if not request.user.is_staff:
-            return Response({"error": "Not authorized"}, status=403)
-            
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='count',
+                type=int,
+                description='Number of similar products to return',
+                required=False,
+                default=5
+            )
+        ],
+        responses={200: ProductSerializer(many=True)},
+        description="Get products similar to this one, ranked by similarity of their stored vectors. Does not call the embedding API.",
+        tags=['Products']
+    )
+    @action(detail=True, methods=['get'], url_path='similar', url_name='similar-to')
+    @cache_response(CATALOG_CACHE_NAMESPACE)
+    def similar_to(self, request, pk=None):
+        product = self.get_object()
+        count = self.get_count(request, self.max_similar_count)
+        
         try:
-            products = Product.objects.filter(active=True)
-            pinecone_service = PineconeService()
+            recommendation_service = RecommendationService()
+            vector_results = recommendation_service.get_similar_to_product(product, top_k=count)
             
-            successful = 0
-            failed = 0
+            ranked = recommendation_service.hydrate_products(vector_results)
             
-            for product in products:
-                try:
-                    result = pinecone_service.upsert_product(product)
-                    if result:
-                        successful += 1
-                    else:
-                        failed += 1
-                except Exception:
-                    failed += 1
+            serializer = ProductSerializer([similar for similar, _ in ranked], many=True)
+            result_data = serializer.data
+            
+            for item, (_, score) in zip(result_data, ranked):
+                item['similarity_score'] = score
             
+            return Response(result_data)
+        except Exception as e:
+            LoggerService.objects.create(
+                user=request.user if request.user.is_authenticated else None,
+                action='ERROR',
+                table_name='Product',
+                description=f'Error getting products similar to product {product.id}: {str(e)}'
+            )
+            return Response({"error": "Error processing request"}, status=500)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='count',
+                type=int,
+                description='Number of products to return',
+                required=False,
+                default=5
+            )
+        ],
+        responses={200: ProductSerializer(many=True)},
+        description="Get products frequently bought together with this one, from the precomputed co-occurrence neighbours of paid orders.",
+        tags=['Products']
+    )
+    @action(detail=True, methods=['get'], url_path='bought-together')
+    @cache_response(CATALOG_CACHE_NAMESPACE, depends_on=(COOCCURRENCE_CACHE_NAMESPACE,))
+    def bought_together(self, request, pk=None):
+        product = self.get_object()
+        count = self.get_count(request, settings.COOCCURRENCE_TOP_N)
+        
+        neighbours = ProductCooccurrence.objects.filter(
+            product=product,
+            related_product__active=True
+        ).select_related(
+            'related_product__brand',
+            'related_product__category',
+            'related_product__warranty__brand',
+            'related_product__inventory',
+            'related_product__rating_summary'
+        ).order_by('rank')[:count]
+        
+        neighbours = list(neighbours)
+        serializer = ProductSerializer([neighbour.related_product for neighbour in neighbours], many=True)
+        result_data = serializer.data
+        
+        for item, neighbour in zip(result_data, neighbours):
+            item['cooccurrence_score'] = neighbour.score
+            item['bought_together_count'] = neighbour.pair_count
+        
+        return Response(result_data)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='count',
+                type=int,
+                description='Number of products to return',
+                required=False,
+                default=5
+            )
+        ],
+        responses={200: ProductSerializer(many=True)},
+        description="Get personalized recommendations for the current user, ranked by similarity to their purchase history. Products already bought are excluded. Results are materialized per user and refreshed in the background.",
+        tags=['Products']
+    )
+    @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
+    def recommended(self, request):
+        count = self.get_count(request, settings.RECOMMENDATION_CACHE_SIZE)
+        
+        try:
+            recommendation_service = RecommendationService()
+            return Response(recommendation_service.get_cached_recommendations(request.user.id, count=count))
+        except Exception as e:
             LoggerService.objects.create(
                 user=request.user,
-                action='SYNC',
+                action='ERROR',
                 table_name='Product',
-                description=f'Synced {successful} products to Pinecone. Failed: {failed}'
+                description=f'Error getting recommendations: {str(e)}'
             )
+            return Response({"error": "Error processing request"}, status=500)
+
+    @extend_schema(
+        request=None,
+        responses={202: ReindexRunSerializer},
+        description="Queue a full reindex of the active catalog into the vector store. Returns the queued run, or the one already in progress; follow it with reindex-status.",
+        tags=['Products']
+    )
+    @action(detail=False, methods=['post'])
+    def sync_all_to_pinecone(self, request):
+        if not request.user.is_staff:
+            return Response({"error": "Not authorized"}, status=403)
             
-            return Response({
-                "message": f"Synced {successful} products to Pinecone. Failed: {failed}",
-                "successful": successful,
-                "failed": failed
-            })
+        try:
+            run = ReindexRun.objects.active()
+            if run is None:
+                with transaction.atomic():
+                    run = ReindexRun.objects.create(requested_by=request.user)
+                    enqueue_reindex(run)
+
+                LoggerService.objects.create(
+                    user=request.user,
+                    action='SYNC',
+                    table_name='Product',
+                    description=f'Queued reindex run {run.pk} of all products'
+                )
+
+            return Response(ReindexRunSerializer(run).data, status=status.HTTP_202_ACCEPTED)
         except Exception as e:
             LoggerService.objects.create(
                 user=request.user,
                 action='ERROR',
                 table_name='Product',
-                description=f'Error syncing all products to Pinecone: {str(e)}'
+                description=f'Error queuing reindex of all products: {str(e)}'
             )
             return Response({"error": f"Error syncing products: {str(e)}"}, status=500)
-        
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='run',
+                type=int,
+                description='Reindex run id; defaults to the latest run',
+                required=False
+            )
+        ],
+        responses={200: ReindexRunSerializer},
+        description="Progress, throughput and checkpoint of a full-catalog reindex run",
+        tags=['Products']
+    )
+    @action(detail=False, methods=['get'], url_path='reindex-status', permission_classes=[permissions.IsAdminUser])
+    def reindex_status(self, request):
+        runs = ReindexRun.objects.order_by('-created_at')
+        run_id = request.query_params.get('run')
+        if run_id and not run_id.isdigit():
+            return Response({"error": "run must be an integer"}, status=400)
+        run = runs.filter(pk=run_id).first() if run_id else runs.first()
+        if run is None:
+            return Response({"error": "Reindex run not found"}, status=404)
+        return Response(ReindexRunSerializer(run).data)
+
+    @extend_schema(
+        description="Hit/miss counters of the catalog response cache and the estimated DB and serializer time saved",
+        tags=['Products']
+    )
+    @action(detail=False, methods=['get'], url_path='cache-stats', permission_classes=[permissions.IsAdminUser])
+    def cache_stats(self, request):
+        return Response(get_cache_stats(CATALOG_CACHE_NAMESPACE))
+
+    @extend_schema(
+        description="Hit/miss counters of the in-process query embedding and similar-results caches and the upstream time they saved",
+        tags=['Products']
+    )
+    @action(detail=False, methods=['get'], url_path='similar-cache-stats', permission_classes=[permissions.IsAdminUser])
+    def similar_cache_stats(self, request):
+        return Response({
+            'embeddings': get_cache_stats(SIMILAR_EMBEDDINGS_NAMESPACE),
+            'results': get_cache_stats(SIMILAR_RESULTS_NAMESPACE),
+        })
+
     @action(detail=True, methods=['get'], url_path='reviews')
     def product_reviews(self, request, pk=None):
         product = self.get_object()
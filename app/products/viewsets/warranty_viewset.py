@@ -2,17 +2,20 @@ from rest_framework import viewsets, status, permissions
 from rest_framework.response import Response
 from core.models import LoggerService
 from core.pagination import CustomPagination
+from core.conditional import ConditionalGetMixin
+from app.products.cache import CATALOG_CACHE_NAMESPACE
 from django.db import transaction
 from app.products.models import Warranty
 from app.products.serializers import WarrantySerializer
 from drf_spectacular.utils import extend_schema
 
 @extend_schema(tags=['Warranty'])
-class WarrantyViewSet(viewsets.ModelViewSet):
+class WarrantyViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Warranty.objects.filter(active=True)
     serializer_class = WarrantySerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     pagination_class = CustomPagination
+    conditional_namespace = CATALOG_CACHE_NAMESPACE
 
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
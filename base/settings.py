@@ -63,6 +63,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'corsheaders',
     'core',
@@ -124,6 +125,27 @@ DATABASES = {
     }
 }
 
+CACHE_BACKEND = config('CACHE_BACKEND', default='django.core.cache.backends.db.DatabaseCache')
+
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': config('CACHE_LOCATION', default='django_cache'),
+    }
+}
+
+# Django's DatabaseCache keeps 300 entries and drops a third of them when full, which is
+# far below what catalog pages and their facet variants alone need.
+if CACHE_BACKEND == 'django.core.cache.backends.db.DatabaseCache':
+    CACHES['default']['OPTIONS'] = {
+        'MAX_ENTRIES': config('CACHE_MAX_ENTRIES', default=100000, cast=int),
+        'CULL_FREQUENCY': config('CACHE_CULL_FREQUENCY', default=10, cast=int),
+    }
+
+RESPONSE_CACHE_TIMEOUT = config('RESPONSE_CACHE_TIMEOUT', default=3600, cast=int)
+
+PAGINATION_EXACT_COUNT_THRESHOLD = config('PAGINATION_EXACT_COUNT_THRESHOLD', default=10000, cast=int)
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
@@ -207,6 +229,8 @@ SWAGGER_SETTINGS = {
 
 PINECONE_INDEX_NAME = config('PINECONE_INDEX_NAME')
 PINECONE_API_KEY = config('PINECONE_API_KEY')
+VECTOR_STORE_BACKEND = config('VECTOR_STORE_BACKEND', default='pinecone')
+VECTOR_STORE_PATH = config('VECTOR_STORE_PATH', default=os.path.join(BASE_DIR, 'vector_store'))
 
 OPENAI_AZURE_API_KEY = config('OPENAI_AZURE_API_KEY')
 OPENAI_AZURE_API_BASE = config('OPENAI_AZURE_API_BASE')
@@ -214,6 +238,38 @@ OPENAI_AZURE_API_VERSION = config('OPENAI_AZURE_API_VERSION')
 OPENAI_BASE_MODEL = config('OPENAI_BASE_MODEL')
 OPENAI_THINKING_MODEL = config('OPENAI_THINKING_MODEL')
 OPENAI_EMBEDDING_MODEL = config('OPENAI_EMBEDDING_MODEL')
+OPENAI_EMBEDDING_BATCH_SIZE = config('OPENAI_EMBEDDING_BATCH_SIZE', default=2048, cast=int)
+OPENAI_EMBEDDING_BATCH_TOKENS = config('OPENAI_EMBEDDING_BATCH_TOKENS', default=300000, cast=int)
+EMBEDDING_CACHE_MAX_ENTRIES = config('EMBEDDING_CACHE_MAX_ENTRIES', default=50000, cast=int)
+SIMILAR_EMBEDDING_CACHE_SIZE = config('SIMILAR_EMBEDDING_CACHE_SIZE', default=1000, cast=int)
+SIMILAR_EMBEDDING_CACHE_TTL = config('SIMILAR_EMBEDDING_CACHE_TTL', default=3600, cast=int)
+SIMILAR_RESULTS_CACHE_SIZE = config('SIMILAR_RESULTS_CACHE_SIZE', default=1000, cast=int)
+SIMILAR_RESULTS_CACHE_TTL = config('SIMILAR_RESULTS_CACHE_TTL', default=60, cast=int)
+
+COOCCURRENCE_TOP_N = config('COOCCURRENCE_TOP_N', default=20, cast=int)
+COOCCURRENCE_MIN_COUNT = config('COOCCURRENCE_MIN_COUNT', default=1, cast=int)
+COOCCURRENCE_METRIC = config('COOCCURRENCE_METRIC', default='cosine')
+COOCCURRENCE_REFRESH_DELAY = config('COOCCURRENCE_REFRESH_DELAY', default=300, cast=int)
+
+TASTE_VECTOR_HALF_LIFE_DAYS = config('TASTE_VECTOR_HALF_LIFE_DAYS', default=90, cast=float)
+RECOMMENDATION_CACHE_SIZE = config('RECOMMENDATION_CACHE_SIZE', default=20, cast=int)
+RECOMMENDATION_CACHE_TTL = config('RECOMMENDATION_CACHE_TTL', default=21600, cast=int)
+RECOMMENDATION_REFRESH_AHEAD = config('RECOMMENDATION_REFRESH_AHEAD', default=600, cast=int)
+RECOMMENDATION_ACTIVE_WINDOW = config('RECOMMENDATION_ACTIVE_WINDOW', default=86400, cast=int)
+
+REINDEX_BATCH_SIZE = config('REINDEX_BATCH_SIZE', default=200, cast=int)
+REINDEX_WORKERS = config('REINDEX_WORKERS', default=4, cast=int)
+REINDEX_CHUNK_SIZE = config('REINDEX_CHUNK_SIZE', default=2000, cast=int)
+
+STOCK_RESERVATION_TTL = config('STOCK_RESERVATION_TTL', default=900, cast=int)
+
+IDEMPOTENCY_KEY_TTL = config('IDEMPOTENCY_KEY_TTL', default=86400, cast=int)
+IDEMPOTENCY_LOCK_TIMEOUT = config('IDEMPOTENCY_LOCK_TIMEOUT', default=120, cast=int)
+IDEMPOTENCY_WAIT_TIMEOUT = config('IDEMPOTENCY_WAIT_TIMEOUT', default=10, cast=float)
+IDEMPOTENCY_POLL_INTERVAL = config('IDEMPOTENCY_POLL_INTERVAL', default=0.1, cast=float)
+
+TAX_RATE = config('TAX_RATE', default='0.16')
+SHIPPING_COST = config('SHIPPING_COST', default='10.00')
 
 USD_TO_BS_RATE = 13
 STRIPE_API_KEY = config('STRIPE_API_KEY')
@@ -1,4 +1,11 @@
 from django.contrib import admin
 from .models import LoggerService
+from .pagination import EstimatedCountPaginator
 
-admin.site.register(LoggerService)
+@admin.register(LoggerService)
+class LoggerServiceAdmin(admin.ModelAdmin):
+    list_display = ('created_at', 'action', 'table_name', 'level', 'user', 'ip_address')
+    list_filter = ('action', 'level')
+    list_select_related = ('user',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
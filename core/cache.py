@@ -0,0 +1,156 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import defaultdict
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+def _version_key(namespace):
+    return f'{namespace}:version'
+
+def _stats_key(namespace, name):
+    return f'{namespace}:stats:{name}'
+
+def get_version(namespace):
+    key = _version_key(namespace)
+    try:
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, time.time_ns(), timeout=None)
+            version = cache.get(key)
+        return version
+    except Exception as e:
+        logger.warning(f"[Cache] Could not read version for {namespace}: {e}")
+        return None
+
+def bump_version(namespace):
+    try:
+        cache.set(_version_key(namespace), time.time_ns(), timeout=None)
+    except Exception as e:
+        logger.warning(f"[Cache] Could not bump version for {namespace}: {e}")
+
+def bump_version_on_commit(namespace):
+    transaction.on_commit(lambda: bump_version(namespace))
+
+class CacheStats:
+    """
+    Counts cache events in process memory and flushes them to the shared cache at most once
+    every flush_interval seconds, so recording a hit does not cost a cache write of its own.
+    """
+    flush_interval = 5
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = defaultdict(int)
+        self._last_flush = time.monotonic()
+
+    def incr(self, namespace, name, delta=1):
+        with self._lock:
+            self._pending[(namespace, name)] += delta
+            if time.monotonic() - self._last_flush < self.flush_interval:
+                return
+        self.flush()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(int)
+            self._last_flush = time.monotonic()
+
+        for (namespace, name), delta in pending.items():
+            key = _stats_key(namespace, name)
+            try:
+                if not cache.add(key, delta, timeout=None):
+                    cache.incr(key, delta)
+                    cache.touch(key, None)
+            except Exception as e:
+                logger.warning(f"[Cache] Could not flush stats for {namespace}: {e}")
+
+cache_stats = CacheStats()
+
+def get_cache_stats(namespace):
+    cache_stats.flush()
+    names = ['hits', 'misses', 'miss_time_ms', 'coalesced']
+    values = cache.get_many([_stats_key(namespace, name) for name in names])
+    hits, misses, miss_time_ms, coalesced = (values.get(_stats_key(namespace, name), 0) for name in names)
+    lookups = hits + misses
+    avg_miss_ms = miss_time_ms / misses if misses else 0
+
+    return {
+        'version': get_version(namespace),
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / lookups, 4) if lookups else 0,
+        'coalesced': coalesced,
+        'avg_miss_ms': round(avg_miss_ms, 2),
+        'estimated_saved_ms': round(hits * avg_miss_ms, 2),
+    }
+
+def build_cache_key(namespace, version, request, view_action, **kwargs):
+    params = sorted(
+        (key, value)
+        for key in request.query_params
+        for value in request.query_params.getlist(key)
+    )
+    raw = f'{view_action}|{sorted(kwargs.items())}|{params}'
+    digest = hashlib.sha256(raw.encode('utf-8')).hexdigest()
+    return f'{namespace}:v{version}:{digest}'
+
+def get_versions(namespaces):
+    """
+    The versions of several namespaces joined into one, or None when any is unavailable.
+    """
+    versions = [get_version(namespace) for namespace in namespaces]
+    if any(version is None for version in versions):
+        return None
+    return '.'.join(str(version) for version in versions)
+
+def cache_response(namespace, timeout=None, depends_on=()):
+    """
+    Caches the data of successful GET responses of a viewset method under a key built
+    from the action, URL kwargs, query params and the current version of the namespace
+    and of the namespaces in depends_on. Bumping any of those versions makes every
+    previously cached page unreachable. Stats are recorded under `namespace`.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(view, request, *args, **kwargs):
+            if request.method != 'GET':
+                return func(view, request, *args, **kwargs)
+
+            version = get_versions((namespace, *depends_on))
+            if version is None:
+                return func(view, request, *args, **kwargs)
+
+            key = build_cache_key(namespace, version, request, func.__name__, **kwargs)
+            try:
+                cached = cache.get(key)
+            except Exception as e:
+                logger.warning(f"[Cache] Lookup failed for {namespace}: {e}")
+                return func(view, request, *args, **kwargs)
+
+            if cached is not None:
+                cache_stats.incr(namespace, 'hits')
+                return Response(cached)
+
+            started = time.perf_counter()
+            response = func(view, request, *args, **kwargs)
+            elapsed_ms = int((time.perf_counter() - started) * 1000)
+
+            if response.status_code == 200 and isinstance(response, Response):
+                cache_stats.incr(namespace, 'misses')
+                cache_stats.incr(namespace, 'miss_time_ms', elapsed_ms)
+                try:
+                    cache.set(key, response.data, timeout or settings.RESPONSE_CACHE_TIMEOUT)
+                except Exception as e:
+                    logger.warning(f"[Cache] Store failed for {namespace}: {e}")
+
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,65 @@
+from django.utils.cache import get_conditional_response
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+from core.cache import get_version
+
+class NotModified(APIException):
+    status_code = status.HTTP_304_NOT_MODIFIED
+    default_detail = 'Not modified.'
+
+class ConditionalGetMixin:
+    """
+    Answers If-None-Match on read actions from the version of a cache namespace, before
+    the handler runs, so an unchanged resource costs a cache read and no query or
+    serialization.
+
+    ETags are per action and per version; clients cache them per URL, so query
+    parameters do not need to be part of the tag. Actions listed in
+    conditional_depends_on also depend on the versions of those namespaces. No
+    Last-Modified is sent: HTTP dates have one-second resolution, so a change in the
+    same second as a client's fetch would be answered with a stale 304.
+    """
+    conditional_namespace = None
+    conditional_actions = ('list', 'retrieve')
+    conditional_depends_on = {}
+
+    def get_conditional_etag(self, request):
+        if request.method not in ('GET', 'HEAD') or self.action not in self.conditional_actions:
+            return None
+
+        namespaces = (self.conditional_namespace, *self.conditional_depends_on.get(self.action, ()))
+        versions = [get_version(namespace) for namespace in namespaces]
+        if any(version is None for version in versions):
+            return None
+
+        return f'"{self.conditional_namespace}-{self.action}-{"-".join(str(version) for version in versions)}"'
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        self.conditional_etag = self.get_conditional_etag(request)
+        if self.conditional_etag is None:
+            return
+
+        if get_conditional_response(request, etag=self.conditional_etag) is not None:
+            raise NotModified()
+
+    def set_conditional_headers(self, response):
+        etag = getattr(self, 'conditional_etag', None)
+        if etag is None:
+            return response
+
+        response['ETag'] = etag
+        return response
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return self.set_conditional_headers(Response(status=status.HTTP_304_NOT_MODIFIED))
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            self.set_conditional_headers(response)
+        return response
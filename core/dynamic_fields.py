@@ -0,0 +1,186 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+FIELDS_PARAM = 'fields'
+EXPAND_PARAM = 'expand'
+READ_METHODS = ('GET', 'HEAD')
+
+def parse_field_tree(values):
+    """
+    Turns ['id,items.quantity', 'items.product.name'] into
+    {'id': {}, 'items': {'quantity': {}, 'product': {'name': {}}}}.
+    An empty dict means the default shape of that field.
+    """
+    tree = {}
+    for raw in values:
+        for path in raw.split(','):
+            node = tree
+            for part in path.strip().split('.'):
+                if part:
+                    node = node.setdefault(part, {})
+    return tree
+
+def get_request_trees(request):
+    if request is None or request.method not in READ_METHODS:
+        return None, None
+
+    fields = request.query_params.getlist(FIELDS_PARAM)
+    expand = request.query_params.getlist(EXPAND_PARAM)
+    if not fields and not expand:
+        return None, None
+
+    return (parse_field_tree(fields) if fields else None), parse_field_tree(expand)
+
+def is_nested(field):
+    return isinstance(field, BaseSerializer)
+
+class DynamicFieldsMixin:
+    """
+    Lets GET requests shape the response with ?fields= and ?expand=, using dotted paths
+    for nested serializers (?fields=id,items.quantity,items.product.name).
+
+    Once either parameter is sent, each serializer keeps the fields listed for it in
+    ?fields= (or all of its plain fields when none are listed), and nested serializers
+    are only kept when they are named in ?fields= or ?expand=. Nested serializers find
+    their part of the request through their parent path, so the mixin has to be on
+    every serializer whose own fields should be pruned. Without the parameters the
+    serializer behaves exactly as before.
+
+    related_hints maps a field name to the relations it reads without a nested
+    serializer (model properties, SerializerMethodFields), so DynamicFieldsViewSetMixin
+    can load them. column_hints maps a field name to the plain columns it reads, so
+    serializer_columns keeps them in only().
+    """
+    related_hints = {}
+    column_hints = {}
+
+    def get_field_path(self):
+        path = []
+        node = self
+        while node.parent is not None:
+            if node.field_name:
+                path.append(node.field_name)
+            node = node.parent
+        return list(reversed(path))
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        fields_tree, expand_tree = get_request_trees(self.context.get('request'))
+        if fields_tree is None and not expand_tree:
+            return fields
+
+        for name in self.get_field_path():
+            fields_tree = (fields_tree or {}).get(name) or None
+            expand_tree = expand_tree.get(name) or {}
+
+        for name in list(fields):
+            if fields_tree is not None:
+                keep = name in fields_tree or name in expand_tree
+            else:
+                keep = not is_nested(fields[name]) or name in expand_tree
+            if not keep:
+                fields.pop(name)
+
+        return fields
+
+def resolve_relation(model, lookup):
+    many = False
+    for part in lookup.split('__'):
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+        if not field.is_relation or field.related_model is None:
+            return None
+        many = many or field.one_to_many or field.many_to_many
+        model = field.related_model
+    return many, model
+
+def plan_related(serializer, model, prefix='', many_chain=False, select=None, prefetch=None):
+    """
+    Walks the (pruned) serializer and collects the select_related and prefetch_related
+    lookups it needs. Relations reached through a to-many hop are prefetched.
+    """
+    select = [] if select is None else select
+    prefetch = [] if prefetch is None else prefetch
+
+    def add(lookup, many):
+        target = prefetch if many else select
+        if lookup not in target:
+            target.append(lookup)
+
+    hints = getattr(serializer, 'related_hints', {})
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+
+        for hint in hints.get(name, ()):
+            relation = resolve_relation(model, hint)
+            if relation is not None:
+                add(prefix + hint, many_chain or relation[0])
+
+        if not is_nested(field):
+            continue
+
+        child = field.child if isinstance(field, ListSerializer) else field
+        if field.source == '*':
+            plan_related(child, model, prefix, many_chain, select, prefetch)
+            continue
+
+        source = field.source.replace('.', '__')
+        relation = resolve_relation(model, source)
+        if relation is None:
+            continue
+
+        many, related_model = relation
+        lookup = prefix + source
+        add(lookup, many_chain or many)
+        plan_related(child, related_model, f'{lookup}__', many_chain or many, select, prefetch)
+
+    return select, prefetch
+
+class DynamicFieldsViewSetMixin:
+    """
+    Rebuilds the queryset's select_related/prefetch_related from the serializer shape
+    requested with ?fields= / ?expand=, so relations that are not serialized are not
+    queried either. Requests without those parameters keep the view's own queryset.
+
+    It hooks filter_queryset rather than get_queryset so views that build their own
+    get_queryset still go through it on list and retrieve.
+    """
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        fields_tree, expand_tree = get_request_trees(self.request)
+        if fields_tree is None and not expand_tree:
+            return queryset
+
+        select, prefetch = plan_related(self.get_serializer(), queryset.model)
+        queryset = queryset.select_related(None).prefetch_related(None)
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
+def serializer_columns(serializer, model, prefix='', extra=()):
+    """
+    The concrete columns of `model` that `serializer` reads, as only() paths under
+    `prefix`: fields whose source is a column, the column_hints, the first hop of
+    related_hints, the primary key and `extra` (such as the foreign keys a
+    select_related follows).
+    """
+    concrete = {field.name for field in model._meta.concrete_fields}
+    columns = {model._meta.pk.name, *extra}
+
+    hints = getattr(serializer, 'related_hints', {})
+    column_hints = getattr(serializer, 'column_hints', {})
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        sources = [field.source.split('.')[0], *column_hints.get(name, ())]
+        sources += [hint.split('__')[0] for hint in hints.get(name, ())]
+        columns.update(source for source in sources if source in concrete)
+
+    return [prefix + column for column in sorted(columns)]
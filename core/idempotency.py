@@ -0,0 +1,84 @@
+import hashlib
+import json
+import time
+from functools import wraps
+from django.conf import settings
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from core.models import IdempotencyKey
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+
+IDEMPOTENCY_KEY_PARAMETER = OpenApiParameter(
+    name=IDEMPOTENCY_HEADER,
+    type=OpenApiTypes.STR,
+    location=OpenApiParameter.HEADER,
+    required=False,
+    description='Client-generated key; retries with the same key and body return the first response without running the request again'
+)
+
+def request_fingerprint(request):
+    payload = json.dumps([request.method, request.path, request.data], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def replay(record):
+    return Response(record.response_body, status=record.response_status, headers={REPLAYED_HEADER: 'true'})
+
+def idempotent(scope):
+    """
+    Makes a view method safe to retry when the client sends an Idempotency-Key header.
+
+    The first request with a key claims it and runs; a successful (2xx) response is
+    stored and replayed to later requests with the same key and body until the key
+    expires. A duplicate that arrives while the first is still running waits up to
+    IDEMPOTENCY_WAIT_TIMEOUT seconds for its response instead of running in parallel.
+    Failed requests release the key, so they can be retried. A request that overran
+    IDEMPOTENCY_LOCK_TIMEOUT and was taken over by a retry leaves the key to the retry.
+    Requests without the header are not affected.
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if not key or not request.user.is_authenticated:
+                return view_method(self, request, *args, **kwargs)
+            if len(key) > 255:
+                return Response({'error': f'{IDEMPOTENCY_HEADER} must be at most 255 characters'}, status=status.HTTP_400_BAD_REQUEST)
+
+            fingerprint = request_fingerprint(request)
+            deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_TIMEOUT
+            while True:
+                record, claimed = IdempotencyKey.objects.claim(request.user, scope, key, fingerprint)
+                if claimed:
+                    break
+                if record.fingerprint != fingerprint:
+                    return Response(
+                        {'error': f'{IDEMPOTENCY_HEADER} was already used for a different request'},
+                        status=status.HTTP_422_UNPROCESSABLE_ENTITY
+                    )
+                if record.status == IdempotencyKey.STATUS_COMPLETED:
+                    return replay(record)
+                if time.monotonic() >= deadline:
+                    return Response(
+                        {'error': f'A request with this {IDEMPOTENCY_HEADER} is still being processed'},
+                        status=status.HTTP_409_CONFLICT
+                    )
+                time.sleep(settings.IDEMPOTENCY_POLL_INTERVAL)
+
+            try:
+                response = view_method(self, request, *args, **kwargs)
+            except Exception:
+                record.release()
+                raise
+
+            if status.is_success(response.status_code) and hasattr(response, 'data'):
+                record.complete(response.status_code, json.loads(JSONRenderer().render(response.data)))
+            else:
+                record.release()
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,117 @@
+import threading
+import time
+from collections import OrderedDict
+
+from core.cache import cache_stats
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one: the first caller runs the
+    function and the others wait for its result (or its exception). This only coalesces
+    calls inside one process, i.e. between the threads of a threaded worker.
+    """
+    class Call:
+        def __init__(self):
+            self.event = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        """
+        Returns (result, shared), where shared is True when the result came from another
+        caller's run.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self.Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result, False
+
+class TTLCache:
+    """
+    Bounded in-process LRU cache whose entries also expire after ttl seconds.
+
+    get_or_compute() runs misses through a SingleFlight, so concurrent misses for the
+    same key cost one computation, and records hits, misses, coalesced waits and the
+    time spent computing misses in cache_stats under `namespace`.
+    """
+    def __init__(self, namespace, maxsize, ttl):
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._flight = SingleFlight()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns the cached value for key, computing and storing it on a miss. None results
+        are returned but not cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            cache_stats.incr(self.namespace, 'hits')
+            return value
+
+        def run():
+            started = time.perf_counter()
+            result = compute()
+            elapsed_ms = int((time.perf_counter() - started) * 1000)
+            cache_stats.incr(self.namespace, 'misses')
+            cache_stats.incr(self.namespace, 'miss_time_ms', elapsed_ms)
+            if result is not None:
+                self.set(key, result)
+            return result
+
+        value, shared = self._flight.do(key, run)
+        if shared:
+            cache_stats.incr(self.namespace, 'hits')
+            cache_stats.incr(self.namespace, 'coalesced')
+        return value
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from core.models import IdempotencyKey
+
+class Command(BaseCommand):
+    help = 'Deletes idempotency keys whose TTL has passed'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Keys deleted per DELETE')
+
+    def handle(self, *args, **options):
+        purged = IdempotencyKey.objects.purge_expired(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Purged {purged} expired idempotency keys'))
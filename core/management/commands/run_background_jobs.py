@@ -0,0 +1,60 @@
+import signal
+import time
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils.module_loading import import_string
+from core.models import BackgroundJob, IdempotencyKey, LoggerService
+
+class Command(BaseCommand):
+    help = 'Runs queued background jobs (product vector sync and others) until stopped'
+    purge_interval = 3600
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10, help='Jobs claimed per poll')
+        parser.add_argument('--sleep', type=float, default=2.0, help='Seconds to wait when the queue is empty')
+        parser.add_argument('--stale-timeout', type=int, default=900, help='Seconds after which a running job is considered abandoned')
+        parser.add_argument('--keep-days', type=int, default=7, help='Days to keep finished jobs before purging them')
+        parser.add_argument('--once', action='store_true', help='Process the jobs that are due and exit')
+
+    def handle(self, *args, **options):
+        self.running = True
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        self.stdout.write('Background job worker started')
+        last_purge = 0
+        while self.running:
+            close_old_connections()
+            BackgroundJob.objects.release_stale(options['stale_timeout'])
+
+            jobs = BackgroundJob.objects.claim(options['batch_size'])
+            for job in jobs:
+                self.run_job(job)
+
+            if options['once'] and not jobs:
+                break
+            if not jobs:
+                if time.monotonic() - last_purge > self.purge_interval:
+                    BackgroundJob.objects.purge_finished(options['keep_days'])
+                    IdempotencyKey.objects.purge_expired()
+                    last_purge = time.monotonic()
+                time.sleep(options['sleep'])
+
+        self.stdout.write('Background job worker stopped')
+
+    def stop(self, *args):
+        self.running = False
+
+    def run_job(self, job):
+        try:
+            handler = import_string(job.kind)
+            handler(**job.payload)
+            job.mark_done()
+        except Exception as e:
+            job.retry_or_fail(e)
+            LoggerService.objects.create(
+                action='ERROR',
+                table_name='BackgroundJob',
+                description=f'Error running job {job.id} ({job.kind} {job.key}), attempt {job.attempts}: {str(e)}',
+                level='ERROR'
+            )
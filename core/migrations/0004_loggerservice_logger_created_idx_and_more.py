@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_alter_loggerservice_options_loggerservice_ip_address'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='loggerservice',
+            index=models.Index(fields=['-created_at', '-id'], name='logger_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loggerservice',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='logger_user_created_idx'),
+        ),
+    ]
@@ -1,2 +1,5 @@
 from core.models.base_model import TimestampedModel
-from core.models.logger_service_model import LoggerService
\ No newline at end of file
+from core.models.logger_service_model import LoggerService
+from core.models.embedding_cache_model import EmbeddingCache
+from core.models.background_job_model import BackgroundJob
+from core.models.idempotency_key_model import IdempotencyKey
@@ -0,0 +1,147 @@
+from datetime import timedelta
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from core.models.base_model import TimestampedModel
+
+class BackgroundJobManager(models.Manager):
+    def enqueue(self, kind, key='', payload=None, delay=0):
+        """
+        Queues a call to the dotted handler path `kind` with `payload` as keyword arguments.
+        A job that is still pending for the same (kind, key) is reused, so repeated edits of
+        the same object collapse into one run with the latest payload.
+        """
+        payload = payload or {}
+        run_at = timezone.now() + timedelta(seconds=delay)
+
+        pending = self.filter(kind=kind, key=key, status=BackgroundJob.STATUS_PENDING)
+        if pending.update(payload=payload, run_at=run_at, updated_at=timezone.now()):
+            return
+
+        try:
+            with transaction.atomic():
+                self.create(kind=kind, key=key, payload=payload, run_at=run_at)
+        except IntegrityError:
+            pending.update(payload=payload, run_at=run_at, updated_at=timezone.now())
+
+    def enqueue_on_commit(self, kind, key='', payload=None, delay=0):
+        transaction.on_commit(lambda: self.enqueue(kind, key, payload, delay), robust=True)
+
+    def claim(self, batch_size=10):
+        """
+        Locks due pending jobs with SELECT ... FOR UPDATE SKIP LOCKED, so several workers
+        can poll the table without blocking each other, and marks them running.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            jobs = list(
+                self.select_for_update(skip_locked=True).filter(
+                    status=BackgroundJob.STATUS_PENDING,
+                    run_at__lte=now
+                ).order_by('run_at', 'id')[:batch_size]
+            )
+            if jobs:
+                self.filter(pk__in=[job.pk for job in jobs]).update(
+                    status=BackgroundJob.STATUS_RUNNING,
+                    locked_at=now,
+                    attempts=F('attempts') + 1,
+                    updated_at=now
+                )
+                for job in jobs:
+                    job.status = BackgroundJob.STATUS_RUNNING
+                    job.locked_at = now
+                    job.attempts += 1
+        return jobs
+
+    def purge_finished(self, days):
+        deleted, _ = self.filter(
+            status=BackgroundJob.STATUS_DONE,
+            updated_at__lt=timezone.now() - timedelta(days=days)
+        ).delete()
+        return deleted
+
+    def release_stale(self, timeout):
+        """
+        Puts jobs left running by a worker that died back in the queue.
+        """
+        stale = self.filter(
+            status=BackgroundJob.STATUS_RUNNING,
+            locked_at__lt=timezone.now() - timedelta(seconds=timeout)
+        )
+        released = 0
+        for job in stale:
+            job.retry_or_fail('Worker stopped before finishing the job')
+            released += 1
+        return released
+
+class BackgroundJob(TimestampedModel):
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    kind = models.CharField(max_length=200)
+    key = models.CharField(max_length=200, blank=True, default='')
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(null=True, blank=True)
+
+    objects = BackgroundJobManager()
+
+    backoff_base = 30
+    backoff_max = 3600
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['kind', 'key'],
+                condition=Q(status='pending'),
+                name='background_job_pending_uniq'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['status', 'run_at'], name='background_job_due_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} [{self.key}] - {self.status}"
+
+    def mark_done(self):
+        self.status = self.STATUS_DONE
+        self.locked_at = None
+        self.save(update_fields=['status', 'locked_at', 'updated_at'])
+
+    def retry_or_fail(self, error):
+        """
+        Schedules another attempt with exponential backoff, or marks the job failed once
+        max_attempts is reached. If a newer job for the same key is already pending, that
+        job carries the work forward and this one is closed.
+        """
+        self.last_error = str(error)
+        self.locked_at = None
+
+        if self.attempts >= self.max_attempts:
+            self.status = self.STATUS_FAILED
+            self.save(update_fields=['status', 'locked_at', 'last_error', 'updated_at'])
+            return
+
+        delay = min(self.backoff_base * 2 ** max(self.attempts - 1, 0), self.backoff_max)
+        self.status = self.STATUS_PENDING
+        self.run_at = timezone.now() + timedelta(seconds=delay)
+        try:
+            with transaction.atomic():
+                self.save(update_fields=['status', 'run_at', 'locked_at', 'last_error', 'updated_at'])
+        except IntegrityError:
+            self.status = self.STATUS_DONE
+            self.save(update_fields=['status', 'locked_at', 'last_error', 'updated_at'])
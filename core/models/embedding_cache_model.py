@@ -0,0 +1,109 @@
+import hashlib
+import logging
+import unicodedata
+from array import array
+from datetime import timedelta
+from django.conf import settings
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+from core.models.base_model import TimestampedModel
+
+logger = logging.getLogger(__name__)
+
+def normalize_embedding_text(text):
+    return ' '.join(unicodedata.normalize('NFC', text).split())
+
+def hash_embedding_text(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+class EmbeddingCacheManager(models.Manager):
+    touch_interval = timedelta(hours=1)
+    evict_every = 100
+
+    _stores_since_eviction = 0
+
+    def get_vector(self, model, text):
+        return self.get_vectors(model, [text]).get(text)
+
+    def get_vectors(self, model, texts):
+        hashes = {hash_embedding_text(text): text for text in texts}
+        entries = self.filter(model=model, text_hash__in=list(hashes)).only(
+            'pk', 'text_hash', 'vector', 'last_used_at'
+        )
+
+        now = timezone.now()
+        vectors, stale = {}, []
+        for entry in entries:
+            vectors[hashes[entry.text_hash]] = entry.get_vector()
+            if now - entry.last_used_at > self.touch_interval:
+                stale.append(entry.pk)
+
+        if stale:
+            self.filter(pk__in=stale).update(last_used_at=now)
+        return vectors
+
+    def store_vector(self, model, text, vector):
+        self.store_vectors(model, {text: vector})
+
+    def store_vectors(self, model, vectors):
+        now = timezone.now()
+        self.bulk_create(
+            [
+                self.model(
+                    model=model,
+                    text_hash=hash_embedding_text(text),
+                    dimensions=len(vector),
+                    vector=array('f', vector).tobytes(),
+                    last_used_at=now,
+                )
+                for text, vector in vectors.items()
+            ],
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=['model', 'text_hash'],
+            update_fields=['dimensions', 'vector', 'last_used_at', 'updated_at'],
+        )
+
+        EmbeddingCacheManager._stores_since_eviction += len(vectors)
+        if EmbeddingCacheManager._stores_since_eviction >= self.evict_every:
+            EmbeddingCacheManager._stores_since_eviction = 0
+            self.evict()
+
+    def evict(self, max_entries=None):
+        """
+        Deletes the least recently used entries beyond max_entries
+        (settings.EMBEDDING_CACHE_MAX_ENTRIES by default).
+        """
+        max_entries = settings.EMBEDDING_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        cutoff = list(
+            self.order_by('-last_used_at', '-id').values_list('last_used_at', 'id')[max_entries:max_entries + 1]
+        )
+        if not cutoff:
+            return 0
+
+        last_used_at, pk = cutoff[0]
+        deleted, _ = self.filter(
+            Q(last_used_at__lt=last_used_at) | Q(last_used_at=last_used_at, id__lte=pk)
+        ).delete()
+        logger.info(f"[EmbeddingCache] Evicted {deleted} entries")
+        return deleted
+
+class EmbeddingCache(TimestampedModel):
+    model = models.CharField(max_length=100)
+    text_hash = models.CharField(max_length=64)
+    dimensions = models.PositiveIntegerField()
+    vector = models.BinaryField()
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    objects = EmbeddingCacheManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['model', 'text_hash'], name='embedding_cache_model_hash_uniq'),
+        ]
+
+    def get_vector(self):
+        vector = array('f')
+        vector.frombytes(bytes(self.vector))
+        return vector.tolist()
@@ -0,0 +1,127 @@
+from datetime import timedelta
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.utils import timezone
+from core.models.base_model import TimestampedModel
+
+class IdempotencyKeyManager(models.Manager):
+    def claim(self, user, scope, key, fingerprint):
+        """
+        Returns (record, claimed). claimed is True when the caller now owns the key and
+        must run the request: the key was new, had expired, or its previous owner held
+        the lock past locked_until without finishing.
+        """
+        now = timezone.now()
+        try:
+            with transaction.atomic():
+                record = self.create(
+                    user=user,
+                    scope=scope,
+                    key=key,
+                    fingerprint=fingerprint,
+                    locked_until=now + timedelta(seconds=settings.IDEMPOTENCY_LOCK_TIMEOUT),
+                    expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+                )
+            return record, True
+        except IntegrityError:
+            pass
+
+        record = self.filter(user=user, scope=scope, key=key).first()
+        if record is None:
+            return self.claim(user, scope, key, fingerprint)
+
+        if record.expires_at <= now:
+            self.filter(pk=record.pk, expires_at__lte=now).delete()
+            return self.claim(user, scope, key, fingerprint)
+
+        if record.status == IdempotencyKey.STATUS_IN_PROGRESS and record.locked_until <= now and record.fingerprint == fingerprint:
+            locked_until = now + timedelta(seconds=settings.IDEMPOTENCY_LOCK_TIMEOUT)
+            taken = self.filter(
+                pk=record.pk,
+                status=IdempotencyKey.STATUS_IN_PROGRESS,
+                locked_until=record.locked_until
+            ).update(locked_until=locked_until, updated_at=now)
+            if taken:
+                record.locked_until = locked_until
+                return record, True
+
+        return record, False
+
+    def purge_expired(self, batch_size=1000):
+        """
+        Deletes expired keys batch_size rows at a time. Returns the number deleted.
+        """
+        purged = 0
+        while True:
+            ids = list(self.filter(expires_at__lte=timezone.now()).values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                return purged
+            deleted, _ = self.filter(pk__in=ids).delete()
+            purged += deleted
+
+class IdempotencyKey(TimestampedModel):
+    """
+    The outcome of a request sent with an Idempotency-Key header, stored per user and
+    endpoint scope so retries replay it instead of running the request again.
+    """
+    STATUS_IN_PROGRESS = 'in_progress'
+    STATUS_COMPLETED = 'completed'
+
+    STATUS_CHOICES = [
+        (STATUS_IN_PROGRESS, 'In progress'),
+        (STATUS_COMPLETED, 'Completed'),
+    ]
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+')
+    scope = models.CharField(max_length=100)
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_IN_PROGRESS)
+    response_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.JSONField(null=True, blank=True)
+    locked_until = models.DateTimeField()
+    expires_at = models.DateTimeField(db_index=True)
+
+    objects = IdempotencyKeyManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'scope', 'key'], name='idempotency_key_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.scope} {self.key} - {self.status}"
+
+    def owned(self):
+        """
+        This record's row while its lock is still the one this request claimed. A request
+        that overran IDEMPOTENCY_LOCK_TIMEOUT may have been taken over by a retry, which
+        moved locked_until on, and must then leave the row to the retry.
+        """
+        return IdempotencyKey.objects.filter(
+            pk=self.pk,
+            status=self.STATUS_IN_PROGRESS,
+            locked_until=self.locked_until
+        )
+
+    def complete(self, response_status, response_body):
+        """
+        Stores the response for replay. Returns False when the key was taken over.
+        """
+        self.status = self.STATUS_COMPLETED
+        self.response_status = response_status
+        self.response_body = response_body
+        return bool(self.owned().update(
+            status=self.status,
+            response_status=response_status,
+            response_body=response_body,
+            updated_at=timezone.now()
+        ))
+
+    def release(self):
+        """
+        Deletes the key after a failed request so it can be retried, unless it was
+        taken over. Returns whether it was deleted.
+        """
+        deleted, _ = self.owned().delete()
+        return bool(deleted)
@@ -34,5 +34,9 @@ class LoggerService(TimestampedModel):
         
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='logger_created_idx'),
+            models.Index(fields=['user', '-created_at', '-id'], name='logger_user_created_idx'),
+        ]
         verbose_name = 'Logger Service'
         verbose_name_plural = 'Logger Services'
\ No newline at end of file
@@ -1,14 +1,177 @@
+import base64
+import json
+import logging
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
-from django.core.paginator import InvalidPage
-from rest_framework.exceptions import NotFound
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.core.paginator import EmptyPage, InvalidPage, Page, Paginator
+from django.db import connections, models
+from django.db.models import Q
+from django.db.models.expressions import Col
+from django.db.models.lookups import Exact
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound, ValidationError
+
+logger = logging.getLogger(__name__)
+
+def estimate_count(queryset):
+    """
+    Returns the PostgreSQL planner's row estimate for the queryset: pg_class.reltuples for an
+    unfiltered table, EXPLAIN's top-level row estimate otherwise. None when no estimate is
+    available (other database backends, never-analyzed tables or planner errors).
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+
+    query = queryset.query
+    try:
+        with connection.cursor() as cursor:
+            if not query.where and not query.distinct and not query.combinator:
+                cursor.execute(
+                    'SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+                estimate = row[0] if row else None
+            else:
+                sql, params = queryset.order_by().query.sql_with_params()
+                cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                estimate = plan[0]['Plan']['Plan Rows']
+    except Exception as e:
+        logger.warning(f"[Pagination] Could not estimate count for {queryset.model.__name__}: {e}")
+        return None
+
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+class EstimatedCountPage(Page):
+    def __init__(self, object_list, number, paginator, has_more):
+        super().__init__(object_list, number, paginator)
+        self.has_more = has_more
+
+    def has_next(self):
+        return self.has_more
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that reports the planner's estimate as its count once the estimate reaches
+    settings.PAGINATION_EXACT_COUNT_THRESHOLD, and an exact COUNT(*) below it. Pages are
+    sliced without trusting the estimate, so has_next() comes from fetching one extra row.
+    """
+    is_estimated = False
+
+    @cached_property
+    def count(self):
+        if hasattr(self.object_list, 'query'):
+            estimate = estimate_count(self.object_list)
+            if estimate is not None and estimate >= settings.PAGINATION_EXACT_COUNT_THRESHOLD:
+                self.is_estimated = True
+                return estimate
+        return super().count
+
+    def validate_number(self, number):
+        if not self.is_estimated:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise InvalidPage(self.error_messages['invalid_page'])
+        if number < 1:
+            raise EmptyPage(self.error_messages['min_page'])
+        return number
+
+    def page(self, number):
+        if self.count and not self.is_estimated:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages['no_results'])
+        return EstimatedCountPage(rows[:self.per_page], number, self, len(rows) > self.per_page)
 
 class CustomPagination(PageNumberPagination):
+    """
+    Page number pagination with an optional keyset (cursor) mode and an optional
+    estimated-count mode.
+
+    Views select cursor mode with pagination_mode = 'cursor'; any request can also ask for
+    it with ?pagination=cursor or by sending a cursor, and a ?page= request stays in page
+    mode. Cursor pages are fetched with a WHERE on the view's cursor_ordering (created_at,
+    id by default) instead of OFFSET and skip the COUNT(*), so every page costs the same
+    no matter how deep it is. Only non-null, indexed columns can order a cursor.
+
+    sort_by accepts the view's sort_by_fields, or the cursor_ordering fields when the
+    view does not list any; other values are rejected with a 400.
+
+    In page mode, views can set pagination_count = 'estimated' (or requests can send
+    ?count=estimated) to report the planner's estimate as the total on large scans;
+    total_is_estimated tells the client which kind of total it got.
+    """
     page_size = 200
     page_size_query_param = 'page_size'
     max_page_size = 200
-    
+
+    mode_query_param = 'pagination'
+    cursor_query_param = 'cursor'
+    cursor_ordering = ('-created_at', '-id')
+
+    count_query_param = 'count'
+
+    mode = 'page'
+
+    def get_mode(self, request, view):
+        mode = request.query_params.get(self.mode_query_param)
+        if mode in ('page', 'cursor'):
+            return mode
+        if request.query_params.get(self.cursor_query_param):
+            return 'cursor'
+        if request.query_params.get(self.page_query_param):
+            return 'page'
+        return getattr(view, 'pagination_mode', 'page')
+
+    def get_count_mode(self, request, view):
+        count_mode = request.query_params.get(self.count_query_param)
+        if count_mode in ('exact', 'estimated'):
+            return count_mode
+        return getattr(view, 'pagination_count', 'exact')
+
+    def get_sort_by_fields(self, queryset, view):
+        fields = getattr(view, 'sort_by_fields', None)
+        if fields is not None:
+            return fields
+        columns = {field.name for field in queryset.model._meta.concrete_fields}
+        ordering = getattr(view, 'cursor_ordering', self.cursor_ordering)
+        return [field.lstrip('-') for field in ordering if field.lstrip('-') in columns]
+
+    def get_sort_by(self, request, queryset, view):
+        sort_by = request.query_params.get('sort_by')
+        if not sort_by:
+            return None
+        fields = self.get_sort_by_fields(queryset, view)
+        if sort_by not in fields:
+            raise ValidationError({'sort_by': f'Expected one of: {", ".join(fields)}'})
+        sort_order = request.query_params.get('sort_order', 'asc').lower()
+        return ('-' if sort_order == 'desc' else '') + sort_by
+
     def get_paginated_response(self, data):
+        if self.mode == 'cursor':
+            return Response({
+                'items': data,
+                'page_size': self.page_size_value,
+                'has_next': self.has_next,
+                'has_prev': self.has_prev,
+                'next_cursor': self.next_cursor,
+                'prev_cursor': self.prev_cursor,
+            })
+
         return Response({
             'items': data,
             'total': self.page.paginator.count,
@@ -17,23 +180,31 @@ class CustomPagination(PageNumberPagination):
             'pages': self.page.paginator.num_pages,
             'has_next': self.page.has_next(),
             'has_prev': self.page.has_previous(),
+            'total_is_estimated': getattr(self.page.paginator, 'is_estimated', False),
         })
-    
+
     def paginate_queryset(self, queryset, request, view=None):
-        sort_by = request.query_params.get('sort_by')
-        sort_order = request.query_params.get('sort_order', 'asc').lower()
-        
+        self.request = request
+        self.mode = self.get_mode(request, view)
+        sort_by = self.get_sort_by(request, queryset, view)
+
+        if self.mode == 'cursor':
+            return self.paginate_cursor(queryset, request, view, sort_by)
+
         if sort_by:
-            order_prefix = '-' if sort_order == 'desc' else ''
-            queryset = queryset.order_by(f'{order_prefix}{sort_by}')
-        
+            queryset = queryset.order_by(sort_by)
+
         page_size = self.get_page_size(request)
         if not page_size:
             return None
 
-        paginator = self.django_paginator_class(queryset, page_size)
+        paginator_class = self.django_paginator_class
+        if self.get_count_mode(request, view) == 'estimated':
+            paginator_class = EstimatedCountPaginator
+
+        paginator = paginator_class(queryset, page_size)
         page_number = request.query_params.get(self.page_query_param, 1)
-        
+
         try:
             self.page = paginator.page(page_number)
         except InvalidPage as exc:
@@ -45,5 +216,178 @@ class CustomPagination(PageNumberPagination):
         if paginator.num_pages > 1 and self.template is not None:
             self.display_page_controls = True
 
-        self.request = request
-        return list(self.page)
\ No newline at end of file
+        return list(self.page)
+
+    def get_pinned_fields(self, queryset):
+        """
+        Names of the columns the queryset pins with a top-level equality filter, such as
+        active=True or user=..., which a composite index can skip over before the cursor
+        column.
+        """
+        query = queryset.query
+        if query.where.connector != 'AND' or query.where.negated:
+            return set()
+        return {
+            child.lhs.target.name
+            for child in query.where.children
+            if isinstance(child, Exact) and isinstance(child.lhs, Col) and child.lhs.alias == query.base_table
+        }
+
+    def get_cursor_field(self, model, name, pinned=()):
+        """
+        The model field behind a cursor ordering entry, or None when it is nullable or not
+        the primary key, unique or the leading column of a B-tree index (after the index
+        columns in `pinned`), since keyset comparisons skip NULLs and need an index that
+        can seek on the field to stay cheap.
+        """
+        try:
+            field = model._meta.pk if name == 'pk' else model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.null:
+            return None
+
+        def leads(index):
+            columns = [entry.lstrip('-') for entry in index.fields]
+            while columns and columns[0] in pinned:
+                columns.pop(0)
+            return bool(columns) and columns[0] == name
+
+        indexed = field.primary_key or field.unique or field.db_index or any(
+            type(index) is models.Index and leads(index) for index in model._meta.indexes
+        )
+        return field if indexed else None
+
+    def get_cursor_ordering(self, queryset, view, sort_by):
+        if sort_by:
+            prefix = '-' if sort_by.startswith('-') else ''
+            ordering = (sort_by, f'{prefix}id')
+        else:
+            ordering = tuple(getattr(view, 'cursor_ordering', self.cursor_ordering))
+
+        pinned = self.get_pinned_fields(queryset)
+        for entry in ordering:
+            if self.get_cursor_field(queryset.model, entry.lstrip('-'), pinned) is None:
+                raise ValidationError({'sort_by': f'{entry.lstrip("-")} cannot order cursor pagination'})
+        return ordering
+
+    def encode_cursor(self, ordering, values, backwards):
+        payload = json.dumps({'o': list(ordering), 'v': values, 'b': backwards}, default=str)
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+    def decode_cursor(self, raw, ordering, model):
+        """
+        Returns (values, backwards), with each value converted by its field's to_python so
+        a tampered cursor is rejected here rather than by the database.
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(raw.encode('ascii')).decode('utf-8'))
+            values, backwards = payload['v'], bool(payload['b'])
+        except (ValueError, TypeError, KeyError, AttributeError):
+            raise NotFound('Invalid cursor')
+
+        if payload.get('o') != list(ordering) or not isinstance(values, list) or len(values) != len(ordering):
+            raise NotFound('Invalid cursor')
+
+        converted = []
+        for entry, value in zip(ordering, values):
+            name = entry.lstrip('-')
+            field = model._meta.pk if name == 'pk' else model._meta.get_field(name)
+            try:
+                value = field.to_python(value)
+            except (DjangoValidationError, TypeError, ValueError):
+                raise NotFound('Invalid cursor')
+            if value is None:
+                raise NotFound('Invalid cursor')
+            converted.append(value)
+        return converted, backwards
+
+    def keyset_filter(self, ordering, values, backwards):
+        """
+        Builds (a > x) OR (a = x AND b > y) ... for the given ordering, flipping each
+        comparison for descending fields and again when paging backwards.
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(ordering, values):
+            descending = field.startswith('-')
+            name = field.lstrip('-')
+            lookup = 'lt' if descending != backwards else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def get_cursor_values(self, instance, ordering):
+        values = []
+        for field in ordering:
+            name = field.lstrip('-')
+            if name == 'pk':
+                values.append(instance.pk)
+            else:
+                values.append(getattr(instance, instance._meta.get_field(name).attname))
+        return values
+
+    def paginate_cursor(self, queryset, request, view, sort_by):
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        ordering = self.get_cursor_ordering(queryset, view, sort_by)
+        raw_cursor = request.query_params.get(self.cursor_query_param)
+        backwards = False
+
+        if raw_cursor:
+            values, backwards = self.decode_cursor(raw_cursor, ordering, queryset.model)
+            queryset = queryset.filter(self.keyset_filter(ordering, values, backwards))
+
+        if backwards:
+            reversed_ordering = [field[1:] if field.startswith('-') else f'-{field}' for field in ordering]
+            queryset = queryset.order_by(*reversed_ordering)
+        else:
+            queryset = queryset.order_by(*ordering)
+
+        results = list(queryset[:page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+        if backwards:
+            results.reverse()
+
+        self.page_size_value = page_size
+        self.has_next = has_more if not backwards else True
+        self.has_prev = bool(raw_cursor) if not backwards else has_more
+
+        self.next_cursor = None
+        self.prev_cursor = None
+        if results and self.has_next:
+            self.next_cursor = self.encode_cursor(ordering, self.get_cursor_values(results[-1], ordering), False)
+        if results and self.has_prev:
+            self.prev_cursor = self.encode_cursor(ordering, self.get_cursor_values(results[0], ordering), True)
+
+        return results
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.extend([
+            {
+                'name': self.mode_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Pagination mode: "page" (default) or "cursor"',
+                'schema': {'type': 'string', 'enum': ['page', 'cursor']},
+            },
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Opaque cursor returned as next_cursor or prev_cursor by a previous cursor page',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.count_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Total count mode: "exact" (default) or "estimated" from planner statistics',
+                'schema': {'type': 'string', 'enum': ['exact', 'estimated']},
+            },
+        ])
+        return parameters
@@ -1,3 +1,79 @@
+from datetime import timedelta
 from django.test import TestCase
+from django.utils import timezone
+from app.authentication.models import User
+from core.models import IdempotencyKey
 
-# Create your tests here.
+class IdempotencyKeyClaimTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='client@example.com', password='secret')
+
+    def claim(self, fingerprint='a'):
+        return IdempotencyKey.objects.claim(self.user, 'orders.create', 'key-1', fingerprint)
+
+    def expire_lock(self):
+        IdempotencyKey.objects.update(locked_until=timezone.now() - timedelta(seconds=1))
+
+    def test_first_claim_owns_the_key(self):
+        record, claimed = self.claim()
+
+        self.assertTrue(claimed)
+        self.assertEqual(record.status, IdempotencyKey.STATUS_IN_PROGRESS)
+
+    def test_claim_while_locked_is_refused(self):
+        first, _ = self.claim()
+        record, claimed = self.claim()
+
+        self.assertFalse(claimed)
+        self.assertEqual(record.pk, first.pk)
+
+    def test_completed_key_is_replayed(self):
+        first, _ = self.claim()
+        self.assertTrue(first.complete(201, {'id': 1}))
+        self.expire_lock()
+
+        record, claimed = self.claim()
+        self.assertFalse(claimed)
+        self.assertEqual((record.response_status, record.response_body), (201, {'id': 1}))
+
+    def test_stale_lock_is_taken_over_only_with_the_same_fingerprint(self):
+        stale, _ = self.claim()
+        self.expire_lock()
+
+        self.assertFalse(self.claim('b')[1])
+        record, claimed = self.claim()
+        self.assertTrue(claimed)
+        self.assertGreater(record.locked_until, timezone.now())
+
+        self.assertFalse(stale.complete(500, {}))
+        self.assertFalse(stale.release())
+        self.assertTrue(IdempotencyKey.objects.filter(pk=record.pk, status=IdempotencyKey.STATUS_IN_PROGRESS).exists())
+
+        self.assertTrue(record.complete(201, {'id': 2}))
+        self.assertEqual(IdempotencyKey.objects.get(pk=record.pk).response_body, {'id': 2})
+
+    def test_released_key_can_be_claimed_again(self):
+        first, _ = self.claim()
+
+        self.assertTrue(first.release())
+        record, claimed = self.claim()
+        self.assertTrue(claimed)
+        self.assertNotEqual(record.pk, first.pk)
+
+    def test_expired_key_is_reclaimed(self):
+        first, _ = self.claim()
+        first.complete(201, {'id': 1})
+        IdempotencyKey.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        record, claimed = self.claim('b')
+        self.assertTrue(claimed)
+        self.assertEqual(record.fingerprint, 'b')
+        self.assertEqual(IdempotencyKey.objects.count(), 1)
+
+    def test_purge_expired(self):
+        self.claim()
+        IdempotencyKey.objects.claim(self.user, 'orders.create', 'key-2', 'a')
+        IdempotencyKey.objects.filter(key='key-1').update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        self.assertEqual(IdempotencyKey.objects.purge_expired(batch_size=1), 1)
+        self.assertEqual(list(IdempotencyKey.objects.values_list('key', flat=True)), ['key-2'])
@@ -1,6 +1,7 @@
 from rest_framework import viewsets, status, permissions
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from rest_framework.exceptions import APIException
 from django.db import models
 from ..models import LoggerService
 from ..serializers import LoggerServiceSerializer
@@ -17,6 +18,8 @@ class LoggerServiceViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = LoggerServiceSerializer
     permission_classes = [permissions.IsAdminUser]
     pagination_class = CustomPagination
+    pagination_count = 'estimated'
+    sort_by_fields = ['created_at']
 
     def get_client_ip(self, request):
         x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
@@ -37,7 +40,7 @@ class LoggerServiceViewSet(viewsets.ReadOnlyModelViewSet):
         parameters=[
             OpenApiParameter(
                 name='page', 
-                description='Page number for pagination',
+                description='Page number',
                 required=False, 
                 type=int
             ),
@@ -117,6 +120,8 @@ class LoggerServiceViewSet(viewsets.ReadOnlyModelViewSet):
             serializer = self.get_serializer(page, many=True)
 
             return self.get_paginated_response(serializer.data)
+        except APIException:
+            raise
         except Exception as e:
             LoggerService.objects.create(
                 user=request.user if request.user.is_authenticated else None,
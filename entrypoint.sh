@@ -10,6 +10,7 @@ mkdir -p /tmp/staticfiles/drf_spectacular_sidecar/swagger-ui-dist
 
 echo "Applying database migrations..."
 python manage.py migrate --noinput
+python manage.py createcachetable
 
 echo "Extracting Spectacular static files..."
 python extract_spectacular_static.py || echo "extract_spectacular_static.py not found or failed, continuing..."
@@ -0,0 +1,200 @@
+from datetime import timedelta
+
+import numpy as np
+from scipy import sparse
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from app.orders.models import Order, OrderItem
+from app.products.cache import invalidate_cooccurrence_cache
+from app.products.models import CooccurrenceBuild, ProductCooccurrence, ProductPurchaseCount
+
+class CooccurrenceService:
+    """
+    Builds "frequently bought together" neighbours from paid orders.
+
+    Orders become rows and products columns of a binary sparse matrix X, so X.T @ X holds
+    the number of orders containing each product pair (and each product's own order count
+    on the diagonal). Pair counts are normalized with lift or cosine and the top_n
+    neighbours of each product are stored in ProductCooccurrence.
+    """
+    METRICS = ('lift', 'cosine')
+    watermark_overlap = timedelta(minutes=5)
+
+    def __init__(self, top_n=None, min_count=None, metric=None):
+        self.top_n = top_n or settings.COOCCURRENCE_TOP_N
+        self.min_count = min_count or settings.COOCCURRENCE_MIN_COUNT
+        self.metric = metric or settings.COOCCURRENCE_METRIC
+        if self.metric not in self.METRICS:
+            raise ValueError(f"Unknown co-occurrence metric: {self.metric}")
+
+    def completed_items(self):
+        return OrderItem.objects.filter(
+            order__active=True,
+            order__payment__payment_status='completed'
+        )
+
+    def build_matrix(self, product_ids=None):
+        """
+        Returns (counts, product_ids, order_count): the product x product co-purchase
+        count matrix in CSR form and the product id of each of its rows/columns. With
+        product_ids, only the paid orders containing one of them are read, which is enough
+        for their rows to be exact.
+        """
+        items = self.completed_items()
+        if product_ids is not None:
+            items = items.filter(order_id__in=self.completed_items().filter(
+                product_id__in=list(product_ids)
+            ).values('order_id'))
+
+        pairs = np.array(
+            list(items.values_list('order_id', 'product_id').distinct()),
+            dtype=np.int64
+        ).reshape(-1, 2)
+        if not len(pairs):
+            return sparse.csr_matrix((0, 0), dtype=np.int64), np.array([], dtype=np.int64), 0
+
+        order_ids, order_rows = np.unique(pairs[:, 0], return_inverse=True)
+        product_ids, product_cols = np.unique(pairs[:, 1], return_inverse=True)
+
+        baskets = sparse.csr_matrix(
+            (np.ones(len(pairs), dtype=np.int64), (order_rows, product_cols)),
+            shape=(len(order_ids), len(product_ids))
+        )
+        counts = (baskets.T @ baskets).tocsr()
+        return counts, product_ids, len(order_ids)
+
+    def score_matrix(self, counts, order_count, item_counts=None):
+        """
+        item_counts overrides the diagonal as each product's order count, for matrices
+        built from a subset of the orders.
+        """
+        if item_counts is None:
+            item_counts = counts.diagonal()
+        item_counts = np.asarray(item_counts, dtype=np.float64)
+
+        pairs = counts.tolil()
+        pairs.setdiag(0)
+        pairs = pairs.tocsr()
+        if self.min_count > 1:
+            pairs.data[pairs.data < self.min_count] = 0
+        pairs.eliminate_zeros()
+
+        if self.metric == 'lift':
+            inverse = sparse.diags(1.0 / item_counts)
+            scores = (inverse @ pairs @ inverse) * order_count
+        else:
+            inverse_sqrt = sparse.diags(1.0 / np.sqrt(item_counts))
+            scores = inverse_sqrt @ pairs @ inverse_sqrt
+
+        scores = sparse.csr_matrix(scores)
+        pairs.sort_indices()
+        scores.sort_indices()
+        return pairs, scores
+
+    def top_neighbours(self, pairs, scores, row):
+        """
+        (column, score, pair_count) of the row's best neighbours, highest score first.
+        pairs and scores share one sparsity pattern, so their data arrays line up.
+        """
+        start, end = scores.indptr[row], scores.indptr[row + 1]
+        columns = scores.indices[start:end]
+        values = scores.data[start:end]
+        pair_counts = pairs.data[start:end]
+        if len(values) > self.top_n:
+            top = np.argpartition(-values, self.top_n - 1)[:self.top_n]
+            columns, values, pair_counts = columns[top], values[top], pair_counts[top]
+
+        order = np.lexsort((columns, -values))
+        return [(int(columns[i]), float(values[i]), int(pair_counts[i])) for i in order]
+
+    def neighbour_rows(self, pairs, scores, matrix_ids, targets, computed_at):
+        positions = {int(product_id): row for row, product_id in enumerate(matrix_ids)}
+        rows = []
+        for product_id in targets:
+            if product_id not in positions:
+                continue
+            for rank, (column, score, pair_count) in enumerate(self.top_neighbours(pairs, scores, positions[product_id]), 1):
+                rows.append(ProductCooccurrence(
+                    product_id=product_id,
+                    related_product_id=int(matrix_ids[column]),
+                    rank=rank,
+                    score=score,
+                    pair_count=pair_count,
+                    computed_at=computed_at
+                ))
+        return rows
+
+    def refresh(self):
+        """
+        Recomputes and stores the neighbours and order counts of every product. Returns the
+        number of neighbour rows written.
+        """
+        computed_at = timezone.now()
+        counts, matrix_ids, order_count = self.build_matrix()
+        pairs, scores = self.score_matrix(counts, order_count) if order_count else (counts, counts)
+
+        rows = self.neighbour_rows(pairs, scores, matrix_ids, [int(product_id) for product_id in matrix_ids], computed_at)
+        with transaction.atomic():
+            written = ProductCooccurrence.objects.replace(rows)
+            ProductPurchaseCount.objects.replace(
+                {int(product_id): int(count) for product_id, count in zip(matrix_ids, counts.diagonal())}
+            )
+            CooccurrenceBuild.objects.record(computed_at, full=True)
+        invalidate_cooccurrence_cache()
+        return written
+
+    def paid_order_count(self):
+        return Order.objects.filter(active=True, payment__payment_status='completed').count()
+
+    def refresh_incremental(self):
+        """
+        Recomputes only the products bought in orders paid since the watermark, reading
+        just the paid orders that contain them. Their rows and order counts come out exact;
+        the other columns are normalized with the stored order counts, which only change
+        when a product is bought and so becomes a target itself. Neighbour lists of other
+        products pick up the changed normalization on the next full refresh.
+
+        The window overlaps the previous one by watermark_overlap so payments committed
+        while a run was reading are not missed; recomputing a product twice is harmless.
+        """
+        build = CooccurrenceBuild.objects.current()
+        if build is None:
+            return self.refresh()
+
+        computed_at = timezone.now()
+        targets = set(
+            self.completed_items().filter(
+                order__payment__updated_at__gte=build.computed_through - self.watermark_overlap
+            ).values_list('product_id', flat=True).distinct()
+        )
+        if not targets:
+            CooccurrenceBuild.objects.record(computed_at)
+            return 0
+
+        counts, matrix_ids, order_count = self.build_matrix(targets)
+        diagonal = counts.diagonal()
+        stored = ProductPurchaseCount.objects.counts(matrix_ids)
+        item_counts = [
+            diagonal[column] if int(product_id) in targets else max(stored.get(int(product_id), 0), diagonal[column])
+            for column, product_id in enumerate(matrix_ids)
+        ]
+
+        if order_count:
+            total_orders = self.paid_order_count() if self.metric == 'lift' else order_count
+            pairs, scores = self.score_matrix(counts, total_orders, item_counts)
+        else:
+            pairs, scores = counts, counts
+
+        rows = self.neighbour_rows(pairs, scores, matrix_ids, targets, computed_at)
+        target_counts = {
+            int(product_id): int(diagonal[column])
+            for column, product_id in enumerate(matrix_ids)
+            if int(product_id) in targets
+        }
+        with transaction.atomic():
+            written = ProductCooccurrence.objects.replace(rows, product_ids=targets)
+            ProductPurchaseCount.objects.replace(target_counts, product_ids=targets)
+            CooccurrenceBuild.objects.record(computed_at)
+        invalidate_cooccurrence_cache()
+        return written
@@ -18,8 +18,9 @@ class DiscountService:
             payment__created_at__gte=one_year_ago
         )
         
-        order_count = completed_orders.count()
-        total_spent = completed_orders.aggregate(total=Sum('total_amount'))['total'] or 0
+        totals = completed_orders.aggregate(order_count=Count('id'), total_spent=Sum('total_amount'))
+        order_count = totals['order_count']
+        total_spent = totals['total_spent'] or 0
         
         if order_count >= 10 or total_spent >= 1000:
             return 15  # Platinum - 15% discount
@@ -3,6 +3,8 @@ from datetime import datetime
 from openai import AzureOpenAI
 from dotenv import load_dotenv
 from base import settings
+from core.models import EmbeddingCache
+from core.models.embedding_cache_model import normalize_embedding_text
 import re
 
 load_dotenv()
@@ -35,6 +37,9 @@ class OpenAIService():
         self.safe_token_limit = 7500
         self.overlap_tokens = 500
         self.encoding = tiktoken.encoding_for_model("gpt-4o")  
+        self.embedding_model = settings.OPENAI_EMBEDDING_MODEL
+        self.max_batch_inputs = settings.OPENAI_EMBEDDING_BATCH_SIZE
+        self.max_batch_tokens = settings.OPENAI_EMBEDDING_BATCH_TOKENS
 
     def chunk_text_by_tokens(self, text, max_tokens=None, overlap_tokens=None):
         max_tokens = max_tokens or self.safe_token_limit
@@ -88,33 +93,94 @@ class OpenAIService():
             raise Exception(f"[OpenAI] An error occurred in Azure API: {e}")
 
     @handle_openai_errors
+    def request_embeddings(self, inputs):
+        response = self.client.embeddings.create(model=self.embedding_model, input=inputs)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    def get_cached_embeddings(self, texts):
+        try:
+            return EmbeddingCache.objects.get_vectors(self.embedding_model, texts)
+        except Exception as e:
+            logging.warning(f"[OpenAI] Could not read embedding cache: {e}")
+            return {}
+
+    def cache_embeddings(self, embeddings):
+        try:
+            EmbeddingCache.objects.store_vectors(self.embedding_model, embeddings)
+        except Exception as e:
+            logging.warning(f"[OpenAI] Could not store embeddings in cache: {e}")
+
+    def split_for_embedding(self, text):
+        """
+        Returns (piece, token_count) pairs: the whole text when it fits the safe limit,
+        otherwise its overlapping token chunks.
+        """
+        token_count = len(self.encoding.encode(text))
+        if token_count <= self.safe_token_limit:
+            return [(text, token_count)]
+        return [(chunk, len(self.encoding.encode(chunk))) for chunk in self.chunk_text_by_tokens(text)]
+
+    def pack_embedding_requests(self, pieces):
+        """
+        Groups (piece, token_count) pairs into as few requests as the per-request input
+        and token limits allow, keeping their order.
+        """
+        batches, batch, batch_tokens = [], [], 0
+        for piece, token_count in pieces:
+            if batch and (len(batch) >= self.max_batch_inputs or batch_tokens + token_count > self.max_batch_tokens):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(piece)
+            batch_tokens += token_count
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def get_embeddings_batch(self, texts):
+        """
+        Get the embeddings for many texts in as few requests as possible, in input order.
+        Texts longer than the safe limit are chunked and their chunk embeddings are averaged
+        weighted by token count. Cached embeddings are reused and new ones are cached.
+        Empty texts get None.
+        """
+        normalized = [normalize_embedding_text(text or '') for text in texts]
+        unique_texts = list(dict.fromkeys(text for text in normalized if text))
+
+        embeddings = self.get_cached_embeddings(unique_texts)
+        missing = [text for text in unique_texts if text not in embeddings]
+
+        pieces, owners = [], []
+        for text in missing:
+            for piece in self.split_for_embedding(text):
+                pieces.append(piece)
+                owners.append(text)
+
+        vectors = []
+        for batch in self.pack_embedding_requests(pieces):
+            vectors.extend(self.request_embeddings(batch))
+
+        sums, weights = {}, {}
+        for (piece, token_count), owner, vector in zip(pieces, owners, vectors):
+            weight = max(token_count, 1)
+            if owner in sums:
+                sums[owner] = [total + value * weight for total, value in zip(sums[owner], vector)]
+            else:
+                sums[owner] = [value * weight for value in vector]
+            weights[owner] = weights.get(owner, 0) + weight
+
+        created = {text: [value / weights[text] for value in total] for text, total in sums.items()}
+        if created:
+            self.cache_embeddings(created)
+            embeddings.update(created)
+
+        return [embeddings.get(text) if text else None for text in normalized]
+
     def get_embeddings(self, paragraphs):
         """
-        Get the embeddings for a list of paragraphs. 
+        Get the embeddings for a list of paragraphs, joined into a single text.
         If the total number of tokens exceeds the safe limit, the text is split into chunks and the embeddings are averaged.
         """
         if isinstance(paragraphs, list):
             paragraphs = " ".join(paragraphs)
 
-        tokens = self.encoding.encode(paragraphs)
-        if len(tokens) <= self.safe_token_limit:
-            # Simple case: Get the embedding for the whole text
-            embedding_response = self.client.embeddings.create(model="text-embedding-ada-002", input=paragraphs)
-            embedding_vector = embedding_response.data[0].embedding
-            return embedding_vector
-        else:
-            # Extented case: Split the text into chunks and average the embeddings
-            chunks = self.chunk_text_by_tokens(paragraphs)
-            combined_embedding = None
-            count = 0
-            for chunk in chunks:
-                embedding_response = self.client.embeddings.create(model="text-embedding-ada-002", input=chunk)
-                embedding_vector = embedding_response.data[0].embedding
-                if combined_embedding is None:
-                    combined_embedding = embedding_vector
-                else:
-                    combined_embedding = [x + y for x, y in zip(combined_embedding, embedding_vector)]
-                count += 1
-            if combined_embedding and count > 1:
-                combined_embedding = [x / count for x in combined_embedding]
-            return combined_embedding
\ No newline at end of file
+        return self.get_embeddings_batch([paragraphs])[0]
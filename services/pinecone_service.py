@@ -1,36 +1,57 @@
-import pinecone
+import hashlib
+import json
 from base import settings
+from core.models.embedding_cache_model import normalize_embedding_text
 from .openai_service import OpenAIService
+from .vector_store_service import get_vector_store
 
 class PineconeService:
     def __init__(self, index_name=settings.PINECONE_INDEX_NAME):
-        self.api_key = settings.PINECONE_API_KEY
         self.index_name = index_name
         self.namespace = ""
         self.openai_service = OpenAIService()
         
-        self.pc = pinecone.Pinecone(api_key=self.api_key)
-        self.index = self.pc.Index(self.index_name)
+        self.index = get_vector_store(self.index_name)
     
+    upsert_batch_size = 100
+    fetch_batch_size = 100
+
+    def get_product_text(self, product):
+        return f"{product.name} {product.description or ''} {product.technical_specifications or ''}"
+
+    def get_product_metadata(self, product):
+        """
+        Only what queries filter on. Results are hydrated from the database by id, so
+        names, descriptions and prices are not duplicated in the index.
+        """
+        return {
+            "active": product.active,
+            "brand_id": product.brand_id,
+            "category_id": product.category_id
+        }
+
+    def get_product_fingerprint(self, product):
+        """
+        Hash of everything that ends up in the product's vector record: the embedding
+        model, the embedded text and the metadata. Equal fingerprints mean the stored
+        vector is still current.
+        """
+        payload = json.dumps(
+            [self.openai_service.embedding_model, self.get_product_text(product), self.get_product_metadata(product)],
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
     def upsert_product(self, product):
         try:
-            text_to_embed = f"{product.name} {product.description or ''} {product.technical_specifications or ''}"
+            text_to_embed = self.get_product_text(product)
             
             embedding = self.openai_service.get_embeddings(text_to_embed)
             
             if embedding:
                 vector_id = str(product.uuid)
                 
-                metadata = {
-                    "name": product.name,
-                    "description": product.description or "",
-                    "brand_name": product.brand.name,
-                    "category_name": product.category.name if product.category else None,
-                    "technical_specifications": product.technical_specifications or "",
-                    "price_usd": str(product.price_usd) if product.price_usd else None,
-                    "price_bs": str(product.price_bs) if product.price_bs else None,
-                    "active": product.active
-                }
+                metadata = self.get_product_metadata(product)
                 
                 self.index.upsert(
                     vectors=[{
@@ -54,71 +75,128 @@ class PineconeService:
         except Exception as e:
             raise Exception(f"An error occurred during Pinecone delete: {e}")
     
-    def search_similar_products(self, query_text, top_k=5, metadata_filter=None):
+    def search_similar_products(self, query_text, top_k=5, metadata_filter=None, include_metadata=False):
         try:
             query_embedding = self.openai_service.get_embeddings(query_text)
-            
-            if query_embedding:
-                query_params = {
-                    "vector": query_embedding,
-                    "top_k": top_k,
-                    "include_values": True,
-                    "include_metadata": True,
-                    "namespace": self.namespace
-                }
-                
-                if metadata_filter:
-                    query_params["filter"] = metadata_filter
-                
-                results = self.index.query(**query_params)
-                
-                return results
+        except Exception as e:
+            raise Exception(f"An error occurred during Pinecone query: {e}")
+
+        if query_embedding:
+            return self.query_by_vector(
+                query_embedding, top_k, metadata_filter=metadata_filter, include_metadata=include_metadata
+            )
+        return None
+
+    def fetch_product_vector(self, product_uuid):
+        return self.fetch_product_vectors([product_uuid]).get(str(product_uuid))
+
+    def fetch_product_vectors(self, product_uuids):
+        """
+        Returns {id: values}, fetched fetch_batch_size ids at a time: Pinecone caps a fetch
+        at 1000 ids and sends them in the query string.
+        """
+        try:
+            ids = list(dict.fromkeys(str(product_uuid) for product_uuid in product_uuids))
+            vectors = {}
+            for start in range(0, len(ids), self.fetch_batch_size):
+                vectors.update(self.index.fetch(ids=ids[start:start + self.fetch_batch_size], namespace=self.namespace))
+            return vectors
+        except Exception as e:
+            raise Exception(f"An error occurred during Pinecone fetch: {e}")
+
+    def get_stored_product_vectors(self, products):
+        """
+        Returns {product.pk: vector} from already computed embeddings: the stored vectors,
+        then the embedding cache for products that are not in the index yet. Never calls
+        the embedding API, so products without either are left out.
+        """
+        products = list(products)
+        stored = self.fetch_product_vectors([product.uuid for product in products]) if products else {}
+
+        vectors, missing = {}, {}
+        for product in products:
+            vector = stored.get(str(product.uuid))
+            if vector:
+                vectors[product.pk] = vector
             else:
-                return None
+                missing[product.pk] = normalize_embedding_text(self.get_product_text(product))
+
+        if missing:
+            cached = self.openai_service.get_cached_embeddings(list(set(missing.values())))
+            for product_id, text in missing.items():
+                if text in cached:
+                    vectors[product_id] = cached[text]
+        return vectors
+
+    def query_by_vector(self, vector, top_k=5, metadata_filter=None, include_metadata=False):
+        """
+        Returns matches with ids and scores only; vector values are never transferred and
+        metadata only when asked for.
+        """
+        try:
+            query_params = {
+                "vector": vector,
+                "top_k": top_k,
+                "include_values": False,
+                "include_metadata": include_metadata,
+                "namespace": self.namespace
+            }
+            
+            if metadata_filter:
+                query_params["filter"] = metadata_filter
+            
+            return self.index.query(**query_params)
         except Exception as e:
             raise Exception(f"An error occurred during Pinecone query: {e}")
         
     def bulk_upsert(self, products):
+        """
+        Embeds all products with batched embedding requests and upserts them in groups of
+        upsert_batch_size. Returns the products that were upserted.
+        """
         try:
+            products = list(products)
+            embeddings = self.openai_service.get_embeddings_batch(
+                [self.get_product_text(product) for product in products]
+            )
+
             vectors = []
-            for product in products:
-                text_to_embed = f"{product.name} {product.description or ''} {product.technical_specifications or ''}"
-                embedding = self.openai_service.get_embeddings(text_to_embed)
-                
+            upserted = []
+            for product, embedding in zip(products, embeddings):
                 if embedding:
                     vector_id = str(product.uuid)
-                    metadata = {
-                        "name": product.name,
-                        "brand_name": product.brand.name,
-                        "category_name": product.category.name if product.category else None,
-                        "description": product.description or "",
-                        "technical_specifications": product.technical_specifications or "",
-                        "price_usd": str(product.price_usd) if product.price_usd else None,
-                        "price_bs": str(product.price_bs) if product.price_bs else None,
-                    }
+                    metadata = self.get_product_metadata(product)
                     vectors.append({
                         "id": vector_id,
                         "values": embedding,
                         "metadata": metadata
                     })
+                    upserted.append(product)
             
-            if vectors:
-                self.index.upsert(vectors=vectors, namespace=self.namespace)
-                return True
-            return False
+            for start in range(0, len(vectors), self.upsert_batch_size):
+                self.index.upsert(vectors=vectors[start:start + self.upsert_batch_size], namespace=self.namespace)
+            return upserted
         except Exception as e:
             raise Exception(f"An error occurred during bulk upsert: {e}")
-    
-    def fetch_all_ids(self, namespace=""):
+
+    def delete_products(self, product_uuids, batch_size=1000):
         try:
-            zero_vector = [0] * 1536
-            response = self.index.query(
-                vector=zero_vector, 
-                top_k=10000, 
-                include_metadata=True, 
-                include_values=False, 
-                namespace=namespace or self.namespace
-            )
-            return set(match['id'] for match in response['matches'])
+            product_uuids = [str(product_uuid) for product_uuid in product_uuids]
+            for start in range(0, len(product_uuids), batch_size):
+                self.index.delete(ids=product_uuids[start:start + batch_size], namespace=self.namespace)
+            return len(product_uuids)
         except Exception as e:
-            raise Exception(f"An error occurred during fetching IDs from Pinecone: {e}")
\ No newline at end of file
+            raise Exception(f"An error occurred during Pinecone delete: {e}")
+
+    def iter_ids(self, namespace="", page_size=100):
+        """
+        Yields pages of stored vector ids through the index's paginated listing, so no
+        values or metadata are transferred and large indexes are not truncated.
+        """
+        try:
+            yield from self.index.list_ids(namespace=namespace or self.namespace, limit=page_size)
+        except Exception as e:
+            raise Exception(f"An error occurred during listing IDs from Pinecone: {e}")
+    
+    def fetch_all_ids(self, namespace=""):
+        return set(vector_id for page in self.iter_ids(namespace) for vector_id in page)
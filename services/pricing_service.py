@@ -0,0 +1,90 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.conf import settings
+
+CENT = Decimal('0.01')
+
+def to_money(value):
+    return Decimal(value).quantize(CENT, rounding=ROUND_HALF_UP)
+
+class PriceQuote:
+    """
+    The price breakdown of one order. All amounts are Decimals rounded to cents and the
+    total is subtotal + tax + shipping - discount.
+    """
+    fields = (
+        'subtotal', 'tax_rate', 'tax_amount', 'shipping_cost',
+        'discount_percentage', 'discount_amount', 'total', 'currency'
+    )
+
+    def __init__(self, subtotal, tax_rate, tax_amount, shipping_cost, discount_percentage, discount_amount, total, currency):
+        self.subtotal = subtotal
+        self.tax_rate = tax_rate
+        self.tax_amount = tax_amount
+        self.shipping_cost = shipping_cost
+        self.discount_percentage = discount_percentage
+        self.discount_amount = discount_amount
+        self.total = total
+        self.currency = currency
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.fields}
+
+    def as_response(self):
+        data = self.to_dict()
+        for field in ('subtotal', 'tax_rate', 'tax_amount', 'shipping_cost', 'discount_amount', 'total'):
+            data[field] = float(data[field])
+        return data
+
+class PricingService:
+    """
+    Prices orders from rows that are already loaded and never writes them. The loyalty
+    discount is the percentage stored on the order when it was created, so a quote costs
+    no aggregate queries: pricing an order is the one query that reads its items. Quotes
+    are not cached, so a checkout always charges the order's current items.
+    """
+    def __init__(self, tax_rate=None, shipping_cost=None):
+        self.tax_rate = Decimal(str(settings.TAX_RATE if tax_rate is None else tax_rate))
+        self.shipping_cost = to_money(str(settings.SHIPPING_COST if shipping_cost is None else shipping_cost))
+
+    def price(self, items, currency, discount_percentage):
+        """
+        Prices (unit_price, quantity) pairs. No shipping is charged for an empty order.
+        """
+        subtotal = to_money(sum((Decimal(unit_price) * quantity for unit_price, quantity in items), Decimal(0)))
+        tax_amount = to_money(subtotal * self.tax_rate)
+        shipping_cost = self.shipping_cost if subtotal else to_money(0)
+        discount_amount = to_money(subtotal * discount_percentage / 100)
+
+        return PriceQuote(
+            subtotal=subtotal,
+            tax_rate=self.tax_rate,
+            tax_amount=tax_amount,
+            shipping_cost=shipping_cost,
+            discount_percentage=discount_percentage,
+            discount_amount=discount_amount,
+            total=subtotal + tax_amount + shipping_cost - discount_amount,
+            currency=currency
+        )
+
+    def price_order(self, order, items=None):
+        """
+        Prices the order from `items`, or from order.items (prefetched rows when available).
+        """
+        if items is None:
+            items = order.items.all()
+        return self.price(
+            [(item.unit_price, item.quantity) for item in items],
+            order.currency,
+            order.discount_percentage
+        )
+
+    def apply(self, order, items=None):
+        """
+        Copies the quote's total and discount onto the unsaved order and returns the quote.
+        Callers that change an order's items use this before saving it.
+        """
+        quote = self.price_order(order, items)
+        order.total_amount = quote.total
+        order.discount_applied = quote.discount_amount
+        return quote
@@ -1,46 +1,205 @@
+import hashlib
+import json
+import numpy as np
+from array import array
+from django.conf import settings
+from django.utils import timezone
+from django.utils.functional import cached_property
+from rest_framework.renderers import JSONRenderer
+from app.authentication.models import UserRecommendationCache
+from core.cache import get_version
+from core.local_cache import TTLCache
+from core.models.embedding_cache_model import normalize_embedding_text
 from .pinecone_service import PineconeService
+from app.products.cache import CATALOG_CACHE_NAMESPACE
 from app.products.serializers import ProductSerializer
 from app.products.models import Product
 
+SIMILAR_EMBEDDINGS_NAMESPACE = 'similar-embeddings'
+SIMILAR_RESULTS_NAMESPACE = 'similar-results'
+
+query_embedding_cache = TTLCache(
+    SIMILAR_EMBEDDINGS_NAMESPACE,
+    settings.SIMILAR_EMBEDDING_CACHE_SIZE,
+    settings.SIMILAR_EMBEDDING_CACHE_TTL
+)
+similar_results_cache = TTLCache(
+    SIMILAR_RESULTS_NAMESPACE,
+    settings.SIMILAR_RESULTS_CACHE_SIZE,
+    settings.SIMILAR_RESULTS_CACHE_TTL
+)
+
 class RecommendationService:
-    def __init__(self):
-        self.pinecone_service = PineconeService()
+    max_query_top_k = 200
+
+    @cached_property
+    def pinecone_service(self):
+        return PineconeService()
+
+    def get_query_embedding(self, query_text):
+        """
+        Embedding of the normalized query text, served from the in-process cache when
+        the same query was embedded recently.
+        """
+        text = normalize_embedding_text(query_text)
+        if not text:
+            return None
+        return query_embedding_cache.get_or_compute(
+            (self.pinecone_service.openai_service.embedding_model, text),
+            lambda: self.pinecone_service.openai_service.get_embeddings(text)
+        )
+
+    def query_similar(self, embedding, top_k=5, metadata_filter=None):
+        """
+        Ranked {'vector_id', 'score'} matches for an embedding. Results are cached briefly per embedding, top_k,
+        filter and catalog version, so catalog changes are picked up immediately.
+        """
+        key = (
+            get_version(CATALOG_CACHE_NAMESPACE),
+            hashlib.sha256(array('f', embedding).tobytes()).hexdigest(),
+            top_k,
+            json.dumps(metadata_filter, sort_keys=True)
+        )
+
+        def run_query():
+            results = self.pinecone_service.query_by_vector(embedding, top_k, metadata_filter=metadata_filter)
+            if not results:
+                return None
+            return tuple((match.id, match.score) for match in results.matches)
+
+        matches = similar_results_cache.get_or_compute(key, run_query)
+        return [{'vector_id': vector_id, 'score': score} for vector_id, score in matches or ()]
+
+    def get_product_embedding(self, product):
+        """
+        The product's already computed embedding: its stored vector, or the cached
+        embedding of its text when the vector is not in the store yet. Never calls the
+        embedding API.
+        """
+        return self.pinecone_service.get_stored_product_vectors([product]).get(product.pk)
+
+    def get_similar_to_product(self, product, top_k=5):
+        embedding = self.get_product_embedding(product)
+        if not embedding:
+            return []
+
+        vector_id = str(product.uuid)
+        matches = self.query_similar(embedding, top_k + 1, metadata_filter={"active": True})
+        return [match for match in matches if match['vector_id'] != vector_id][:top_k]
+
+    def hydrate_products(self, matches):
+        """
+        Loads the matched products in one query and returns (product, score) pairs in
+        match order. Matches whose product is gone or inactive are dropped.
+        """
+        scores = {match['vector_id']: match['score'] for match in matches}
+        if not scores:
+            return []
+
+        products = {
+            str(product.uuid): product
+            for product in Product.objects.filter(uuid__in=list(scores), active=True).select_related(
+                'brand', 'category', 'warranty__brand', 'inventory', 'rating_summary'
+            )
+        }
+        return [(products[vector_id], score) for vector_id, score in scores.items() if vector_id in products]
     
     def get_similar_products(self, product_name, description="", top_k=5):
         query_text = f"{product_name} {description}"
-        metadata_filter = {"active": True}
-        results = self.pinecone_service.search_similar_products(query_text, top_k, metadata_filter=metadata_filter)
-        
-        if results:
-            similar_products = []
-            for match in results.matches:
-                product_data = match.metadata
-                product_data['score'] = match.score
-                product_data['vector_id'] = match.id
-                similar_products.append(product_data)
-            
-            return similar_products
-        
-        return []
+        embedding = self.get_query_embedding(query_text)
+        if not embedding:
+            return []
+
+        return self.query_similar(embedding, top_k, metadata_filter={"active": True})
     
+    def exclude_products(self, matches, product_uuids, top_k):
+        return [match for match in matches if match['vector_id'] not in product_uuids][:top_k]
+
     def get_recommendations_by_user_history(self, product_ids, top_k=5):
-        from app.products.models import Product
-        
-        products = Product.objects.filter(id__in=product_ids)
-        
-        combined_text = " ".join([f"{p.name} {p.description or ''}" for p in products])
-        
-        return self.get_similar_products(combined_text, top_k=top_k)
+        """
+        Neighbours of the mean of the given products' stored vectors, excluding those
+        products. No embedding API calls.
+        """
+        products = list(Product.objects.filter(id__in=product_ids))
+        vectors = list(self.pinecone_service.get_stored_product_vectors(products).values())
+        if not vectors:
+            return []
+
+        embedding = np.mean(np.asarray(vectors, dtype=np.float32), axis=0).tolist()
+        purchased = {str(product.uuid) for product in products}
+        matches = self.query_similar(
+            embedding, min(top_k + len(purchased), self.max_query_top_k), metadata_filter={"active": True}
+        )
+        return self.exclude_products(matches, purchased, top_k)
         
     def get_product_recommendations(self, user_id, max_results=5):
+        """
+        Neighbours of the user's taste vector (recency-weighted mean of the vectors of
+        everything they bought), excluding products they already bought.
+        """
         from app.orders.models import OrderItem
-        from app.products.models import Product
-        
-        recent_orders = OrderItem.objects.filter(
-            order__user_id=user_id
-        ).values_list('product_id', flat=True).distinct()[:10]
-        
-        if not recent_orders:
+        from services.taste_vector_service import TasteVectorService
+
+        embedding = TasteVectorService(self.pinecone_service).get_taste_vector(user_id)
+        if not embedding:
             return []
-            
-        return self.get_recommendations_by_user_history(recent_orders, top_k=max_results)
\ No newline at end of file
+
+        purchased = set(
+            str(product_uuid) for product_uuid in OrderItem.objects.filter(
+                order__user_id=user_id
+            ).values_list('product__uuid', flat=True).distinct()
+        )
+        top_k = min(max_results + len(purchased), self.max_query_top_k)
+        matches = self.query_similar(embedding, top_k, metadata_filter={"active": True})
+        return self.exclude_products(matches, purchased, max_results)
+
+    def serialize_ranked(self, ranked):
+        data = ProductSerializer([product for product, _ in ranked], many=True).data
+        for item, (_, score) in zip(data, ranked):
+            item['similarity_score'] = score
+        return json.loads(JSONRenderer().render(data))
+
+    def refresh_user_recommendations(self, user_id):
+        """
+        Recomputes the user's recommendations and stores them in UserRecommendationCache.
+        """
+        catalog_version = get_version(CATALOG_CACHE_NAMESPACE)
+        matches = self.get_product_recommendations(user_id, max_results=settings.RECOMMENDATION_CACHE_SIZE)
+        ranked = self.hydrate_products(matches)
+        items = [[product.pk, score] for product, score in ranked]
+        return UserRecommendationCache.objects.store(user_id, items, self.serialize_ranked(ranked), catalog_version)
+
+    def rehydrate(self, entry, catalog_version):
+        """
+        Re-serializes cached recommendations after a catalog change without recomputing
+        them, dropping products that were deactivated since.
+        """
+        product_ids = [product_id for product_id, _ in entry.items]
+        products = Product.objects.filter(id__in=product_ids, active=True).select_related(
+            'brand', 'category', 'warranty__brand', 'inventory', 'rating_summary'
+        ).in_bulk()
+        ranked = [(products[product_id], score) for product_id, score in entry.items if product_id in products]
+
+        entry.items = [[product.pk, score] for product, score in ranked]
+        entry.payload = self.serialize_ranked(ranked)
+        entry.catalog_version = catalog_version
+        entry.save(update_fields=['items', 'payload', 'catalog_version', 'updated_at'])
+        return entry
+
+    def get_cached_recommendations(self, user_id, count=5):
+        """
+        Serialized recommendations for the user. A warm read is one row lookup; after a
+        catalog change the stored ranking is re-serialized, and only a missing or expired
+        entry is recomputed. Reads are recorded so the refresher only keeps active users
+        warm.
+        """
+        catalog_version = get_version(CATALOG_CACHE_NAMESPACE)
+        entry = UserRecommendationCache.objects.filter(user_id=user_id).first()
+
+        if entry is None or entry.expires_at <= timezone.now():
+            entry = self.refresh_user_recommendations(user_id)
+        elif entry.catalog_version != catalog_version:
+            entry = self.rehydrate(entry, catalog_version)
+
+        UserRecommendationCache.objects.touch(entry)
+        return entry.payload[:count]
@@ -0,0 +1,104 @@
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from django.conf import settings
+from django.db import connections
+from app.products.cache import invalidate_catalog_cache
+from app.products.models import Product, ProductVectorSync
+from .pinecone_service import PineconeService
+
+class ReindexService:
+    """
+    Re-embeds and upserts every active product for a ReindexRun.
+
+    Products are streamed in id order with .iterator() and cut into batches of batch_size,
+    which are embedded and upserted on a pool of `workers` threads. At most twice that many
+    batches are in flight, so memory stays bounded however large the catalog is. Batches
+    finish out of order but are checkpointed in submission order: last_product_id only
+    moves past a batch once it and every batch before it are done.
+
+    A batch that fails is counted in run.failed and left out of ProductVectorSync, so
+    reconcile_vector_index picks its products up later.
+
+    The pool overlaps the embedding requests, which are most of a batch's time. Upserts
+    to the local backend are serialized by its write lock, but each one only appends the
+    batch to the index log, and the run compacts the log into one generation when it
+    finishes, so a full reindex writes O(catalog) rather than a matrix per batch.
+    """
+    def __init__(self, batch_size=None, workers=None, chunk_size=None, pinecone_service=None):
+        self.batch_size = batch_size or settings.REINDEX_BATCH_SIZE
+        self.workers = workers or settings.REINDEX_WORKERS
+        self.chunk_size = chunk_size or settings.REINDEX_CHUNK_SIZE
+        self.pinecone_service = pinecone_service or PineconeService()
+
+    def products(self, after_id=0):
+        return Product.objects.filter(active=True, id__gt=after_id).select_related('brand', 'category').order_by('id')
+
+    def batches(self, after_id):
+        products = self.products(after_id).iterator(chunk_size=self.chunk_size)
+        while True:
+            batch = list(islice(products, self.batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def index_batch(self, batch):
+        """
+        Runs on a pool thread. Returns {product_id: fingerprint} of the upserted products.
+        """
+        try:
+            upserted = self.pinecone_service.bulk_upsert(batch)
+            return {product.pk: self.pinecone_service.get_product_fingerprint(product) for product in upserted}
+        finally:
+            connections.close_all()
+
+    def run(self, run, on_checkpoint=None):
+        """
+        Processes the run from its checkpoint to the end of the catalog. on_checkpoint(run)
+        is called after every saved checkpoint.
+        """
+        run.mark_started()
+        if not run.total:
+            run.total = self.products().count()
+            run.save(update_fields=['total', 'updated_at'])
+
+        resumed_at = time.monotonic()
+        resumed_elapsed = run.elapsed_seconds
+        in_flight = deque()
+
+        def checkpoint(batch, future):
+            try:
+                fingerprints = future.result()
+                ProductVectorSync.objects.mark_synced(fingerprints)
+                run.upserted += len(fingerprints)
+                run.failed += len(batch) - len(fingerprints)
+            except Exception as e:
+                run.failed += len(batch)
+                run.last_error = str(e)
+
+            run.processed += len(batch)
+            run.last_product_id = batch[-1].pk
+            run.elapsed_seconds = resumed_elapsed + time.monotonic() - resumed_at
+            run.save(update_fields=[
+                'processed', 'upserted', 'failed', 'last_product_id', 'elapsed_seconds', 'last_error', 'updated_at'
+            ])
+            if on_checkpoint:
+                on_checkpoint(run)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='reindex') as pool:
+                for batch in self.batches(run.last_product_id):
+                    in_flight.append((batch, pool.submit(self.index_batch, batch)))
+                    while in_flight and (len(in_flight) >= self.workers * 2 or in_flight[0][1].done()):
+                        checkpoint(*in_flight.popleft())
+                while in_flight:
+                    checkpoint(*in_flight.popleft())
+        except Exception as e:
+            run.mark_finished(error=e)
+            raise
+
+        self.pinecone_service.index.compact()
+        run.mark_finished()
+        invalidate_catalog_cache()
+        return run
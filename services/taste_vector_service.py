@@ -0,0 +1,127 @@
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from app.authentication.models import UserTasteVector
+from app.orders.models import OrderItem
+from .pinecone_service import PineconeService
+
+class TasteVectorService:
+    """
+    Maintains UserTasteVector from the stored embeddings of purchased products. A purchase
+    paid t seconds before the reference time weighs 0.5 ** (t / half-life), so recent
+    purchases dominate and old ones fade out. No embedding API calls are made.
+    """
+    def __init__(self, pinecone_service=None):
+        self.pinecone_service = pinecone_service or PineconeService()
+        self.half_life = settings.TASTE_VECTOR_HALF_LIFE_DAYS * 86400
+
+    @property
+    def embedding_model(self):
+        return self.pinecone_service.openai_service.embedding_model
+
+    def decay(self, seconds):
+        return 0.5 ** (max(seconds, 0) / self.half_life)
+
+    def purchases(self, **filters):
+        """
+        Paid items with their product and order payment joined in: weighted_sum reads the
+        product's uuid and text columns (get_product_text touches no relations) and the
+        payment's updated_at, so it runs no per-item queries.
+        """
+        return OrderItem.objects.filter(
+            order__active=True,
+            order__payment__payment_status='completed',
+            **filters
+        ).select_related('product', 'order__payment')
+
+    def weighted_sum(self, items, at):
+        """
+        Returns (sum, weight, count) of the items' product vectors decayed to `at`.
+        Items whose product has no stored vector are skipped.
+        """
+        products = {item.product_id: item.product for item in items}
+        vectors = self.pinecone_service.get_stored_product_vectors(products.values())
+
+        total, weight, count = None, 0.0, 0
+        for item in items:
+            vector = vectors.get(item.product_id)
+            if vector is None:
+                continue
+            item_weight = self.decay((at - item.order.payment.updated_at).total_seconds())
+            contribution = np.asarray(vector, dtype=np.float32) * item_weight
+            total = contribution if total is None else total + contribution
+            weight += item_weight
+            count += 1
+        return total, weight, count
+
+    def rebuild(self, user_id):
+        """
+        Recomputes the user's taste vector from their whole purchase history.
+        """
+        now = timezone.now()
+        total, weight, count = self.weighted_sum(list(self.purchases(order__user_id=user_id)), now)
+        if total is None:
+            UserTasteVector.objects.filter(user_id=user_id).delete()
+            return None
+
+        taste = UserTasteVector(
+            user_id=user_id,
+            model=self.embedding_model,
+            weight=weight,
+            purchase_count=count,
+            decayed_at=now,
+            rebuilt_at=now
+        )
+        taste.set_weighted_sum(total.tolist())
+        taste.save()
+        return taste
+
+    def apply_order(self, order_id):
+        """
+        Folds one newly paid order into its user's taste vector: decays the stored sum
+        to the later of the two timestamps and adds the order's products.
+        """
+        items = list(self.purchases(order_id=order_id))
+        if not items:
+            return None
+
+        user_id = items[0].order.user_id
+        paid_at = items[0].order.payment.updated_at
+
+        with transaction.atomic():
+            taste = UserTasteVector.objects.select_for_update().filter(user_id=user_id).first()
+            if taste is None or taste.model != self.embedding_model:
+                return self.rebuild(user_id)
+            if paid_at <= taste.rebuilt_at:
+                return taste
+
+            total, weight, count = self.weighted_sum(items, paid_at)
+            if total is None:
+                return taste
+            if total.shape[0] != taste.dimensions:
+                return self.rebuild(user_id)
+
+            at = max(taste.decayed_at, paid_at)
+            current_decay = self.decay((at - taste.decayed_at).total_seconds())
+            added_decay = self.decay((at - paid_at).total_seconds())
+
+            current = np.asarray(taste.get_weighted_sum(), dtype=np.float32)
+            taste.set_weighted_sum((current * current_decay + total * added_decay).tolist())
+            taste.weight = taste.weight * current_decay + weight * added_decay
+            taste.purchase_count += count
+            taste.decayed_at = at
+            taste.save()
+            return taste
+
+    def get_taste_vector(self, user_id):
+        """
+        The user's query vector, built from their history the first time it is needed.
+        None for users without purchases that have stored vectors.
+        """
+        taste = UserTasteVector.objects.filter(user_id=user_id).first()
+        if taste is None or taste.model != self.embedding_model or not taste.weight:
+            taste = self.rebuild(user_id)
+        if taste is None:
+            return None
+        return (np.asarray(taste.get_weighted_sum(), dtype=np.float32) / taste.weight).tolist()
@@ -0,0 +1,521 @@
+import base64
+import fcntl
+import json
+import os
+import threading
+import uuid
+
+import numpy as np
+import pinecone
+from django.conf import settings
+
+class VectorMatch:
+    def __init__(self, id, score, metadata=None, values=None):
+        self.id = id
+        self.score = score
+        self.metadata = metadata
+        self.values = values
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+class QueryResult:
+    def __init__(self, matches):
+        self.matches = matches
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+class BaseVectorStore:
+    """
+    The subset of the Pinecone index API the services use: upsert, delete and query with
+    a metadata filter. Vectors are dicts with id, values and metadata, and query results
+    expose .matches with id, score, metadata and values.
+    """
+    def upsert(self, vectors, namespace=""):
+        raise NotImplementedError
+
+    def delete(self, ids, namespace=""):
+        raise NotImplementedError
+
+    def query(self, vector, top_k=10, filter=None, include_values=False, include_metadata=False, namespace=""):
+        raise NotImplementedError
+
+    def fetch(self, ids, namespace=""):
+        """
+        Returns {id: values} for the ids that are stored.
+        """
+        raise NotImplementedError
+
+    def list_ids(self, namespace="", limit=100):
+        """
+        Yields the stored ids in pages of at most `limit`, without values or metadata.
+        """
+        raise NotImplementedError
+
+    def compact(self):
+        """
+        Publishes writes the backend buffers. Backends that apply writes directly have
+        nothing to do.
+        """
+
+class PineconeVectorStore(BaseVectorStore):
+    def __init__(self, index_name):
+        self.pc = pinecone.Pinecone(api_key=settings.PINECONE_API_KEY)
+        self.index = self.pc.Index(index_name)
+
+    def upsert(self, vectors, namespace=""):
+        return self.index.upsert(vectors=vectors, namespace=namespace)
+
+    def delete(self, ids, namespace=""):
+        return self.index.delete(ids=ids, namespace=namespace)
+
+    def query(self, vector, top_k=10, filter=None, include_values=False, include_metadata=False, namespace=""):
+        params = {
+            "vector": vector,
+            "top_k": top_k,
+            "include_values": include_values,
+            "include_metadata": include_metadata,
+            "namespace": namespace
+        }
+        if filter:
+            params["filter"] = filter
+        return self.index.query(**params)
+
+    def fetch(self, ids, namespace=""):
+        response = self.index.fetch(ids=list(ids), namespace=namespace)
+        return {vector_id: list(vector.values) for vector_id, vector in response.vectors.items()}
+
+    def list_ids(self, namespace="", limit=100):
+        for ids in self.index.list(namespace=namespace, limit=limit):
+            yield list(ids)
+
+class LocalSnapshot:
+    """
+    One state of a local index: a read-only memory map of a generation's L2-normalized
+    float32 matrix plus the ids and metadata of its rows, overlaid with the changes logged
+    since the generation was published. A logged change replaces or deletes a row by id;
+    replaced rows are appended after the matrix and the rows they supersede are masked
+    out. Filter masks are built once per snapshot and reused by every query.
+    """
+    def __init__(self, generation, matrix, ids, metadata, offset=0, changes=None, base_positions=None):
+        self.generation = generation
+        self.matrix = matrix
+        self.base_ids = ids
+        self.base_metadata = metadata
+        self.base_positions = base_positions if base_positions is not None else {
+            vector_id: row for row, vector_id in enumerate(ids)
+        }
+        self.offset = offset
+        self.changes = changes or {}
+
+        upserted = [(vector_id, change) for vector_id, change in self.changes.items() if change is not None]
+        self.extra = np.vstack([values for _, (values, _) in upserted]) if upserted else None
+        self.ids = list(ids) + [vector_id for vector_id, _ in upserted]
+        self.metadata = list(metadata) + [meta for _, (_, meta) in upserted]
+
+        self.live = np.ones(len(self.ids), dtype=bool)
+        for vector_id in self.changes:
+            row = self.base_positions.get(vector_id)
+            if row is not None:
+                self.live[row] = False
+        self.positions = {vector_id: row for row, vector_id in enumerate(self.ids) if self.live[row]}
+
+        self._masks = {}
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self):
+        return len(self.changes)
+
+    @property
+    def dimension(self):
+        if self.base_ids:
+            return self.matrix.shape[1]
+        return self.extra.shape[1] if self.extra is not None else None
+
+    def values(self, row):
+        if row < len(self.base_ids):
+            return self.matrix[row]
+        return self.extra[row - len(self.base_ids)]
+
+    def scores(self, vector):
+        scores = self.matrix @ vector if self.base_ids else np.zeros(0, dtype=np.float32)
+        if self.extra is not None:
+            scores = np.concatenate([scores, self.extra @ vector])
+        return scores
+
+    def with_changes(self, offset, records):
+        """
+        A new snapshot of the same generation with the log records up to `offset` applied.
+        """
+        changes = dict(self.changes)
+        for record in records:
+            changes.pop(record['id'], None)
+            if record.get('deleted'):
+                changes[record['id']] = None
+            else:
+                values = np.frombuffer(base64.b64decode(record['values']), dtype=np.float32)
+                changes[record['id']] = (values, record.get('metadata') or {})
+        return LocalSnapshot(
+            self.generation, self.matrix, self.base_ids, self.base_metadata, offset, changes, self.base_positions
+        )
+
+    def compacted(self):
+        """
+        (ids, matrix, metadata) of the live rows, for publishing as a new generation.
+        """
+        base_rows = np.flatnonzero(self.live[:len(self.base_ids)])
+        parts = [np.asarray(self.matrix[base_rows])] if len(base_rows) else []
+        if self.extra is not None:
+            parts.append(self.extra)
+        rows = [row for row in range(len(self.ids)) if self.live[row]]
+        matrix = np.vstack(parts) if parts else np.zeros((0, 0), dtype=np.float32)
+        return [self.ids[row] for row in rows], matrix, [self.metadata[row] for row in rows]
+
+    def field_mask(self, field, op, value):
+        key = (field, op, json.dumps(value, sort_keys=True, default=str))
+        mask = self._masks.get(key)
+        if mask is not None:
+            return mask
+
+        if op == '$in':
+            accepted = list(value)
+            mask = np.fromiter((meta.get(field) in accepted for meta in self.metadata), dtype=bool, count=len(self.ids))
+        elif op == '$nin':
+            rejected = list(value)
+            mask = np.fromiter((meta.get(field) not in rejected for meta in self.metadata), dtype=bool, count=len(self.ids))
+        elif op == '$ne':
+            mask = np.fromiter((meta.get(field) != value for meta in self.metadata), dtype=bool, count=len(self.ids))
+        elif op == '$eq':
+            mask = np.fromiter((meta.get(field) == value for meta in self.metadata), dtype=bool, count=len(self.ids))
+        else:
+            raise ValueError(f"Unsupported filter operator: {op}")
+
+        with self._lock:
+            self._masks[key] = mask
+        return mask
+
+    def filter_mask(self, filter):
+        mask = self.live.copy()
+        for field, condition in filter.items():
+            if field == '$and':
+                for part in condition:
+                    mask &= self.filter_mask(part)
+                continue
+            if not isinstance(condition, dict):
+                condition = {'$eq': condition}
+            for op, value in condition.items():
+                mask &= self.field_mask(field, op, value)
+        return mask
+
+class LocalVectorStore(BaseVectorStore):
+    """
+    In-process index for catalogs small enough to keep every vector in memory.
+
+    The index is a published generation (a .npy matrix and a .json file with ids and
+    metadata, named by the CURRENT pointer) plus an append-only .log of the upserts and
+    deletes made since. A write appends its records to the log under an exclusive file
+    lock, so it costs O(rows written), not O(index). Once the log holds more than
+    compact_ratio of the generation's rows (and at least compact_min_rows), the writer
+    folds it into a new generation and swaps CURRENT, so the full rewrite is amortized
+    over that many rows. Readers map the matrix with mmap_mode='r', so gunicorn workers on
+    the same host share its pages, and they check CURRENT and the log size on every
+    query, reading only the log records appended since. Readers only apply complete log
+    lines, so they never see a half-written record.
+
+    A query is one matrix-vector product over the matrix and the logged rows. Rows
+    excluded by the metadata filter or superseded by the log are masked to -inf, and
+    argpartition selects the top k without sorting the rest.
+    """
+    keep_generations = 2
+    load_attempts = 3
+    compact_ratio = 0.25
+    compact_min_rows = 1000
+
+    def __init__(self, index_name, path=None):
+        self.path = os.path.join(path or settings.VECTOR_STORE_PATH, index_name)
+        self.current_path = os.path.join(self.path, 'CURRENT')
+        self.lock_path = os.path.join(self.path, 'write.lock')
+        self._snapshot = None
+        self._snapshot_state = None
+        self._lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+
+    def _files(self, generation):
+        return (
+            os.path.join(self.path, f'{generation}.npy'),
+            os.path.join(self.path, f'{generation}.json'),
+            os.path.join(self.path, f'{generation}.log')
+        )
+
+    def _load(self, generation):
+        if not generation:
+            return LocalSnapshot('', np.zeros((0, 0), dtype=np.float32), [], [])
+
+        matrix_path, meta_path, _ = self._files(generation)
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        matrix = np.load(matrix_path, mmap_mode='r')
+        return LocalSnapshot(generation, matrix, meta['ids'], meta['metadata'])
+
+    def _load_current(self):
+        """
+        Loads the generation CURRENT names. A writer in another process can publish twice
+        and remove that generation between reading CURRENT and opening its files, so a
+        missing generation means CURRENT has moved on and is read again.
+        """
+        for attempt in range(self.load_attempts):
+            try:
+                return self._load(self._read_current())
+            except FileNotFoundError:
+                if attempt == self.load_attempts - 1:
+                    raise
+
+    def _read_current(self):
+        try:
+            with open(self.current_path, 'r', encoding='utf-8') as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            return ''
+
+    def _read_log(self, snapshot):
+        """
+        Returns (offset, records) of the complete log lines after snapshot.offset.
+        """
+        if not snapshot.generation:
+            return snapshot.offset, []
+        try:
+            with open(self._files(snapshot.generation)[2], 'rb') as f:
+                f.seek(snapshot.offset)
+                data = f.read()
+        except FileNotFoundError:
+            return snapshot.offset, []
+
+        end = data.rfind(b'\n') + 1
+        records = [json.loads(line) for line in data[:end].splitlines() if line]
+        return snapshot.offset + end, records
+
+    def _state(self):
+        try:
+            stat = os.stat(self.current_path)
+            current = (stat.st_ino, stat.st_mtime_ns)
+        except FileNotFoundError:
+            current = None
+
+        log_size = None
+        if self._snapshot is not None and self._snapshot.generation:
+            try:
+                log_size = os.stat(self._files(self._snapshot.generation)[2]).st_size
+            except FileNotFoundError:
+                pass
+        return current, log_size
+
+    def snapshot(self):
+        state = self._state()
+        if self._snapshot is not None and state == self._snapshot_state:
+            return self._snapshot
+
+        with self._lock:
+            if self._snapshot is None or state != self._snapshot_state:
+                snapshot = self._snapshot
+                if snapshot is None or snapshot.generation != self._read_current():
+                    snapshot = self._load_current()
+                offset, records = self._read_log(snapshot)
+                if records:
+                    snapshot = snapshot.with_changes(offset, records)
+                self._snapshot = snapshot
+                self._snapshot_state = state
+        return self._snapshot
+
+    def _publish(self, ids, matrix, metadata):
+        generation = uuid.uuid4().hex
+        matrix_path, meta_path, _ = self._files(generation)
+
+        np.save(matrix_path, np.ascontiguousarray(matrix, dtype=np.float32))
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({'ids': ids, 'metadata': metadata}, f)
+
+        tmp_path = f'{self.current_path}.{generation}'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(generation)
+        os.replace(tmp_path, self.current_path)
+
+        self._remove_old_generations(generation)
+
+    def _append(self, generation, records):
+        with open(self._files(generation)[2], 'ab') as f:
+            f.write(b''.join(json.dumps(record).encode('utf-8') + b'\n' for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _remove_old_generations(self, current):
+        generations = sorted(
+            (entry for entry in os.scandir(self.path) if entry.name.endswith('.json')),
+            key=lambda entry: entry.stat().st_mtime_ns,
+            reverse=True
+        )
+        keep = {current}
+        for entry in generations:
+            if len(keep) >= self.keep_generations:
+                break
+            keep.add(entry.name[:-len('.json')])
+
+        for entry in generations:
+            generation = entry.name[:-len('.json')]
+            if generation in keep:
+                continue
+            for file_path in self._files(generation):
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    pass
+
+    def should_compact(self, snapshot, adding=0):
+        return snapshot.pending + adding > max(self.compact_min_rows, self.compact_ratio * len(snapshot.base_ids))
+
+    def _write(self, build):
+        """
+        Runs build(snapshot) on the latest state under an exclusive file lock, so concurrent
+        writers in other processes do not lose updates, and logs the records it returns.
+        The first write to an empty index and writes that push the log past the compaction
+        threshold publish a new generation instead.
+        """
+        with open(self.lock_path, 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                snapshot = self.snapshot()
+                records = build(snapshot)
+                if not records:
+                    return
+                if not snapshot.generation or self.should_compact(snapshot, len(records)):
+                    self._publish(*snapshot.with_changes(snapshot.offset, records).compacted())
+                else:
+                    self._append(snapshot.generation, records)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def compact(self):
+        """
+        Folds the log into a new generation now, for callers that just finished a large
+        batch of writes.
+        """
+        def build(snapshot):
+            if snapshot.pending:
+                self._publish(*snapshot.compacted())
+            return []
+
+        self._write(build)
+
+    def normalize(self, values):
+        vector = np.asarray(values, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def upsert(self, vectors, namespace=""):
+        vectors = list(vectors)
+
+        def build(snapshot):
+            dimension = snapshot.dimension
+            records = []
+            for vector in vectors:
+                values = self.normalize(vector["values"])
+                if dimension is not None and values.shape[0] != dimension:
+                    raise ValueError(
+                        f"Vector {vector['id']} has dimension {values.shape[0]}, index has {dimension}"
+                    )
+                dimension = values.shape[0]
+                records.append({
+                    "id": vector["id"],
+                    "values": base64.b64encode(values.tobytes()).decode('ascii'),
+                    "metadata": vector.get("metadata") or {}
+                })
+            return records
+
+        self._write(build)
+        return {"upserted_count": len(vectors)}
+
+    def delete(self, ids, namespace=""):
+        doomed = list(dict.fromkeys(ids))
+
+        def build(snapshot):
+            return [{"id": vector_id, "deleted": True} for vector_id in doomed if vector_id in snapshot.positions]
+
+        self._write(build)
+        return {}
+
+    def fetch(self, ids, namespace=""):
+        snapshot = self.snapshot()
+        return {
+            vector_id: snapshot.values(snapshot.positions[vector_id]).tolist()
+            for vector_id in ids
+            if vector_id in snapshot.positions
+        }
+
+    def list_ids(self, namespace="", limit=100):
+        ids = list(self.snapshot().positions)
+        for start in range(0, len(ids), limit):
+            yield ids[start:start + limit]
+
+    def query(self, vector, top_k=10, filter=None, include_values=False, include_metadata=False, namespace=""):
+        snapshot = self.snapshot()
+        if not snapshot.positions or top_k <= 0:
+            return QueryResult([])
+
+        query_vector = self.normalize(vector)
+        if query_vector.shape[0] != snapshot.dimension:
+            raise ValueError(
+                f"Query has dimension {query_vector.shape[0]}, index has {snapshot.dimension}"
+            )
+
+        scores = snapshot.scores(query_vector)
+        mask = snapshot.filter_mask(filter) if filter else snapshot.live
+        candidates = int(mask.sum())
+        scores = np.where(mask, scores, -np.inf)
+
+        k = min(top_k, candidates)
+        if k == 0:
+            return QueryResult([])
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return QueryResult([
+            VectorMatch(
+                id=snapshot.ids[row],
+                score=float(scores[row]),
+                metadata=dict(snapshot.metadata[row]) if include_metadata else None,
+                values=snapshot.values(row).tolist() if include_values else None
+            )
+            for row in top
+        ])
+
+VECTOR_STORE_BACKENDS = {
+    'pinecone': PineconeVectorStore,
+    'local': LocalVectorStore,
+}
+
+_local_stores = {}
+_local_stores_lock = threading.Lock()
+
+def get_vector_store(index_name=None):
+    """
+    Returns the backend named by settings.VECTOR_STORE_BACKEND. Local stores are kept per
+    process so their loaded snapshot is reused across requests.
+    """
+    index_name = index_name or settings.PINECONE_INDEX_NAME
+    backend = settings.VECTOR_STORE_BACKEND
+    if backend not in VECTOR_STORE_BACKENDS:
+        raise ValueError(f"Unknown vector store backend: {backend}")
+
+    if backend != 'local':
+        return VECTOR_STORE_BACKENDS[backend](index_name)
+
+    with _local_stores_lock:
+        store = _local_stores.get(index_name)
+        if store is None:
+            store = _local_stores[index_name] = LocalVectorStore(index_name)
+        return store